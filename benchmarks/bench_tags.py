@@ -0,0 +1,113 @@
+"""Per-point cost of generating GLD points.
+
+Compares building a wml2:point the old way (formatting every tag and passing
+`nsmap=` to every SubElement) with the builders in `gld.constructables`:
+the per-record `gen_point`, the columnar `gen_points` and the streaming
+`gen_points_xml`.
+
+Run from the repository root with
+`python -m benchmarks.bench_tags [number of points]`.
+"""
+
+import sys
+import timeit
+
+from lxml import etree
+
+from bro_exchange.broxml.gld.constructables import (
+    gen_point,
+    gen_points,
+    gen_points_xml,
+)
+from bro_exchange.broxml.gld.timeseries import coerce_timeseries
+from bro_exchange.broxml.mappings import codespace_map_gld1, ns_regreq_map_gld3
+
+NSMAP = ns_regreq_map_gld3
+
+
+def records(n):
+    return [
+        {
+            "time": f"2019-01-{(i % 28) + 1:02d}T{i % 24:02d}:14:38+01:00",
+            "value": round(-4.0 - i * 0.001, 3),
+            "metadata": {
+                "StatusQualityControl": "goedgekeurd",
+                "interpolationType": "Discontinuous",
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def formatted_point(rec, nsmap):
+    """wml2:point built with a formatted tag and nsmap on every element."""
+    point = etree.Element(f"{{{nsmap['wml2']}}}point", nsmap=nsmap)
+    tvp = etree.SubElement(point, f"{{{nsmap['wml2']}}}MeasurementTVP", nsmap=nsmap)
+    time = etree.SubElement(tvp, f"{{{nsmap['wml2']}}}time", nsmap=nsmap)
+    time.text = rec["time"]
+    value = etree.SubElement(
+        tvp, f"{{{nsmap['wml2']}}}value", nsmap=nsmap, attrib={"uom": "m"}
+    )
+    value.text = str(rec["value"])
+    metadata = etree.SubElement(tvp, f"{{{nsmap['wml2']}}}metadata", nsmap=nsmap)
+    tvpmetadata = etree.SubElement(
+        metadata, f"{{{nsmap['wml2']}}}TVPMeasurementMetadata", nsmap=nsmap
+    )
+    qualifier = etree.SubElement(
+        tvpmetadata, f"{{{nsmap['wml2']}}}qualifier", nsmap=nsmap
+    )
+    category = etree.SubElement(qualifier, f"{{{nsmap['swe']}}}Category", nsmap=nsmap)
+    etree.SubElement(
+        category,
+        f"{{{nsmap['swe']}}}codeSpace",
+        nsmap=nsmap,
+        attrib={
+            f"{{{nsmap['xlink']}}}href": codespace_map_gld1["StatusQualityControl"]
+        },
+    )
+    code = etree.SubElement(category, f"{{{nsmap['swe']}}}value", nsmap=nsmap)
+    code.text = rec["metadata"]["StatusQualityControl"]
+    etree.SubElement(
+        tvpmetadata,
+        f"{{{nsmap['wml2']}}}interpolationType",
+        nsmap=nsmap,
+        attrib={
+            f"{{{nsmap['xlink']}}}href": "http://www.opengis.net/def/waterml/2.0/interpolationType/"
+            + rec["metadata"]["interpolationType"]
+        },
+    )
+    return point
+
+
+def main(n=20000, repeat=5):
+    recs = records(n)
+    timeseries = coerce_timeseries(recs)
+
+    def formatted():
+        for rec in recs:
+            formatted_point(rec, NSMAP)
+
+    def per_record():
+        for rec in recs:
+            gen_point({}, rec, NSMAP, codespace_map_gld1, 0)
+
+    def columnar():
+        parent = etree.Element(f"{{{NSMAP['wml2']}}}result", nsmap=NSMAP)
+        gen_points(parent, timeseries, NSMAP)
+
+    def streaming():
+        for _ in gen_points_xml(timeseries, NSMAP):
+            pass
+
+    for name, function in [
+        ("formatted tags + nsmap", formatted),
+        ("gen_point", per_record),
+        ("gen_points", columnar),
+        ("gen_points_xml", streaming),
+    ]:
+        best = min(timeit.repeat(function, number=1, repeat=repeat))
+        print(f"{name:<24} {best / n * 1e6:8.2f} us/point")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
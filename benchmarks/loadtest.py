@@ -0,0 +1,208 @@
+"""Load test of the bronhouderportaal connector against a local fake portal.
+
+Run from the repository root::
+
+    python -m benchmarks.loadtest                          # all scenarios
+    python -m benchmarks.loadtest deliver --concurrency 16 --latency 20
+    python -m benchmarks.loadtest --error-rate 0.05 --rate-limit 200
+    python -m benchmarks.loadtest --save out.json
+
+Every scenario starts a `FakeBronhouderportaal` and runs `--operations`
+connector calls from `--concurrency` threads through one
+`BronhouderportaalClient`. Reported are the operations and http requests per
+second, the latency percentiles of an operation (including its retries) and
+the retries, injected errors and rate limited requests. A delivery is done
+in separate steps and counts as failed when any of its steps fails.
+"""
+
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bro_exchange.bhp.client import BronhouderportaalClient
+from bro_exchange.bhp.fakeportal import FakeBronhouderportaal
+from bro_exchange.bhp.retry import RetryPolicy
+
+PAYLOAD = "<request>" + "<point/>" * 200 + "</request>"
+
+
+# Attempts of the delivery the status scenario polls, under error injection
+SETUP_ATTEMPTS = 20
+
+
+def _deliver_upload(client, reqs, max_workers=4):
+    """
+    Deliver `reqs` in separate steps, which raise when a step fails, and
+    return the delivery response.
+    """
+    upload_url_id = client.create_upload()
+    client.add_sourcedocuments(upload_url_id, reqs, max_workers=max_workers)
+    delivery = client.create_delivery(upload_url_id)
+    delivery.raise_for_status()
+    return delivery
+
+
+def _validate(client, args):
+    return lambda: client.validate_request(PAYLOAD)
+
+
+def _deliver(client, args):
+    reqs = {f"doc{number}.xml": PAYLOAD for number in range(args.documents)}
+    return lambda: _deliver_upload(client, reqs, max_workers=args.documents)
+
+
+def _status(client, args):
+    for _attempt in range(SETUP_ATTEMPTS):
+        try:
+            delivery = _deliver_upload(client, {"doc.xml": PAYLOAD})
+            break
+        except Exception as e:
+            error = e
+    else:
+        raise Exception(f"Unable to create the delivery to poll - {error}")
+    identifier = delivery.json()["identifier"]
+    return lambda: client.check_delivery_status(identifier)
+
+
+SCENARIOS = {
+    "validate": _validate,
+    "deliver": _deliver,
+    "status": _status,
+}
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, min(len(values) - 1, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def _timed(operation):
+    start = time.perf_counter()
+    try:
+        response = operation()
+        ok = getattr(response, "status_code", 200) < 400
+    except Exception:
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def _latency(args):
+    mean = args.latency / 1e3
+    if args.exponential and mean:
+        return lambda: random.expovariate(1 / mean)
+    return mean
+
+
+def run_scenario(name, args):
+    """Run one scenario and return its measurements."""
+    portal = FakeBronhouderportaal(
+        latency=_latency(args),
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=0,
+    )
+    policy = RetryPolicy(retries=args.retries, backoff_factor=args.backoff)
+    with (
+        portal,
+        BronhouderportaalClient(
+            user="user",
+            password="pass",
+            project_id=1,
+            base_url=portal.base_url,
+            retry_policy=policy,
+            pool_maxsize=args.concurrency * max(1, args.documents),
+        ) as client,
+    ):
+        operation = SCENARIOS[name](client, args)
+        policy.reset_counters()
+        requests_before = portal.stats["requests"]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(
+                executor.map(lambda _: _timed(operation), range(args.operations))
+            )
+        duration = time.perf_counter() - start
+
+        requests = portal.stats["requests"] - requests_before
+        stats = dict(portal.stats)
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        "scenario": name,
+        "operations": len(results),
+        "failures": sum(not ok for _, ok in results),
+        "duration_s": duration,
+        "operations_per_s": len(results) / duration,
+        "requests_per_s": requests / duration,
+        "p50_ms": _percentile(latencies, 0.50) * 1e3,
+        "p95_ms": _percentile(latencies, 0.95) * 1e3,
+        "p99_ms": _percentile(latencies, 0.99) * 1e3,
+        "max_ms": latencies[-1] * 1e3,
+        "retries": policy.counters["retries"],
+        "injected_errors": stats.get("injected_errors", 0),
+        "rate_limited": stats.get("rate_limited", 0),
+    }
+
+
+def _format(row):
+    return (
+        f"{row['scenario']:<10} {row['operations_per_s']:8.1f} "
+        f"{row['requests_per_s']:8.1f} {row['p50_ms']:8.1f} {row['p95_ms']:8.1f} "
+        f"{row['p99_ms']:8.1f} {row['max_ms']:8.1f} {row['retries']:7d} "
+        f"{row['failures']:7d}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"scenarios to run: {', '.join(SCENARIOS)}"
+    )
+    parser.add_argument("--operations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--documents", type=int, default=4, help="source documents per delivery"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=5.0, help="server latency in ms"
+    )
+    parser.add_argument(
+        "--exponential",
+        action="store_true",
+        help="draw the latency from an exponential distribution with this mean",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rate-limit", type=float, default=None, help="server requests per second"
+    )
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument(
+        "--backoff", type=float, default=0.05, help="first retry delay in s"
+    )
+    parser.add_argument("--save", help="write the results to a json file")
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    print(
+        f"{'scenario':<10} {'ops/s':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'retries':>7} {'failed':>7}"
+    )
+    rows = []
+    for name in args.scenarios or SCENARIOS:
+        row = run_scenario(name, args)
+        rows.append(row)
+        print(_format(row), flush=True)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(rows, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Generation benchmarks for all source document families.
+
+Run from the repository root::
+
+    python -m benchmarks.suite                 # all default cases
+    python -m benchmarks.suite gmw gmn         # cases whose name contains gmw or gmn
+    python -m benchmarks.suite --large         # include the 1M point GLD cases
+    python -m benchmarks.suite --save out.json
+    python -m benchmarks.suite --compare out.json
+
+Every case runs in a fresh interpreter, so the reported peak memory (the
+growth of the peak RSS over the process after building the input) belongs to
+that case alone. Peak memory is only reported where the `resource` module
+exists (not on Windows). Times are the best of the repeats, for `generate()` (which
+includes serializing the request) and for serializing the generated tree
+again.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from lxml import etree
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from . import synthetic
+
+MIN_TIME = 1.0
+
+
+class _NullWriter:
+    def write(self, data):
+        return len(data)
+
+
+def _request(request_class, args):
+    srcdoc, kwargs = args
+
+    def generate():
+        request = request_class(srcdoc, **kwargs)
+        request.generate()
+        return request.requesttree
+
+    return generate
+
+
+def _gld(points):
+    from bro_exchange.broxml.gld.requests import gld_registration_request
+
+    return _request(gld_registration_request, synthetic.gld_addition(points))
+
+
+def _gld_stream(points):
+    from bro_exchange.broxml.gld.requests import gld_registration_request
+
+    srcdoc, kwargs = synthetic.gld_addition(points)
+
+    def generate():
+        gld_registration_request(srcdoc, **kwargs).generate_stream(_NullWriter())
+
+    return generate
+
+
+def _gmw(tubes, cables=0, electrodes=2):
+    from bro_exchange.broxml.gmw.requests import gmw_registration_request
+
+    return _request(
+        gmw_registration_request, synthetic.gmw_construction(tubes, cables, electrodes)
+    )
+
+
+def _gmw_history(events):
+    from bro_exchange.broxml.gmw.requests import gmw_registration_request
+
+    return _request(
+        gmw_registration_request, synthetic.gmw_construction_with_history(events)
+    )
+
+
+def _gmn(points):
+    from bro_exchange.broxml.gmn.requests import gmn_registration_request
+
+    return _request(gmn_registration_request, synthetic.gmn_startregistration(points))
+
+
+def _frd(measurements):
+    from bro_exchange.broxml.frd.requests import GEMMeasurementTool
+
+    args = synthetic.frd_gem_measurement(measurements)
+
+    def generate():
+        tree = GEMMeasurementTool(**args).generate_xml_file()
+        etree.tostring(tree, encoding="utf8", method="xml")
+        return tree
+
+    return generate
+
+
+# name: (setup, large)
+CASES = {
+    "gld_addition-1k": (lambda: _gld(1_000), False),
+    "gld_addition-100k": (lambda: _gld(100_000), False),
+    "gld_addition-1M": (lambda: _gld(1_000_000), True),
+    "gld_addition_stream-100k": (lambda: _gld_stream(100_000), False),
+    "gld_addition_stream-1M": (lambda: _gld_stream(1_000_000), True),
+    "gmw_construction-1tube": (lambda: _gmw(1), False),
+    "gmw_construction-10tubes-2cables": (lambda: _gmw(10, 2, 8), False),
+    "gmw_construction-50tubes-4cables": (lambda: _gmw(50, 4, 16), False),
+    "gmw_history-100events": (lambda: _gmw_history(100), False),
+    "gmw_history-500events": (lambda: _gmw_history(500), False),
+    "gmn_startregistration-1000points": (lambda: _gmn(1_000), False),
+    "gmn_startregistration-10000points": (lambda: _gmn(10_000), False),
+    "frd_gem_measurement-1000": (lambda: _frd(1_000), False),
+    "frd_gem_measurement-20000": (lambda: _frd(20_000), False),
+}
+
+
+def _best(function, min_time=MIN_TIME):
+    """Return (best time, last result) over repeats taking at least min_time."""
+    times = []
+    result = None
+    while not times or (sum(times) < min_time and len(times) < 100):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def _maxrss():
+    """Peak resident set size of this process in bytes, or None if unknown."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_case(name):
+    """Run one case in this process and return its measurements."""
+    setup, _ = CASES[name]
+    generate = setup()
+    baseline = _maxrss()
+
+    generate_time, tree = _best(generate)
+    row = {
+        "case": name,
+        "generate_s": generate_time,
+        "serialize_s": None,
+        "peak_mb": None if baseline is None else (_maxrss() - baseline) / 2**20,
+    }
+    if tree is not None:
+        row["serialize_s"], _ = _best(
+            lambda: etree.tostring(tree, encoding="utf8", method="xml")
+        )
+    return row
+
+
+def _run_isolated(name):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--case", name],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def _format(row, previous=None):
+    serialize = row["serialize_s"]
+    peak = row["peak_mb"]
+    line = (
+        f"{row['case']:<36} {row['generate_s'] * 1e3:11.1f} "
+        f"{'-' if serialize is None else f'{serialize * 1e3:.1f}':>12} "
+        f"{'-' if peak is None else f'{peak:.1f}':>9}"
+    )
+    if previous is not None:
+        line += f" {row['generate_s'] / previous['generate_s']:8.2f}x"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("filters", nargs="*", help="run cases containing any of these")
+    parser.add_argument("--large", action="store_true", help="include large cases")
+    parser.add_argument("--save", help="write the results to a json file")
+    parser.add_argument("--compare", help="compare with results saved by --save")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        print(json.dumps(run_case(args.case)))
+        return
+
+    names = [
+        name
+        for name, (_, large) in CASES.items()
+        if (args.large or not large)
+        and (not args.filters or any(f in name for f in args.filters))
+    ]
+    previous = {}
+    if args.compare:
+        with open(args.compare) as file:
+            previous = {row["case"]: row for row in json.load(file)}
+
+    header = f"{'case':<36} {'generate ms':>11} {'serialize ms':>12} {'peak MB':>9}"
+    print(header + (" vs saved" if previous else ""))
+    results = []
+    for name in names:
+        row = _run_isolated(name)
+        results.append(row)
+        print(_format(row, previous.get(name)), flush=True)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
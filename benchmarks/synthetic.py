@@ -0,0 +1,278 @@
+"""Synthetic source documents for the generation benchmarks.
+
+Every function returns the arguments of a request class, sized by its
+parameters. The content is valid enough to generate; it isn't meant to pass
+the bronhouderportaal validation.
+"""
+
+import datetime
+
+from bro_exchange.broxml.gld.timeseries import GldTimeseries
+
+START = datetime.datetime(
+    2020, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+)
+
+
+def gld_timeseries(points):
+    """Hourly GLD timeseries, every 50th point rejected and censored."""
+    time = [
+        (START + datetime.timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%S%z")
+        for i in range(points)
+    ]
+    value = [
+        None if i % 50 == 49 else round(-4.0 - (i % 1000) * 0.001, 3)
+        for i in range(points)
+    ]
+    status_quality_control = [
+        "afgekeurd" if i % 50 == 49 else "goedgekeurd" for i in range(points)
+    ]
+    censored_reason = [
+        "BelowDetectionRange" if i % 50 == 49 else None for i in range(points)
+    ]
+    censoring_limitvalue = [-5.0 if i % 50 == 49 else None for i in range(points)]
+    return GldTimeseries.from_columns(
+        time,
+        value,
+        status_quality_control,
+        "Discontinuous",
+        censored_reason,
+        censoring_limitvalue,
+    )
+
+
+def gld_addition(points):
+    """GLD_Addition with `points` measurements."""
+    return (
+        "GLD_Addition",
+        {
+            "requestReference": f"bench-gld-{points}",
+            "qualityRegime": "IMBRO",
+            "broId": "GLD000000000001",
+            "deliveryAccountableParty": "27376655",
+            "srcdocdata": {
+                "metadata": {
+                    "status": "voorlopig",
+                    "parameters": {
+                        "principalInvestigator": "27376655",
+                        "observationType": "reguliereMeting",
+                    },
+                    "dateStamp": "2020-01-01",
+                },
+                "procedure": {
+                    "parameters": {
+                        "evaluationProcedure": "oordeelDeskundige",
+                        "measurementInstrumentType": "akoestischeSensor",
+                    }
+                },
+                "resultTime": "2020-02-01T00:00:00+01:00",
+                "result": gld_timeseries(points),
+            },
+        },
+    )
+
+
+def _geo_ohm_cables(cables, electrodes):
+    return [
+        {
+            "cableNumber": cable + 1,
+            "electrodes": [
+                {
+                    "electrodeNumber": electrode + 1,
+                    "electrodePackingMaterial": "zand",
+                    "electrodeStatus": "gebruiksklaar",
+                    "electrodePosition": -1.0 - electrode,
+                }
+                for electrode in range(electrodes)
+            ],
+        }
+        for cable in range(cables)
+    ]
+
+
+def gmw_monitoring_tube(number, cables=0, electrodes=2):
+    tube = {
+        "tubeNumber": number,
+        "tubeType": "standaardbuis",
+        "artesianWellCapPresent": "nee",
+        "sedimentSumpPresent": "ja",
+        "numberOfGeoOhmCables": cables,
+        "tubeTopDiameter": 63,
+        "variableDiameter": "nee",
+        "tubeStatus": "gebruiksklaar",
+        "tubeTopPosition": 1.5,
+        "tubeTopPositioningMethod": "RTKGPS0tot2cm",
+        "materialUsed": {
+            "tubePackingMaterial": "bentoniet",
+            "tubeMaterial": "pvc",
+            "glue": "geen",
+        },
+        "screen": {"screenLength": 1.0, "sockMaterial": "geen"},
+        "plainTubePart": {"plainTubePartLength": 10.0 + number},
+        "sedimentSump": {"sedimentSumpLength": 0.5},
+    }
+    if cables:
+        tube["geoOhmCables"] = _geo_ohm_cables(cables, electrodes)
+    return tube
+
+
+def gmw_construction_data(tubes, cables=0, electrodes=2):
+    return {
+        "objectIdAccountableParty": f"bench-{tubes}",
+        "deliveryContext": "publiekeTaak",
+        "constructionStandard": "NEN5766",
+        "initialFunction": "stand",
+        "numberOfMonitoringTubes": tubes,
+        "groundLevelStable": "ja",
+        "owner": 27376655,
+        "wellHeadProtector": "kokerMetaal",
+        "wellConstructionDate": "2020-01-01",
+        "deliveredLocation": {
+            "X": 120000.0,
+            "Y": 480000.0,
+            "horizontalPositioningMethod": "RTKGPS0tot2cm",
+        },
+        "deliveredVerticalPosition": {
+            "localVerticalReferencePoint": "NAP",
+            "offset": 0.0,
+            "verticalDatum": "NAP",
+            "groundLevelPosition": 1.2,
+            "groundLevelPositioningMethod": "RTKGPS0tot4cm",
+        },
+        "monitoringTubes": [
+            gmw_monitoring_tube(number + 1, cables, electrodes)
+            for number in range(tubes)
+        ],
+    }
+
+
+def gmw_construction(tubes, cables=0, electrodes=2):
+    """GMW_Construction with `tubes` tubes of `cables` geo-ohm cables each."""
+    return (
+        "GMW_Construction",
+        {
+            "requestReference": f"bench-gmw-{tubes}-{cables}",
+            "qualityRegime": "IMBRO",
+            "srcdocdata": gmw_construction_data(tubes, cables, electrodes),
+        },
+    )
+
+
+def _gmw_event(number, tubes):
+    date = (START + datetime.timedelta(days=number + 1)).strftime("%Y-%m-%d")
+    kind = number % 3
+    if kind == 0:
+        return {
+            "srcdoc": "GMW_Owner",
+            "eventdata": {"eventDate": date, "owner": 27376655},
+        }
+    if kind == 1:
+        return {
+            "srcdoc": "GMW_TubeStatus",
+            "eventdata": {
+                "eventDate": date,
+                "numberOfTubesChanged": tubes,
+                "monitoringTubes": [
+                    {"tubeNumber": tube + 1, "tubeStatus": "gebruiksklaar"}
+                    for tube in range(tubes)
+                ],
+            },
+        }
+    return {
+        "srcdoc": "GMW_Positions",
+        "eventdata": {
+            "eventDate": date,
+            "wellStability": "stabielNAP",
+            "groundLevelStable": "ja",
+            "numberOfMonitoringTubes": tubes,
+            "deliveredVerticalPosition": {
+                "localVerticalReferencePoint": "NAP",
+                "offset": 0.0,
+                "verticalDatum": "NAP",
+                "groundLevelPosition": 1.2,
+                "groundLevelPositioningMethod": "RTKGPS0tot4cm",
+            },
+            "monitoringTubes": [
+                {
+                    "tubeNumber": tube + 1,
+                    "tubeTopPosition": 1.5,
+                    "tubeTopPositioningMethod": "RTKGPS0tot2cm",
+                }
+                for tube in range(tubes)
+            ],
+        },
+    }
+
+
+def gmw_construction_with_history(events, tubes=3):
+    """GMW_ConstructionWithHistory with `events` intermediate events."""
+    return (
+        "GMW_ConstructionWithHistory",
+        {
+            "requestReference": f"bench-gmw-history-{events}",
+            "qualityRegime": "IMBRO",
+            "srcdocdata": {
+                "construction": gmw_construction_data(tubes),
+                "events": [_gmw_event(number, tubes) for number in range(events)],
+            },
+        },
+    )
+
+
+def gmn_startregistration(points):
+    """GMN_StartRegistration with `points` measuring points."""
+    return (
+        "GMN_StartRegistration",
+        {
+            "requestReference": f"bench-gmn-{points}",
+            "qualityRegime": "IMBRO",
+            "srcdocdata": {
+                "objectIdAccountableParty": f"bench-{points}",
+                "name": f"benchmark network {points}",
+                "deliveryContext": "waterwetStrategieOntwikkeling",
+                "monitoringPurpose": "strategischBeheerKwantiteitRegionaal",
+                "groundwaterAspect": "kwantiteit",
+                "startDateMonitoring": ["2020-01-01", "date"],
+                "measuringPoints": [
+                    {
+                        "measuringPointCode": f"PP{number:05d}",
+                        "monitoringTube": {
+                            "broId": f"GMW{number:012d}",
+                            "tubeNumber": 1,
+                        },
+                    }
+                    for number in range(points)
+                ],
+            },
+        },
+    )
+
+
+def frd_gem_measurement(measurements):
+    """FRD GEM measurement with `measurements` measures."""
+    return {
+        "metadata": {
+            "request_reference": f"bench-frd-{measurements}",
+            "delivery_accountable_party": "27376655",
+            "bro_id": "FRD000000000001",
+            "quality_regime": "IMBRO",
+        },
+        "srcdocdata": {
+            "measurement_date": "2020-01-01",
+            "measuring_responsible_party": "27376655",
+            "measuring_procedure": "NEN5766",
+            "evaluation_procedure": "oordeelDeskundige",
+            "measurements": [
+                (f"config{number}", 10.0 + number * 0.01)
+                for number in range(measurements)
+            ],
+            "calculated_method_responsible_party": "27376655",
+            "calculated_method_procedure": "oordeelDeskundige",
+            "measurement_count": measurements,
+            "calculated_values": " ".join(
+                f"{-1.0 - number * 0.1:.2f},{10.0 + number * 0.01:.3f}"
+                for number in range(measurements)
+            ),
+        },
+        "request_type": "registration",
+    }
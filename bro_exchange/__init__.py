@@ -1,4 +1,52 @@
-from bro_exchange.bhp import *
-from bro_exchange.broxml import *
+# The public names of bhp, broxml and checks are re-exported lazily, so that
+# importing one part of the package doesn't load all of it.
+from bro_exchange.lazy import lazy_star_imports as _lazy_star_imports
 
-from .checks import *
+# Module of every re-exported name, see bro_exchange.lazy; the broxml names
+# are those of bro_exchange.broxml._LAZY_NAMES
+_LAZY_NAMES = {
+    "bro_exchange.bhp": (
+        "AsyncBronhouderportaalClient",
+        "BronhouderportaalClient",
+        "DEFAULT_RETRY_POLICY",
+        "DeliveryJournal",
+        "DeliveryPoller",
+        "RetryPolicy",
+        "RetryingHttp",
+        "TERMINAL_DELIVERY_STATUSES",
+        "ValidationCache",
+        "add_sourcedocument",
+        "add_sourcedocuments",
+        "canonical_request",
+        "check_delivery_status",
+        "check_input",
+        "create_delivery",
+        "create_upload",
+        "deliver_requests",
+        "delivery_status",
+        "get_base_url",
+        "get_sourcedocument",
+        "get_validation_cache",
+        "met_projectnummer",
+        "set_validation_cache",
+        "upload_sourcedocs_from_dict",
+        "upload_sourcedocs_from_dir",
+        "validate_request",
+        "validate_sourcedoc",
+    ),
+    "bro_exchange.broxml": None,
+    "bro_exchange.checks": (
+        "check_missing_args",
+        "get_all_obligated",
+    ),
+}
+
+__getattr__, __dir__ = _lazy_star_imports(
+    __name__,
+    [
+        "bro_exchange.bhp",
+        "bro_exchange.broxml",
+        "bro_exchange.checks",
+    ],
+    _LAZY_NAMES,
+)
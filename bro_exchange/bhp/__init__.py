@@ -1,3 +1,62 @@
 # There were star imports here, but that's not best practice. Use the full
 # import paths *or* do it more explicitly.
-from .connector import *
+from .async_client import AsyncBronhouderportaalClient
+from .cache import (
+    ValidationCache,
+    canonical_request,
+    get_validation_cache,
+    set_validation_cache,
+)
+from .client import BronhouderportaalClient
+from .connector import (
+    add_sourcedocument,
+    add_sourcedocuments,
+    check_delivery_status,
+    check_input,
+    create_delivery,
+    create_upload,
+    deliver_requests,
+    get_base_url,
+    get_sourcedocument,
+    met_projectnummer,
+    upload_sourcedocs_from_dict,
+    upload_sourcedocs_from_dir,
+    validate_request,
+    validate_sourcedoc,
+)
+from .journal import DeliveryJournal
+from .poller import TERMINAL_DELIVERY_STATUSES, DeliveryPoller, delivery_status
+from .retry import DEFAULT_RETRY_POLICY, RetryingHttp, RetryPolicy
+
+__all__ = [
+    # connector
+    "get_base_url",
+    "check_input",
+    "met_projectnummer",
+    "validate_sourcedoc",
+    "validate_request",
+    "deliver_requests",
+    "upload_sourcedocs_from_dict",
+    "upload_sourcedocs_from_dir",
+    "create_upload",
+    "add_sourcedocument",
+    "add_sourcedocuments",
+    "create_delivery",
+    "check_delivery_status",
+    "get_sourcedocument",
+    # clients
+    "BronhouderportaalClient",
+    "AsyncBronhouderportaalClient",
+    # retries, polling, caching and journaling
+    "RetryPolicy",
+    "RetryingHttp",
+    "DEFAULT_RETRY_POLICY",
+    "DeliveryPoller",
+    "delivery_status",
+    "TERMINAL_DELIVERY_STATUSES",
+    "ValidationCache",
+    "set_validation_cache",
+    "get_validation_cache",
+    "canonical_request",
+    "DeliveryJournal",
+]
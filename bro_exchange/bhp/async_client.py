@@ -0,0 +1,166 @@
+"""
+Asyncio client for concurrent validation and delivery on the bronhouderportaal.
+
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import BronhouderportaalClient
+
+
+class AsyncBronhouderportaalClient:
+    """
+    Asyncio version of `BronhouderportaalClient`.
+
+    Every operation is a coroutine. At most `max_concurrency` http calls are
+    in flight at the same time; they run on a pooled `BronhouderportaalClient`
+    in a thread pool of `max_concurrency` workers owned by the client, so no
+    additional http library is needed.
+
+    Examples
+    --------
+    >>> async with AsyncBronhouderportaalClient(token, project_id=1) as client:
+    ...     results = await client.validate_requests(payloads)
+    """
+
+    def __init__(
+        self,
+        token=None,
+        user=None,
+        password=None,
+        project_id=None,
+        demo=False,
+        max_concurrency=10,
+        base_url=None,
+        retry_policy=None,
+    ):
+        """
+        Parameters
+        ----------
+        token : dictionary
+            dictionary with authentication data. keys:
+                - user
+                - pass
+        user:
+            Token user. Note: should only be supplied when token isn't generated in advance
+        password:
+            Token pass. Note: should only be supplied when token isn't generated in advance
+        project_id:
+            id of the project
+        demo : Bool
+            Defaults to False. If true, the test environment
+            of the bronhouderportaal is selected for data exchange
+        max_concurrency : int
+            maximum number of http calls in flight at the same time
+        base_url : string, optional
+            api url to use instead of `get_base_url(demo)`, e.g. a local
+            test server.
+        retry_policy : RetryPolicy, optional
+            timeouts and retries of the http requests. Defaults to
+            `DEFAULT_RETRY_POLICY`.
+        """
+        if max_concurrency < 1:
+            raise Exception("max_concurrency should be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.client = BronhouderportaalClient(
+            token=token,
+            user=user,
+            password=password,
+            project_id=project_id,
+            demo=demo,
+            pool_maxsize=max_concurrency,
+            base_url=base_url,
+            retry_policy=retry_policy,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="bronhouderportaal"
+        )
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the session, its pooled connections and the thread pool."""
+        # Waiting for the calls in flight would block the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self.client.close()
+
+    async def _call(self, method, *args, **kwargs):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            # Not asyncio.to_thread: the default executor of the loop has
+            # fewer workers than a large max_concurrency
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(method, *args, **kwargs)
+            )
+
+    async def validate_request(self, payload):
+        """Validate a request, see `connector.validate_request`."""
+        return await self._call(self.client.validate_request, payload)
+
+    async def validate_requests(self, payloads):
+        """Validate requests concurrently, returning the results in order."""
+        return await asyncio.gather(
+            *(self.validate_request(payload) for payload in payloads)
+        )
+
+    async def create_upload(self):
+        """Create an empty upload, see `connector.create_upload`."""
+        return await self._call(self.client.create_upload)
+
+    async def add_sourcedocument(self, upload_url_id, payload, filename=None):
+        """Add a source document to an upload, see `connector.add_sourcedocument`."""
+        return await self._call(
+            self.client.add_sourcedocument, upload_url_id, payload, filename=filename
+        )
+
+    async def add_sourcedocuments(self, upload_url_id, reqs):
+        """Add source documents ({filename: XML}) to an upload concurrently."""
+        return await asyncio.gather(
+            *(
+                self.add_sourcedocument(upload_url_id, payload, filename=filename)
+                for filename, payload in reqs.items()
+            )
+        )
+
+    async def create_delivery(self, upload_url_id):
+        """Deliver an upload, see `connector.create_delivery`."""
+        return await self._call(self.client.create_delivery, upload_url_id)
+
+    async def deliver_requests(self, reqs):
+        """
+        Deliver requests in one upload.
+
+        The upload is created first, the source documents are added
+        concurrently and the upload is delivered once all are added.
+
+        Parameters
+        ----------
+        reqs : dictionary
+            dictionary containing:
+                keys: filenames
+                values: XML strings containing the requests.
+
+        Returns
+        -------
+        Request response with the delivery info.
+        """
+        upload_url_id = await self.create_upload()
+        await self.add_sourcedocuments(upload_url_id, reqs)
+        return await self.create_delivery(upload_url_id)
+
+    async def check_delivery_status(self, identifier):
+        """Get the status of a delivery, see `connector.check_delivery_status`."""
+        return await self._call(self.client.check_delivery_status, identifier)
+
+    async def get_sourcedocument(self, identifier):
+        """Get a source document, see `connector.get_sourcedocument`."""
+        return await self._call(self.client.get_sourcedocument, identifier)
@@ -0,0 +1,184 @@
+"""
+Content-addressed on-disk cache for bronhouderportaal validation results.
+
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from lxml import etree
+
+GML_ID = "{http://www.opengis.net/gml/3.2}id"
+
+_validation_cache = None
+
+
+def set_validation_cache(cache):
+    """
+    Set the cache consulted by `validate_request` (and so by every request
+    class's `validate()`). Use None to switch caching off again.
+    """
+    global _validation_cache
+    _validation_cache = cache
+
+
+def get_validation_cache():
+    """Return the cache set with `set_validation_cache`, or None."""
+    return _validation_cache
+
+
+def canonical_request(payload):
+    """
+    Return the canonical (C14N) form of a request without volatile parts.
+
+    The requestReference is emptied and gml ids (and references to them)
+    are renumbered in document order, so regenerating the same request
+    gives the same canonical form.
+    """
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    root = etree.fromstring(payload, parser=etree.XMLParser(remove_blank_text=True))
+
+    for element in root.iter("{*}requestReference"):
+        element.text = None
+
+    ids = {}
+    for element in root.iter():
+        if GML_ID in element.attrib:
+            ids[element.attrib[GML_ID]] = f"id_{len(ids)}"
+            element.attrib[GML_ID] = ids[element.attrib[GML_ID]]
+    if ids:
+        for element in root.iter():
+            for name, value in element.attrib.items():
+                if value.startswith("#") and value[1:] in ids:
+                    element.attrib[name] = "#" + ids[value[1:]]
+
+    return etree.tostring(root, method="c14n")
+
+
+class ValidationCache:
+    """
+    Cache of validation results, keyed by the canonical request content.
+
+    Every entry is a json file in `directory`, named after the sha256 of the
+    canonical request XML plus project and api url. Entries expire after
+    `ttl` seconds; when more than `max_entries` are stored, the least
+    recently used entries are removed.
+    """
+
+    def __init__(self, directory, ttl=7 * 24 * 3600, max_entries=10000):
+        """
+        Parameters
+        ----------
+        directory : string or path
+            folder to store the cache entries in, created if missing
+        ttl : float
+            number of seconds a validation result stays valid
+        max_entries : int
+            maximum number of stored validation results
+        """
+        self.directory = os.fspath(directory)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._entries = len(self._files())
+
+    def _count(self, name):
+        # get() is called from the thread pools of e.g. validate_many
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _files(self):
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        ]
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def key(self, payload, project_id=None, base_url=None):
+        """Return the cache key of a request for a project and api url."""
+        digest = hashlib.sha256()
+        digest.update(f"{base_url}\n{project_id}\n".encode())
+        digest.update(canonical_request(payload))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the cached validation result, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+
+        if time.time() - entry["created"] > self.ttl:
+            self._remove(path)
+            self._count("misses")
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return entry["info"]
+
+    def put(self, key, info):
+        """Store a validation result."""
+        path = self._path(key)
+        exists = os.path.exists(path)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"created": time.time(), "info": info}, file)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if not exists:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._entries -= 1
+
+    def _evict(self):
+        files = []
+        for path in self._files():
+            try:
+                files.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+        files.sort()
+        for _, path in files[: max(0, len(files) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._entries = min(len(files), self.max_entries)
+
+    def clear(self):
+        """Remove all cached validation results."""
+        for path in self._files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._entries = 0
@@ -0,0 +1,197 @@
+"""
+Bronhouderportaal client with a pooled, keep-alive http session.
+
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .connector import (
+    add_sourcedocument,
+    add_sourcedocuments,
+    check_delivery_status,
+    check_input,
+    create_delivery,
+    create_upload,
+    deliver_requests,
+    get_base_url,
+    get_sourcedocument,
+    upload_sourcedocs_from_dict,
+    upload_sourcedocs_from_dir,
+    validate_request,
+)
+from .poller import DeliveryPoller
+from .retry import DEFAULT_RETRY_POLICY
+
+
+class BronhouderportaalClient:
+    """
+    Client for the bronhouderportaal api that reuses its connections.
+
+    The client owns a `requests.Session` with a connection pool, so many
+    validations or deliveries in a row reuse the same TCP/TLS connections
+    instead of opening a new one per call. Authentication and base url are
+    resolved once. All operations of `bro_exchange.bhp.connector` are
+    available as methods with the same names.
+
+    The client can be used as a context manager, which closes the session.
+    """
+
+    def __init__(
+        self,
+        token=None,
+        user=None,
+        password=None,
+        project_id=None,
+        demo=False,
+        pool_connections=1,
+        pool_maxsize=10,
+        session=None,
+        base_url=None,
+        retry_policy=None,
+        validation_cache=None,
+    ):
+        """
+        Parameters
+        ----------
+        token : dictionary
+            dictionary with authentication data. keys:
+                - user
+                - pass
+        user:
+            Token user. Note: should only be supplied when token isn't generated in advance
+        password:
+            Token pass. Note: should only be supplied when token isn't generated in advance
+        project_id:
+            id of the project
+        demo : Bool
+            Defaults to False. If true, the test environment
+            of the bronhouderportaal is selected for data exchange
+        pool_connections : int
+            number of hosts to keep connection pools for
+        pool_maxsize : int
+            maximum number of connections kept open per host
+        session : requests.Session, optional
+            session to use instead of a new one. The connection pool is
+            mounted on it.
+        base_url : string, optional
+            api url to use instead of `get_base_url(demo)`, e.g. a local
+            test server.
+        retry_policy : RetryPolicy, optional
+            timeouts and retries of the http requests. Defaults to
+            `DEFAULT_RETRY_POLICY`; its `counters` show the retries done.
+        validation_cache : ValidationCache, optional
+            cache of validation results. Defaults to the cache set with
+            `set_validation_cache`, if any.
+        """
+        self.token = check_input(
+            token=token,
+            user=user,
+            password=password,
+            project_id=project_id,
+            demo=demo,
+        )
+        self.project_id = project_id
+        self.demo = demo
+        self.base_url = get_base_url(demo) if base_url is None else base_url
+        self.retry_policy = (
+            DEFAULT_RETRY_POLICY if retry_policy is None else retry_policy
+        )
+
+        self.validation_cache = validation_cache
+
+        self.session = requests.Session() if session is None else session
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.auth = (self.token["user"], self.token["pass"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the session and its pooled connections."""
+        self.session.close()
+
+    def _connector_kwargs(self):
+        return {
+            "token": self.token,
+            "project_id": self.project_id,
+            "demo": self.demo,
+            "session": self.session,
+            "base_url": self.base_url,
+            "retry_policy": self.retry_policy,
+        }
+
+    def validate_request(self, payload):
+        """Validate a request, see `connector.validate_request`."""
+        return validate_request(
+            payload, cache=self.validation_cache, **self._connector_kwargs()
+        )
+
+    def deliver_requests(self, reqs, max_workers=4):
+        """Deliver requests in one upload, see `connector.deliver_requests`."""
+        return deliver_requests(
+            reqs, max_workers=max_workers, **self._connector_kwargs()
+        )
+
+    def upload_sourcedocs_from_dict(self, reqs, max_workers=4, journal=None):
+        """Deliver requests in one upload, see `connector.upload_sourcedocs_from_dict`."""
+        return upload_sourcedocs_from_dict(
+            reqs, max_workers=max_workers, journal=journal, **self._connector_kwargs()
+        )
+
+    def upload_sourcedocs_from_dir(
+        self, input_folder, specific_file=None, pattern=None, max_workers=4
+    ):
+        """Deliver the files in a folder, see `connector.upload_sourcedocs_from_dir`."""
+        return upload_sourcedocs_from_dir(
+            input_folder,
+            specific_file=specific_file,
+            pattern=pattern,
+            max_workers=max_workers,
+            **self._connector_kwargs(),
+        )
+
+    def create_upload(self):
+        """Create an empty upload, see `connector.create_upload`."""
+        return create_upload(**self._connector_kwargs())
+
+    def add_sourcedocument(self, upload_url_id, payload, filename=None):
+        """Add a source document to an upload, see `connector.add_sourcedocument`."""
+        kwargs = self._connector_kwargs()
+        del kwargs["base_url"]
+        return add_sourcedocument(upload_url_id, payload, filename=filename, **kwargs)
+
+    def add_sourcedocuments(self, upload_url_id, reqs, max_workers=4):
+        """Add source documents concurrently, see `connector.add_sourcedocuments`."""
+        kwargs = self._connector_kwargs()
+        del kwargs["base_url"]
+        return add_sourcedocuments(
+            upload_url_id, reqs, max_workers=max_workers, **kwargs
+        )
+
+    def create_delivery(self, upload_url_id):
+        """Deliver an upload, see `connector.create_delivery`."""
+        return create_delivery(upload_url_id, **self._connector_kwargs())
+
+    def check_delivery_status(self, identifier):
+        """Get the status of a delivery, see `connector.check_delivery_status`."""
+        return check_delivery_status(identifier, **self._connector_kwargs())
+
+    def poll_deliveries(self, identifiers, timeout=None, **kwargs):
+        """
+        Poll deliveries until they are done, yielding (identifier, response).
+
+        Keyword arguments are passed to `DeliveryPoller`.
+        """
+        return DeliveryPoller(self, identifiers, **kwargs).poll(timeout=timeout)
+
+    def get_sourcedocument(self, identifier):
+        """Get a source document, see `connector.get_sourcedocument`."""
+        return get_sourcedocument(identifier, **self._connector_kwargs())
@@ -3,11 +3,18 @@ Created on Wed Nov  3 11:41:54 2021
 
 """
 
+import fnmatch
 import json
+import logging
 import os
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-import requests.auth
+from .cache import get_validation_cache
+from .journal import CREATED, DELIVERING, content_hash
+from .retry import RetryingHttp
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # Validation
@@ -75,7 +82,9 @@ def met_projectnummer(bro_info):
     return available
 
 
-def validate_sourcedoc(payload, bro_info, demo=False):
+def validate_sourcedoc(
+    payload, bro_info, demo=False, session=None, retry_policy=None
+):
     """
 
 
@@ -90,6 +99,12 @@ def validate_sourcedoc(payload, bro_info, demo=False):
     demo : Bool
         Defaults to False. If true, the test environment
         of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
 
     Returns
     -------
@@ -97,6 +112,7 @@ def validate_sourcedoc(payload, bro_info, demo=False):
 
     """
     token = bro_info["token"]
+    http = RetryingHttp(session, retry_policy)
     proj_str = (
         "" if not met_projectnummer(bro_info) else f"{bro_info['projectnummer']}/"
     )
@@ -105,8 +121,9 @@ def validate_sourcedoc(payload, bro_info, demo=False):
         f"https://{url_prefix}.bronhouderportaal-bro.nl/api/v2/{proj_str}validatie"
     )
 
-    res = requests.post(
+    res = http.post(
         upload_url,
+        idempotent=True,
         data=payload,
         headers={"Content-Type": "application/xml"},
         cookies={},
@@ -115,14 +132,23 @@ def validate_sourcedoc(payload, bro_info, demo=False):
     try:
         requestinfo = res.json()
     except Exception as e:
-        print(f"Error while parsing response from bronhouderportaal: {e}")
+        logger.error("Error while parsing response from bronhouderportaal: %s", e)
         requestinfo = res
 
     return requestinfo
 
 
 def validate_request(
-    payload, token=None, user=None, password=None, project_id=None, demo=False
+    payload,
+    token=None,
+    user=None,
+    password=None,
+    project_id=None,
+    demo=False,
+    session=None,
+    retry_policy=None,
+    base_url=None,
+    cache=None,
 ):
     """
 
@@ -144,6 +170,17 @@ def validate_request(
     demo : Bool
         Defaults to False. If true, the test environment
         of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
+    cache : ValidationCache, optional
+        Cache of validation results. Defaults to the cache set with
+        `set_validation_cache`, if any.
 
     Returns
     -------
@@ -157,12 +194,21 @@ def validate_request(
         project_id=project_id, 
         demo=demo
     )
-    base_url = get_base_url(demo)
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
     project_id = str(project_id)
     upload_url = base_url + f"/{project_id}/validatie"
 
-    res = requests.post(
+    cache = get_validation_cache() if cache is None else cache
+    if cache is not None:
+        key = cache.key(payload, project_id, base_url)
+        requestinfo = cache.get(key)
+        if requestinfo is not None:
+            return requestinfo
+
+    res = http.post(
         upload_url,
+        idempotent=True,
         data=payload,
         headers={"Content-Type": "application/xml"},
         cookies={},
@@ -170,12 +216,23 @@ def validate_request(
     )
 
     requestinfo = res.json()
+    if cache is not None and isinstance(requestinfo, dict) and "status" in requestinfo:
+        cache.put(key, requestinfo)
 
     return requestinfo
 
 
 def deliver_requests(
-    reqs, token=None, user=None, password=None, project_id=None, demo=False
+    reqs,
+    token=None,
+    user=None,
+    password=None,
+    project_id=None,
+    demo=False,
+    session=None,
+    retry_policy=None,
+    base_url=None,
+    max_workers=4,
 ):
     """
 
@@ -193,6 +250,16 @@ def deliver_requests(
     demo : Bool
         Defaults to False. If true, the test environment
         of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
+    max_workers : int
+        maximum number of source documents uploaded at the same time
 
     Returns
     -------
@@ -209,40 +276,38 @@ def deliver_requests(
         demo=demo
     )
 
-    base_url = get_base_url(demo)
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
 
     project_id = str(project_id)
     upload_url = base_url + f"/{project_id}/uploads"
 
     try:
-        res = requests.post(
+        res = http.post(
             upload_url,
             headers={"Content-Type": "application/xml"},
             cookies={},
             auth=(token["user"], token["pass"]),
         )
-    except:
-        raise Exception("Error: unable to create an upload")
+    except Exception as e:
+        raise Exception(f"Error: unable to create an upload - {e}") from e
 
     try:
         upload_url_id = res.headers["Location"]
 
         # Step 2: Add source documents to upload
-        try:
-            for request in reqs.keys():
-                headers = {"Content-type": "application/xml"}
-                params = {"filename": request}
-                payload = reqs[request]
-                res = requests.post(
-                    upload_url_id + "/brondocumenten",
-                    data=payload,
-                    headers=headers,
-                    cookies={},
-                    auth=(token["user"], token["pass"]),
-                    params=params,
-                )
-        except:
-            raise Exception("Error: Cannot add source documents to upload")
+        responses = add_sourcedocuments(
+            upload_url_id,
+            reqs,
+            token=token,
+            project_id=project_id,
+            demo=demo,
+            session=session,
+            retry_policy=retry_policy,
+            max_workers=max_workers,
+        )
+        if responses:
+            res = list(responses.values())[-1]
 
         # Step 3: Deliver upload
         try:
@@ -250,10 +315,10 @@ def deliver_requests(
             delivery_url = base_url + f"/{project_id}/leveringen"
             payload = {"upload": int(upload_id)}
             headers = {"Content-type": "application/json"}
-        except:
-            raise Exception("Error: failed to deliver upload")
+        except Exception as e:
+            raise Exception(f"Error: failed to deliver upload - {e}") from e
 
-        endresponse = requests.post(
+        endresponse = http.post(
             delivery_url,
             data=json.dumps(payload),
             headers=headers,
@@ -262,23 +327,34 @@ def deliver_requests(
         )
         try:
             delivery_url_id = endresponse.headers["Location"]
-        except:
+        except KeyError:
             return endresponse
 
-        delivery = requests.get(
+        delivery = http.get(
             url=delivery_url_id,
             auth=(token["user"], token["pass"]),
         )
 
         return delivery
-    except:
+    except Exception as e:
+        logger.error("Failed to deliver requests - %s", e)
         delivery = res
 
     return delivery
 
 
 def upload_sourcedocs_from_dict(
-    reqs, token=None, user=None, password=None, project_id=None, demo=False
+    reqs,
+    token=None,
+    user=None,
+    password=None,
+    project_id=None,
+    demo=False,
+    session=None,
+    retry_policy=None,
+    base_url=None,
+    max_workers=4,
+    journal=None,
 ):
     """
 
@@ -296,6 +372,22 @@ def upload_sourcedocs_from_dict(
     demo : Bool
         Defaults to False. If true, the test environment
         of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
+    max_workers : int
+        maximum number of source documents uploaded at the same time
+    journal : DeliveryJournal, optional
+        journal to record every step in. Documents whose content was already
+        delivered are skipped, and an unfinished upload of the same
+        documents (e.g. after a crash) is resumed instead of starting over.
+        If its delivery was already requested, the existing delivery of the
+        upload is looked up before delivering it again.
 
     Returns
     -------
@@ -311,75 +403,184 @@ def upload_sourcedocs_from_dict(
         project_id=project_id, 
         demo=demo
     )
-    base_url = get_base_url(demo)
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
     project_id = str(project_id)
     upload_url = base_url + f"/{project_id}/uploads"
 
-
-    res = requests.post(
-        upload_url,
-        headers={"Content-Type": "application/xml"},
-        cookies={},
-        auth=(token["user"], token["pass"]),
-    )
-    print(f"Creating upload at {upload_url} - {res.status_code} - {res.content}")
-    upload_url_id = res.headers["Location"]
+    journaled = None
+    if journal is not None:
+        hashes = {filename: content_hash(payload) for filename, payload in reqs.items()}
+        delivered = [f for f in reqs if journal.is_delivered(hashes[f])]
+        if delivered:
+            logger.info("Skipping already delivered source documents: %s", delivered)
+        reqs = {f: payload for f, payload in reqs.items() if f not in delivered}
+        if not reqs:
+            return {
+                "status": "skipped",
+                "message": "All source documents were already delivered",
+                "skipped": delivered,
+            }
+        hashes = {filename: hashes[filename] for filename in reqs}
+        batch_key = journal.batch_key(hashes)
+        journaled = journal.unfinished_upload(batch_key)
+
+    if journaled is None:
+        res = http.post(
+            upload_url,
+            headers={"Content-Type": "application/xml"},
+            cookies={},
+            auth=(token["user"], token["pass"]),
+        )
+        logger.info("Created upload at %s - %s", upload_url, res.status_code)
+        logger.debug("Upload response: %s", res.content)
+        upload_url_id = res.headers["Location"]
+        if journal is not None:
+            journaled = {
+                "id": journal.start_upload(batch_key, upload_url_id),
+                "state": CREATED,
+                "documents": {},
+            }
+    else:
+        upload_url_id = journaled["upload_url"]
+        logger.info("Resuming upload %s (%s)", upload_url_id, journaled["state"])
 
     # Step 2: Add source documents to upload
-    print(f"We will handle the following source documents: {list(reqs.keys())}")
+    on_added = on_failed = None
+    rejected = []
+    if journaled is not None:
+        reqs = {
+            filename: payload
+            for filename, payload in reqs.items()
+            if journaled["state"] == CREATED
+            and journaled["documents"].get(filename) != hashes[filename]
+        }
+
+        def on_added(filename, res):
+            journal.record_document(journaled["id"], filename, hashes[filename])
+
+        def on_failed(filename, error):
+            response = getattr(error, "response", None)
+            if response is not None and _is_rejected(response):
+                rejected.append(filename)
+
+    logger.info("Adding source documents: %s", list(reqs))
     try:
-        for request in reqs.keys():
-            print(f"Uploading {request} to bronhouderportaal")
-            headers = {"Content-type": "application/xml"}
-            payload = reqs[request]
-            
-            # Ensure payload is bytes
-            if isinstance(payload, str):
-                payload = payload.encode("utf-8")
-            
-            brondoc_url = upload_url_id + "/brondocumenten"
-            print(f"Posting brondocument to: {brondoc_url}")
-            res = requests.post(
-                brondoc_url,
-                data=payload,
-                headers=headers,
-                cookies={},
-                auth=(token["user"], token["pass"]),
+        responses = add_sourcedocuments(
+            upload_url_id,
+            reqs,
+            token=token,
+            project_id=project_id,
+            demo=demo,
+            session=session,
+            retry_policy=retry_policy,
+            max_workers=max_workers,
+            with_filename=False,
+            on_added=on_added,
+            on_failed=on_failed,
+        )
+        for request, res in responses.items():
+            logger.debug(
+                "Brondocument %s response: %s - %s",
+                request,
+                res.status_code,
+                res.content,
             )
-            print(f"Brondocument response: {res.status_code} - {res.content}")
-            res.raise_for_status()
 
     except Exception as e:
-        print(f"Error: Cannot add source documents to upload - {e}")
+        logger.error("Cannot add source documents to upload - %s", e)
+        if rejected:
+            # E.g. an expired upload; resuming it would fail the same way
+            journal.record_failure(journaled["id"])
         return {"status": "error", "message": f"Error: {e}"}
 
     # Step 3: Deliver upload
     upload_id = upload_url_id.split("/")[-1]
     delivery_url = base_url + f"/{project_id}/leveringen"
-    payload = {"upload": int(upload_id)}
-    headers = {"Content-type": "application/json"}
-    endresponse = requests.post(
-        delivery_url,
-        data=json.dumps(payload),
-        headers=headers,
-        auth=(token["user"], token["pass"]),
-        timeout=60,
-    )
+    delivery_url_id = None
+    if journaled is not None and journaled["state"] == DELIVERING:
+        # The delivery may have been created just before an interruption
+        try:
+            delivery_url_id = _find_delivery(http, token, delivery_url, upload_id)
+        except Exception as e:
+            logger.error(
+                "Cannot look up the delivery of upload %s - %s", upload_url_id, e
+            )
+            return {"status": "error", "message": f"Error: {e}"}
+    elif journaled is not None:
+        journal.start_delivery(journaled["id"])
+
     try:
-        endresponse.raise_for_status()
-        delivery_url_id = endresponse.headers["Location"]
-        delivery = requests.get(
+        if delivery_url_id is None:
+            payload = {"upload": int(upload_id)}
+            headers = {"Content-type": "application/json"}
+            endresponse = http.post(
+                delivery_url,
+                data=json.dumps(payload),
+                headers=headers,
+                auth=(token["user"], token["pass"]),
+            )
+            logger.debug("Delivery response: %s", endresponse.content)
+            if journaled is not None and _is_rejected(endresponse):
+                journal.record_failure(journaled["id"])
+            endresponse.raise_for_status()
+            delivery_url_id = endresponse.headers["Location"]
+        else:
+            logger.info("Upload %s was already delivered", upload_url_id)
+        if journaled is not None:
+            journal.record_delivery(journaled["id"], delivery_url_id)
+        delivery = http.get(
             url=delivery_url_id,
             auth=(token["user"], token["pass"]),
         )
     except Exception as e:
-        print(f"Error: failed to deliver upload - {e}")
-        print(f'leveringen post resulted in: {endresponse.content}')
+        logger.error("Failed to deliver upload %s - %s", upload_url_id, e)
         return {"status": "error", "message": f"Error: {e}"}
 
     return delivery
 
 
+def _find_delivery(http, token, delivery_url, upload_id):
+    """
+    Return the url of the existing delivery of an upload, or None if the
+    upload wasn't delivered.
+    """
+    res = http.get(url=delivery_url, auth=(token["user"], token["pass"]))
+    res.raise_for_status()
+    for delivery in res.json():
+        if str(delivery.get("upload")) == str(upload_id):
+            return f"{delivery_url}/{delivery['identifier']}"
+    return None
+
+
+def _is_rejected(res):
+    """
+    Return whether the portal refused a request for good, as opposed to
+    failing to process it (server errors, rate limiting) or refusing the
+    credentials. Repeating a rejected request gives the same answer.
+    """
+    return 400 <= res.status_code < 500 and res.status_code not in (401, 403, 408, 429)
+
+
+def _source_document_paths(input_folder, specific_file=None, pattern=None):
+    """
+    Return {filename: path} of the files in `input_folder` that match the
+    glob `pattern`, largest first, or only `specific_file` if it is given.
+    """
+    if specific_file is not None:
+        return {specific_file: pathlib.Path(input_folder, specific_file)}
+
+    sizes = {}
+    with os.scandir(input_folder) as entries:
+        for entry in entries:
+            if pattern is not None and not fnmatch.fnmatch(entry.name, pattern):
+                continue
+            if entry.is_file():
+                sizes[entry.name] = entry.stat().st_size
+    filenames = sorted(sizes, key=lambda filename: (-sizes[filename], filename))
+    return {filename: pathlib.Path(input_folder, filename) for filename in filenames}
+
+
 def upload_sourcedocs_from_dir(
     input_folder,
     token=None,
@@ -388,6 +589,11 @@ def upload_sourcedocs_from_dir(
     project_id=None,
     demo=False,
     specific_file=None,
+    session=None,
+    retry_policy=None,
+    base_url=None,
+    pattern=None,
+    max_workers=4,
 ):
     """
 
@@ -403,6 +609,21 @@ def upload_sourcedocs_from_dir(
         Filename of an specific requestument in the input folder. If this
         parameter is left empty, all requestuments in the input folder
         will be loaded
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
+    pattern : string, optional
+        Glob pattern of the filenames to load, e.g. "*.xml". Defaults to
+        all files in the input folder.
+    max_workers : int
+        Maximum number of documents posted at the same time. The files are
+        streamed in binary mode, largest first, so at most `max_workers`
+        files are open at once.
 
     Returns
     -------
@@ -418,12 +639,13 @@ def upload_sourcedocs_from_dir(
         project_id=project_id, 
         demo=demo
     )
-    base_url = get_base_url(demo)
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
     project_id = str(project_id)
     upload_url = base_url + f"/{project_id}/uploads"
 
     try:
-        res = requests.post(
+        res = http.post(
             upload_url,
             headers={"Content-Type": "application/xml"},
             cookies={},
@@ -431,58 +653,32 @@ def upload_sourcedocs_from_dir(
         )
         res.raise_for_status()
     except Exception as e:
-        print(f"Error: unable to create an upload - {e}")
+        logger.error("Unable to create an upload - %s", e)
 
     upload_url_id = ""
     upload_url_id = res.headers["Location"]
 
     # Step 2: Add source documents to upload
-    if specific_file is None:
-        try:
-            source_documents = os.listdir(input_folder)
-
-            try:
-                for source_document in source_documents:
-                    xmlfile = os.path.join(input_folder, source_document)
-                    with open(xmlfile) as file:
-                        payload = file.read()
-                    headers = {"Content-type": "application/xml"}
-                    params = {"filename": source_document}
-                    res = requests.post(
-                        upload_url_id + "/brondocumenten",
-                        data=payload,
-                        headers=headers,
-                        cookies={},
-                        auth=(token["user"], token["pass"]),
-                        params=params,
-                    )
-            except:
-                print("Error: Cannot add source documents to upload")
-
-        except:
-            print("Error: No source documents found")
+    try:
+        paths = _source_document_paths(input_folder, specific_file, pattern)
+    except Exception as e:
+        logger.error("No source documents found - %s", e)
+        return delivery
 
-    else:
-        try:
-            xmlfile = os.path.join(input_folder, specific_file)
-
-            try:
-                with open(xmlfile) as file:
-                    payload = file.read()
-                    headers = {"Content-type": "application/xml"}
-                    params = {"filename": specific_file}
-                    res = requests.post(
-                        upload_url_id + "/brondocumenten",
-                        data=payload,
-                        headers=headers,
-                        cookies={},
-                        auth=(token["user"], token["pass"]),
-                        params=params,
-                    )
-            except:
-                print("Error: Cannot add source documents to upload")
-        except:
-            print("Error: No source documents found")
+    try:
+        add_sourcedocuments(
+            upload_url_id,
+            paths,
+            token=token,
+            project_id=project_id,
+            demo=demo,
+            session=session,
+            retry_policy=retry_policy,
+            max_workers=max_workers,
+        )
+    except Exception as e:
+        logger.error("Cannot add source documents to upload - %s", e)
+        return delivery
 
     # Step 3: Deliver upload
     try:
@@ -490,7 +686,7 @@ def upload_sourcedocs_from_dir(
         delivery_url = base_url + f"/{project_id}/leveringen"
         payload = {"upload": int(upload_id)}
         headers = {"Content-type": "application/json"}
-        endresponse = requests.post(
+        endresponse = http.post(
             delivery_url,
             data=json.dumps(payload),
             headers=headers,
@@ -498,13 +694,311 @@ def upload_sourcedocs_from_dir(
             auth=(token["user"], token["pass"]),
         )
         delivery_url_id = endresponse.headers["Location"]
-        delivery = requests.get(
+        delivery = http.get(
             url=delivery_url_id,
             auth=(token["user"], token["pass"]),
         )
-    except:
-        print("Error: failed to deliver upload")
+    except Exception as e:
+        logger.error("Failed to deliver upload - %s", e)
+
+    return delivery
+
+
+def create_upload(
+    token=None,
+    user=None,
+    password=None,
+    project_id=None,
+    demo=False,
+    session=None,
+    retry_policy=None,
+    base_url=None,
+):
+    """
+    Create an empty upload (step 1 of a delivery).
+
+    Parameters
+    ----------
+    token : dictionary
+        dictionary with authentication data. keys:
+            - user
+            - pass
+    project_id:
+        id of the project
+    demo : Bool
+        Defaults to False. If true, the test environment
+        of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
 
+    Returns
+    -------
+    upload_url_id: String
+        url of the created upload
+
+    """
+    token = check_input(
+        token=token, user=user, password=password, project_id=project_id, demo=demo
+    )
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
+    upload_url = base_url + f"/{project_id}/uploads"
+
+    res = http.post(
+        upload_url,
+        headers={"Content-Type": "application/xml"},
+        cookies={},
+        auth=(token["user"], token["pass"]),
+    )
+    if "Location" not in res.headers:
+        raise Exception(
+            f"Error: unable to create an upload - {res.status_code} - {res.content}"
+        )
+
+    return res.headers["Location"]
+
+
+def add_sourcedocument(
+    upload_url_id,
+    payload,
+    filename=None,
+    token=None,
+    user=None,
+    password=None,
+    project_id=None,
+    demo=False,
+    session=None,
+    retry_policy=None,
+):
+    """
+    Add a source document to an upload (step 2 of a delivery).
+
+    Parameters
+    ----------
+    upload_url_id : string
+        url of the upload, as returned by `create_upload`
+    payload : string, bytes, path or binary file
+        XML of the request. A path is opened in binary mode and a file is
+        streamed, so the document is never read into memory as a whole.
+    filename : string, optional
+        filename of the source document in the upload
+    token : dictionary
+        dictionary with authentication data. keys:
+            - user
+            - pass
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+
+    Returns
+    -------
+    Request response.
+
+    """
+    token = check_input(
+        token=token, user=user, password=password, project_id=project_id, demo=demo
+    )
+    http = RetryingHttp(session, retry_policy)
+    if isinstance(payload, os.PathLike):
+        with open(payload, "rb") as file:
+            return add_sourcedocument(
+                upload_url_id,
+                file,
+                filename=filename,
+                token=token,
+                project_id=project_id,
+                demo=demo,
+                session=session,
+                retry_policy=retry_policy,
+            )
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    params = {} if filename is None else {"filename": filename}
+
+    res = http.post(
+        upload_url_id + "/brondocumenten",
+        data=payload,
+        headers={"Content-type": "application/xml"},
+        cookies={},
+        auth=(token["user"], token["pass"]),
+        params=params,
+    )
+    res.raise_for_status()
+
+    return res
+
+
+def add_sourcedocuments(
+    upload_url_id,
+    reqs,
+    token=None,
+    user=None,
+    password=None,
+    project_id=None,
+    demo=False,
+    session=None,
+    retry_policy=None,
+    max_workers=4,
+    with_filename=True,
+    on_added=None,
+    on_failed=None,
+):
+    """
+    Add multiple source documents to an upload concurrently.
+
+    Each document is posted with `add_sourcedocument` in a thread pool, and
+    retried according to the retry policy.
+
+    Parameters
+    ----------
+    upload_url_id : string
+        url of the upload, as returned by `create_upload`
+    reqs : dictionary
+        dictionary containing:
+            keys: filenames
+            values: XML strings containing the requests, or paths of
+                    XML files (see `add_sourcedocument`). The documents
+                    are posted in this order.
+    token : dictionary
+        dictionary with authentication data. keys:
+            - user
+            - pass
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    max_workers : int
+        maximum number of documents posted at the same time
+    with_filename : Bool
+        Defaults to True. If true, the filename is sent along with each document
+    on_added : callable, optional
+        called as `on_added(filename, response)` from the worker thread as
+        soon as a document was added, e.g. to journal it
+    on_failed : callable, optional
+        called as `on_failed(filename, exception)` from the worker thread
+        when adding a document failed
+
+    Returns
+    -------
+    responses: dictionary
+        response per filename, in the order of reqs
+
+    """
+    token = check_input(
+        token=token, user=user, password=password, project_id=project_id, demo=demo
+    )
+
+    def add(filename):
+        try:
+            res = add_sourcedocument(
+                upload_url_id,
+                reqs[filename],
+                filename=filename if with_filename else None,
+                token=token,
+                project_id=project_id,
+                demo=demo,
+                session=session,
+                retry_policy=retry_policy,
+            )
+        except Exception as e:
+            if on_failed is not None:
+                on_failed(filename, e)
+            raise
+        if on_added is not None:
+            on_added(filename, res)
+        return res
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {filename: executor.submit(add, filename) for filename in reqs}
+
+    responses = {}
+    errors = {}
+    for filename, future in futures.items():
+        try:
+            responses[filename] = future.result()
+        except Exception as e:
+            errors[filename] = e
+    if errors:
+        raise Exception(
+            f"Error: Cannot add source documents to upload: {list(errors)}"
+        ) from next(iter(errors.values()))
+
+    return responses
+
+
+def create_delivery(
+    upload_url_id,
+    token=None,
+    user=None,
+    password=None,
+    project_id=None,
+    demo=False,
+    session=None,
+    retry_policy=None,
+    base_url=None,
+):
+    """
+    Deliver an upload (step 3 of a delivery).
+
+    Parameters
+    ----------
+    upload_url_id : string
+        url of the upload, as returned by `create_upload`
+    token : dictionary
+        dictionary with authentication data. keys:
+            - user
+            - pass
+    project_id:
+        id of the project
+    demo : Bool
+        Defaults to False. If true, the test environment
+        of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
+
+    Returns
+    -------
+    Request response with the delivery info.
+
+    """
+    token = check_input(
+        token=token, user=user, password=password, project_id=project_id, demo=demo
+    )
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
+    upload_id = upload_url_id.split("/")[-1]
+    delivery_url = base_url + f"/{project_id}/leveringen"
+
+    endresponse = http.post(
+        delivery_url,
+        data=json.dumps({"upload": int(upload_id)}),
+        headers={"Content-type": "application/json"},
+        cookies={},
+        auth=(token["user"], token["pass"]),
+    )
+    endresponse.raise_for_status()
+
+    delivery = http.get(
+        url=endresponse.headers["Location"],
+        auth=(token["user"], token["pass"]),
+    )
     return delivery
 
 
@@ -515,6 +1009,9 @@ def check_delivery_status(
     password=None,
     project_id=None,
     demo=False,
+    session=None,
+    retry_policy=None,
+    base_url=None,
 ):
     """
 
@@ -529,6 +1026,14 @@ def check_delivery_status(
     demo : Bool
         Defaults to False. If true, the test environment
         of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
 
     Returns
     -------
@@ -546,11 +1051,12 @@ def check_delivery_status(
     )
 
     # Step 1: Create upload
-    base_url = get_base_url(demo)
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
     project_id = str(project_id)
     delivery_url_id = base_url + f"/{project_id}/leveringen/{identifier}"
 
-    delivery = requests.get(
+    delivery = http.get(
         url=delivery_url_id,
         auth=(token["user"], token["pass"]),
     )
@@ -564,6 +1070,9 @@ def get_sourcedocument(
     password=None,
     project_id=None,
     demo=False,
+    session=None,
+    retry_policy=None,
+    base_url=None,
 ):
     """
 
@@ -578,6 +1087,14 @@ def get_sourcedocument(
     demo : Bool
         Defaults to False. If true, the test environment
         of the bronhouderportaal is selected for data exchange
+    session : requests.Session, optional
+        Session used for the http requests, so connections can be reused.
+        Defaults to a new connection per request.
+    retry_policy : RetryPolicy, optional
+        Timeouts and retries of the http requests. Defaults to
+        `DEFAULT_RETRY_POLICY`.
+    base_url : string, optional
+        Api url to use instead of `get_base_url(demo)`, e.g. a local test server.
 
     Returns
     -------
@@ -595,11 +1112,12 @@ def get_sourcedocument(
     )
 
     # Step 1: Create upload
-    base_url = get_base_url(demo)
+    base_url = get_base_url(demo) if base_url is None else base_url
+    http = RetryingHttp(session, retry_policy)
     project_id = str(project_id)
     delivery_url_id = base_url + f"/{project_id}/brondocumenten/{identifier}"
 
-    delivery = requests.get(
+    delivery = http.get(
         url=delivery_url_id,
         auth=(token["user"], token["pass"]),
     )
@@ -0,0 +1,323 @@
+"""
+Local stand-in for the bronhouderportaal api, for integration and load tests.
+
+"""
+
+import base64
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from lxml import etree
+
+DELIVERY_STATUSES = ("AANGELEVERD", "GEVALIDEERD", "DOORGELEVERD")
+
+_ROUTES = [
+    ("POST", re.compile(r"/api/v2/(?P<project>[^/]+)/validatie"), "validatie"),
+    ("POST", re.compile(r"/api/v2/(?P<project>[^/]+)/uploads"), "uploads"),
+    (
+        "POST",
+        re.compile(r"/api/v2/(?P<project>[^/]+)/uploads/(?P<id>\d+)/brondocumenten"),
+        "brondocumenten",
+    ),
+    ("POST", re.compile(r"/api/v2/(?P<project>[^/]+)/leveringen"), "leveringen"),
+    ("GET", re.compile(r"/api/v2/(?P<project>[^/]+)/leveringen"), "deliveries"),
+    ("GET", re.compile(r"/api/v2/(?P<project>[^/]+)/leveringen/(?P<id>\d+)"), "status"),
+    (
+        "GET",
+        re.compile(r"/api/v2/(?P<project>[^/]+)/brondocumenten/(?P<id>\d+)"),
+        "brondocument",
+    ),
+]
+
+
+class FakeBronhouderportaal:
+    """
+    Local http server that answers like the bronhouderportaal api, so the
+    connector can be tested and benchmarked without the real portal.
+
+    The server implements validation, uploads, adding source documents,
+    deliveries, their list and status, and the source documents of a delivery.
+    Every request can be slowed down (`latency`), fail at random with a
+    retryable status (`error_rate`) or be refused with 429 and a Retry-After
+    header when it exceeds `rate_limit`. Injected failures happen before the
+    request is processed, so retrying them is safe.
+
+    >>> with FakeBronhouderportaal(latency=0.01, error_rate=0.05) as portal:
+    ...     client = BronhouderportaalClient(
+    ...         user="user", password="pass", project_id=1,
+    ...         base_url=portal.base_url,
+    ...     )
+    ...     client.deliver_requests(reqs)
+
+    The state of the server (`uploads`, `deliveries`, `documents`) and the
+    `stats` counters (requests per endpoint, `injected_errors`,
+    `rate_limited`) can be inspected from the test.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        error_rate=0.0,
+        error_status=503,
+        rate_limit=None,
+        credentials=None,
+        delivery_statuses=DELIVERY_STATUSES,
+        seed=None,
+    ):
+        """
+        Parameters
+        ----------
+        host : string
+            interface to listen on
+        port : int
+            port to listen on. Defaults to 0, a free port (see `base_url`)
+        latency : float or callable
+            delay in seconds before every response, or a function without
+            arguments that returns the delay, e.g. to draw it at random
+        error_rate : float
+            fraction of the requests that fail with `error_status`
+        error_status : int
+            status code of the injected failures
+        rate_limit : float, optional
+            maximum number of requests per second. Requests above the limit
+            get a 429 response with a Retry-After header. Defaults to no limit.
+        credentials : tuple, optional
+            (user, password) that must be sent as basic authentication.
+            Defaults to accepting any request.
+        delivery_statuses : tuple
+            statuses a delivery goes through, one per status request
+        seed : int, optional
+            seed of the random error injection
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.credentials = credentials
+        self.delivery_statuses = tuple(delivery_statuses)
+        self.random = random.Random(seed)
+
+        self.uploads = {}
+        self.deliveries = {}
+        self.documents = {}
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._allowance = rate_limit
+        self._last_check = time.monotonic()
+
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.portal = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """Api url of the server, to pass as `base_url` to the connector."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api/v2"
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _delay(self):
+        return self.latency() if callable(self.latency) else self.latency
+
+    def _retry_after(self):
+        """
+        Take a request from the token bucket of the rate limit. Return None
+        if it is allowed, else the seconds until it would be.
+        """
+        if self.rate_limit is None:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(
+                self.rate_limit,
+                self._allowance + (now - self._last_check) * self.rate_limit,
+            )
+            self._last_check = now
+            if self._allowance < 1:
+                return (1 - self._allowance) / self.rate_limit
+            self._allowance -= 1
+            return None
+
+    def _inject_error(self):
+        with self._lock:
+            return self.error_rate and self.random.random() < self.error_rate
+
+    def _authorized(self, header):
+        if self.credentials is None:
+            return True
+        expected = base64.b64encode(":".join(self.credentials).encode()).decode()
+        return header == f"Basic {expected}"
+
+    def handle(self, method, path, query, body, authorization):
+        """
+        Answer a request. Returns (status code, json body, headers).
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+
+        if not self._authorized(authorization):
+            return 401, {"message": "Unauthorized"}, {}
+
+        retry_after = self._retry_after()
+        if retry_after is not None:
+            with self._lock:
+                self.stats["rate_limited"] += 1
+            return (
+                429,
+                {"message": "Too Many Requests"},
+                {"Retry-After": f"{retry_after:.3f}"},
+            )
+        if self._inject_error():
+            with self._lock:
+                self.stats["injected_errors"] += 1
+            return self.error_status, {"message": "Injected error"}, {}
+
+        for route_method, pattern, endpoint in _ROUTES:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                with self._lock:
+                    self.stats[endpoint] += 1
+                    return getattr(self, f"_{endpoint}")(
+                        query, body, **match.groupdict()
+                    )
+        return 404, {"message": f"Unknown endpoint {method} {path}"}, {}
+
+    def _url(self, project, *parts):
+        return "/".join([self.base_url, project, *parts])
+
+    def _validatie(self, query, body, project):
+        try:
+            etree.fromstring(body)
+        except etree.XMLSyntaxError as e:
+            return 200, {"status": "NIET_VALIDE", "errors": [str(e)]}, {}
+        return 200, {"status": "VALIDE", "errors": []}, {}
+
+    def _uploads(self, query, body, project):
+        upload_id = len(self.uploads) + 1
+        self.uploads[upload_id] = []
+        location = self._url(project, "uploads", str(upload_id))
+        return 201, {"identifier": str(upload_id)}, {"Location": location}
+
+    def _brondocumenten(self, query, body, project, id):
+        upload_id = int(id)
+        if upload_id not in self.uploads:
+            return 404, {"message": f"Unknown upload {upload_id}"}, {}
+        document_id = len(self.documents) + 1
+        filename = query.get("filename", [f"{document_id}.xml"])[0]
+        self.documents[document_id] = {"filename": filename, "size": len(body)}
+        self.uploads[upload_id].append(document_id)
+        return 201, {"identifier": str(document_id), "filename": filename}, {}
+
+    def _leveringen(self, query, body, project):
+        try:
+            upload_id = int(json.loads(body)["upload"])
+        except (ValueError, KeyError, TypeError):
+            return 400, {"message": 'Expected {"upload": <id>}'}, {}
+        if not self.uploads.get(upload_id):
+            return 400, {"message": f"Upload {upload_id} has no source documents"}, {}
+        delivery_id = len(self.deliveries) + 1
+        self.deliveries[delivery_id] = {"upload": upload_id, "polls": 0}
+        location = self._url(project, "leveringen", str(delivery_id))
+        return 201, {"identifier": str(delivery_id)}, {"Location": location}
+
+    def _deliveries(self, query, body, project):
+        return (
+            200,
+            [
+                {"identifier": str(delivery_id), "upload": delivery["upload"]}
+                for delivery_id, delivery in self.deliveries.items()
+            ],
+            {},
+        )
+
+    def _status(self, query, body, project, id):
+        delivery = self.deliveries.get(int(id))
+        if delivery is None:
+            return 404, {"message": f"Unknown delivery {id}"}, {}
+        step = min(delivery["polls"], len(self.delivery_statuses) - 1)
+        delivery["polls"] += 1
+        documents = self.uploads[delivery["upload"]]
+        return (
+            200,
+            {
+                "identifier": id,
+                "status": self.delivery_statuses[step],
+                "upload": delivery["upload"],
+                "brondocuments": [
+                    {"identifier": str(document_id), **self.documents[document_id]}
+                    for document_id in documents
+                ],
+            },
+            {},
+        )
+
+    def _brondocument(self, query, body, project, id):
+        document = self.documents.get(int(id))
+        if document is None:
+            return 404, {"message": f"Unknown source document {id}"}, {}
+        return 200, {"identifier": id, **document}, {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        url = urlsplit(self.path)
+        status, content, headers = self.server.portal.handle(
+            self.command,
+            url.path.rstrip("/"),
+            parse_qs(url.query),
+            body,
+            self.headers.get("Authorization"),
+        )
+        payload = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
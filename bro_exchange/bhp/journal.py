@@ -0,0 +1,193 @@
+"""
+Crash-safe journal of bronhouderportaal deliveries in a SQLite file.
+
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    id INTEGER PRIMARY KEY,
+    batch_key TEXT NOT NULL,
+    upload_url TEXT NOT NULL,
+    state TEXT NOT NULL,
+    delivery_url TEXT,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS uploads_batch_key ON uploads (batch_key, state);
+CREATE TABLE IF NOT EXISTS documents (
+    upload_id INTEGER NOT NULL REFERENCES uploads (id),
+    filename TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    added REAL NOT NULL,
+    PRIMARY KEY (upload_id, filename)
+);
+CREATE INDEX IF NOT EXISTS documents_content_hash ON documents (content_hash);
+"""
+
+# Upload states, in order
+CREATED = "created"
+DELIVERING = "delivering"
+DELIVERED = "delivered"
+# The portal rejected the delivery of the upload, it isn't resumed
+FAILED = "failed"
+
+
+def content_hash(payload):
+    """Return the sha256 of a source document (str is hashed as utf-8)."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class DeliveryJournal:
+    """
+    Journal of the steps of bulk deliveries: created uploads, added source
+    documents (with the sha256 of their content) and created deliveries.
+
+    Every step is committed to the SQLite file before the next one starts,
+    so after a crash `upload_sourcedocs_from_dict(..., journal=journal)`
+    resumes the unfinished upload of the same documents instead of starting
+    over, and skips documents whose content was already delivered. An upload
+    whose delivery was requested before the crash is first looked up among
+    the deliveries on the portal, so it is not delivered twice.
+
+    The journal can be shared by the threads of one process.
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : string or path
+            SQLite file of the journal, created if missing
+        """
+        import sqlite3
+
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA synchronous = FULL")
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the SQLite connection."""
+        self._connection.close()
+
+    def _execute(self, sql, parameters=()):
+        with self._lock:
+            with self._connection:
+                return self._connection.execute(sql, parameters).fetchall()
+
+    @staticmethod
+    def batch_key(hashes):
+        """
+        Return the key of a set of documents, given as {filename: content hash}.
+        An unfinished upload is resumed for the same key.
+        """
+        lines = sorted(f"{filename}\n{digest}" for filename, digest in hashes.items())
+        return content_hash("\n".join(lines))
+
+    def is_delivered(self, digest):
+        """Return whether a document with this content hash was delivered."""
+        return bool(
+            self._execute(
+                "SELECT 1 FROM documents JOIN uploads ON uploads.id = upload_id "
+                "WHERE content_hash = ? AND state = ? LIMIT 1",
+                (digest, DELIVERED),
+            )
+        )
+
+    def unfinished_upload(self, batch_key):
+        """
+        Return the last upload of `batch_key` that wasn't delivered and whose
+        delivery wasn't rejected, as a dictionary with the keys `id`, `upload_url`, `state` and `documents`
+        ({filename: content hash} of the documents added), or None.
+        """
+        rows = self._execute(
+            "SELECT id, upload_url, state FROM uploads "
+            "WHERE batch_key = ? AND state NOT IN (?, ?) ORDER BY id DESC LIMIT 1",
+            (batch_key, DELIVERED, FAILED),
+        )
+        if not rows:
+            return None
+        upload_id, upload_url, state = rows[0]
+        documents = self._execute(
+            "SELECT filename, content_hash FROM documents WHERE upload_id = ?",
+            (upload_id,),
+        )
+        return {
+            "id": upload_id,
+            "upload_url": upload_url,
+            "state": state,
+            "documents": dict(documents),
+        }
+
+    def start_upload(self, batch_key, upload_url):
+        """Record a created upload and return its journal id."""
+        with self._lock:
+            with self._connection:
+                cursor = self._connection.execute(
+                    "INSERT INTO uploads (batch_key, upload_url, state, updated) "
+                    "VALUES (?, ?, ?, ?)",
+                    (batch_key, upload_url, CREATED, time.time()),
+                )
+                return cursor.lastrowid
+
+    def record_document(self, upload_id, filename, digest):
+        """Record a source document that was added to an upload."""
+        self._execute(
+            "INSERT OR REPLACE INTO documents "
+            "(upload_id, filename, content_hash, added) VALUES (?, ?, ?, ?)",
+            (upload_id, filename, digest, time.time()),
+        )
+
+    def _set_state(self, upload_id, state, delivery_url=None):
+        self._execute(
+            "UPDATE uploads SET state = ?, delivery_url = ?, updated = ? WHERE id = ?",
+            (state, delivery_url, time.time(), upload_id),
+        )
+
+    def start_delivery(self, upload_id):
+        """Record that all documents were added and the delivery is requested."""
+        self._set_state(upload_id, DELIVERING)
+
+    def record_delivery(self, upload_id, delivery_url):
+        """Record the created delivery of an upload."""
+        self._set_state(upload_id, DELIVERED, delivery_url)
+
+    def record_failure(self, upload_id):
+        """
+        Record that the portal rejected the delivery of an upload. The next
+        delivery of the same documents starts a new upload.
+        """
+        self._set_state(upload_id, FAILED)
+
+    def uploads(self):
+        """Return all journaled uploads as dictionaries, oldest first."""
+        rows = self._execute(
+            "SELECT uploads.id, upload_url, state, delivery_url, COUNT(filename) "
+            "FROM uploads LEFT JOIN documents ON uploads.id = upload_id "
+            "GROUP BY uploads.id ORDER BY uploads.id"
+        )
+        return [
+            {
+                "id": upload_id,
+                "upload_url": upload_url,
+                "state": state,
+                "delivery_url": delivery_url,
+                "documents": documents,
+            }
+            for upload_id, upload_url, state, delivery_url, documents in rows
+        ]
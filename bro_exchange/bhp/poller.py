@@ -0,0 +1,197 @@
+"""
+Poll the status of many deliveries (leveringen) on the bronhouderportaal.
+
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+TERMINAL_DELIVERY_STATUSES = ("DOORGELEVERD", "AFGEKEURD")
+
+
+def delivery_status(response):
+    """Return the status of a delivery response, or None if it has none."""
+    try:
+        return response.json()["status"]
+    except Exception:
+        return None
+
+
+def _is_client_error(response):
+    """
+    Return whether a status request failed in a way polling again won't
+    fix, e.g. 404 for an unknown delivery or 401 for wrong credentials.
+    """
+    status_code = getattr(response, "status_code", 200)
+    return 400 <= status_code < 500 and status_code not in (408, 429)
+
+
+class DeliveryPoller:
+    """
+    Poll a set of deliveries until each reaches a terminal status.
+
+    Every delivery is polled with its own interval. The interval starts at
+    `initial_interval`, is multiplied by `backoff` every time the status is
+    unchanged (up to `max_interval`) and is reset when the status changes.
+    At most `max_workers` status requests are in flight at the same time.
+    A delivery whose status request gets a client error response (4xx other
+    than 408 and 429) is done as well; it is yielded with that response.
+
+    Examples
+    --------
+    >>> with BronhouderportaalClient(token, project_id=1) as client:
+    ...     poller = DeliveryPoller(client, delivery_ids)
+    ...     for identifier, response in poller.poll():
+    ...         print(identifier, delivery_status(response))
+    """
+
+    def __init__(
+        self,
+        client,
+        identifiers=(),
+        max_workers=4,
+        initial_interval=2.0,
+        max_interval=60.0,
+        backoff=1.5,
+        terminal_statuses=TERMINAL_DELIVERY_STATUSES,
+        is_terminal=None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        """
+        Parameters
+        ----------
+        client : BronhouderportaalClient
+            client used for `check_delivery_status`
+        identifiers : iterable
+            delivery identifiers to poll
+        max_workers : int
+            maximum number of status requests in flight at the same time
+        initial_interval : float
+            seconds between the first polls of a delivery
+        max_interval : float
+            maximum number of seconds between polls of a delivery
+        backoff : float
+            factor the interval grows with while the status is unchanged
+        terminal_statuses : tuple
+            delivery statuses at which polling stops
+        is_terminal : callable, optional
+            function of the status response that returns True when polling
+            can stop. Overrules terminal_statuses.
+        clock : callable
+            function returning the current time in seconds
+        sleep : callable
+            function sleeping a number of seconds while no status request
+            is in flight
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.terminal_statuses = tuple(terminal_statuses)
+        self.is_terminal = (
+            self._has_terminal_status if is_terminal is None else is_terminal
+        )
+        self.clock = clock
+        self.sleep = sleep
+        self.polls = 0
+        self.errors = 0
+
+        # identifier: [next poll time, interval, last status]
+        self.pending = {}
+        for identifier in identifiers:
+            self.add(identifier)
+
+    def _has_terminal_status(self, response):
+        return delivery_status(response) in self.terminal_statuses
+
+    def add(self, identifier):
+        """Start tracking a delivery, also while `poll()` is running."""
+        if identifier not in self.pending:
+            self.pending[identifier] = [self.clock(), self.initial_interval, None]
+
+    def _reschedule(self, identifier, status):
+        schedule = self.pending[identifier]
+        if status is not None and status != schedule[2]:
+            interval = self.initial_interval
+        else:
+            interval = min(schedule[1] * self.backoff, self.max_interval)
+        schedule[:] = [self.clock() + interval, interval, status]
+
+    def poll(self, timeout=None):
+        """
+        Poll the deliveries, yielding them as they reach a terminal status
+        or get a client error response.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            maximum number of seconds to poll
+
+        Yields
+        ------
+        (identifier, response)
+            delivery identifier and its last status response
+
+        Raises
+        ------
+        TimeoutError
+            if deliveries are still pending after `timeout` seconds
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        in_flight = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while self.pending:
+                now = self.clock()
+                if deadline is not None and now >= deadline:
+                    for future in in_flight:
+                        future.cancel()
+                    raise TimeoutError(
+                        f"Deliveries still pending after {timeout} s: "
+                        f"{list(self.pending)}"
+                    )
+
+                polling = set(in_flight.values())
+                due = sorted(
+                    (schedule[0], identifier)
+                    for identifier, schedule in self.pending.items()
+                    if identifier not in polling and schedule[0] <= now
+                )
+                for _, identifier in due[: self.max_workers - len(in_flight)]:
+                    future = executor.submit(
+                        self.client.check_delivery_status, identifier
+                    )
+                    in_flight[future] = identifier
+                    self.polls += 1
+
+                waiting = [
+                    schedule[0]
+                    for identifier, schedule in self.pending.items()
+                    if identifier not in in_flight.values()
+                ]
+                wake = min(waiting, default=now + self.max_interval)
+                if deadline is not None:
+                    wake = min(wake, deadline)
+                if not in_flight:
+                    self.sleep(max(0.0, wake - now))
+                    continue
+                done, _ = wait(
+                    in_flight, timeout=max(0.0, wake - now), return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    identifier = in_flight.pop(future)
+                    try:
+                        response = future.result()
+                    except Exception:
+                        self.errors += 1
+                        self._reschedule(identifier, None)
+                        continue
+
+                    if self.is_terminal(response) or _is_client_error(response):
+                        del self.pending[identifier]
+                        yield identifier, response
+                    else:
+                        self._reschedule(identifier, delivery_status(response))
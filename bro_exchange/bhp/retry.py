@@ -0,0 +1,207 @@
+"""
+Retry policy and timeouts for the http calls to the bronhouderportaal.
+
+"""
+
+import email.utils
+import random
+import threading
+import time
+from collections import Counter
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+
+def _connection_not_made(error):
+    """Return True if the request certainly did not reach the server."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+
+
+def _retry_after(response):
+    """Return the Retry-After header of a response in seconds, or None."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Timeouts and retries with exponential backoff for bronhouderportaal calls.
+
+    Idempotent calls (GET, validation) are retried on connection errors,
+    timeouts and the `retry_statuses`. Calls that must not be executed twice
+    (creating an upload, adding a source document, creating a delivery) are
+    only retried when the server certainly did not process them: when no
+    connection could be made, or on a 429/503 response.
+
+    The counters (`requests`, `retries`, `errors`, `timeouts`,
+    `rate_limited`, `sleep_seconds` and `status_<code>`) are shared by all
+    calls that use the policy and can be used to tune throughput.
+    """
+
+    non_idempotent_statuses = (429, 503)
+
+    def __init__(
+        self,
+        retries=3,
+        backoff_factor=0.5,
+        max_backoff=30.0,
+        jitter=True,
+        timeout=(10, 60),
+        retry_statuses=(429, 500, 502, 503, 504),
+        max_retry_after=120.0,
+    ):
+        """
+        Parameters
+        ----------
+        retries : int
+            maximum number of retries per call
+        backoff_factor : float
+            delay before the first retry in seconds, doubled every retry
+        max_backoff : float
+            maximum backoff delay in seconds
+        jitter : Bool
+            Defaults to True. If true, a random part of the backoff delay is
+            used, so parallel clients don't retry at the same moment
+        timeout : float or tuple
+            (connect, read) timeout in seconds applied to every call
+        retry_statuses : tuple
+            response status codes that are retried
+        max_retry_after : float
+            maximum delay in seconds accepted from a Retry-After header
+        """
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.timeout = timeout
+        self.retry_statuses = tuple(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.counters = Counter()
+        self.sleep = time.sleep
+        self._lock = threading.Lock()
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def reset_counters(self):
+        """Reset all counters to zero."""
+        with self._lock:
+            self.counters.clear()
+
+    def backoff(self, attempt, response=None):
+        """Return the delay in seconds before retry number `attempt` (0-based)."""
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        if response is not None:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+    def _should_retry_status(self, status_code, idempotent):
+        if idempotent:
+            return status_code in self.retry_statuses
+        return status_code in self.non_idempotent_statuses
+
+    def _should_retry_error(self, error, idempotent):
+        if idempotent:
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+        return isinstance(error, requests.ConnectionError) and _connection_not_made(
+            error
+        )
+
+    def request(self, http, method, url, idempotent=True, **kwargs):
+        """
+        Send a request with the timeout and retries of this policy.
+
+        Parameters
+        ----------
+        http : requests module or requests.Session
+            used to send the request
+        method : string
+            http method
+        url : string
+            url of the request
+        idempotent : Bool
+            Defaults to True. If false, the request is only retried when the
+            server certainly did not process it
+        **kwargs :
+            arguments for `requests.request`
+
+        Returns
+        -------
+        Request response. After the last retry the response is returned
+        as is, also for a retryable status code. A file-like `data` body is
+        rewound before every retry.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+
+        data = kwargs.get("data")
+        start = data.tell() if hasattr(data, "seek") else None
+
+        attempt = 0
+        while True:
+            if attempt and start is not None:
+                data.seek(start)
+            self._count("requests")
+            try:
+                response = http.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                self._count("errors")
+                if isinstance(e, requests.Timeout):
+                    self._count("timeouts")
+                if attempt >= self.retries or not self._should_retry_error(
+                    e, idempotent
+                ):
+                    raise
+                delay = self.backoff(attempt)
+            else:
+                if response.status_code == 429:
+                    self._count("rate_limited")
+                if response.status_code >= 400:
+                    self._count(f"status_{response.status_code}")
+                if attempt >= self.retries or not self._should_retry_status(
+                    response.status_code, idempotent
+                ):
+                    return response
+                delay = self.backoff(attempt, response)
+
+            self._count("retries")
+            self._count("sleep_seconds", delay)
+            self.sleep(delay)
+            attempt += 1
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class RetryingHttp:
+    """`requests`-like get/post that send through a `RetryPolicy`."""
+
+    def __init__(self, session=None, policy=None):
+        self.http = requests if session is None else session
+        self.policy = DEFAULT_RETRY_POLICY if policy is None else policy
+
+    def get(self, url, **kwargs):
+        return self.policy.request(self.http, "GET", url, idempotent=True, **kwargs)
+
+    def post(self, url, idempotent=False, **kwargs):
+        return self.policy.request(
+            self.http, "POST", url, idempotent=idempotent, **kwargs
+        )
@@ -1,5 +1,176 @@
-from bro_exchange.broxml.gld import *
-from bro_exchange.broxml.gmn import *
-from bro_exchange.broxml.gmw import *
-from bro_exchange.broxml.frd import *
-from bro_exchange.broxml.mappings import *
+# The public names of the source document families and helpers are
+# re-exported lazily, see bro_exchange.lazy.
+from bro_exchange.lazy import lazy_star_imports as _lazy_star_imports
+
+# Module of every re-exported name, so that looking one up only loads that
+# module (and the family it belongs to)
+_LAZY_NAMES = {
+    "bro_exchange.broxml.batch": (
+        "DeliveryBatcher",
+        "REQUEST_ATTRIBUTES",
+        "deliver_many",
+        "generate_many",
+        "validate_many",
+    ),
+    "bro_exchange.broxml.frd.constructables": (
+        "add_measure_element",
+        "current_pair",
+        "electrode",
+        "measurement_configuration",
+        "measurement_pair",
+    ),
+    "bro_exchange.broxml.frd.requests": (
+        "EMMConfigurationTool",
+        "EMMMeasurementTool",
+        "FRDClosureTool",
+        "FRDRequest",
+        "FRDStartRegistrationTool",
+        "GEMConfigurationTool",
+        "GEMMeasurementTool",
+    ),
+    "bro_exchange.broxml.gld.constructables": (
+        "gen_groundwatermonitoringnet",
+        "gen_metadata",
+        "gen_metadata_parameters",
+        "gen_monitoringpoint",
+        "gen_phenomenontime",
+        "gen_point",
+        "gen_point_metadata",
+        "gen_point_metadata_qualifiers",
+        "gen_point_template",
+        "gen_points",
+        "gen_points_xml",
+        "gen_procedure",
+        "gen_procedure_parameters",
+        "gen_result",
+        "gen_resulttime",
+        "gen_tvp_metadata",
+    ),
+    "bro_exchange.broxml.gld.requests": (
+        "gen_gld_addition_requests",
+        "get_supported_gld_srcdocs",
+        "gld_delete_request",
+        "gld_registration_request",
+        "gld_replace_request",
+        "write_gld_addition_request",
+    ),
+    "bro_exchange.broxml.gld.sourcedocs": (
+        "gen_gld_addition",
+        "gen_gld_startregistration",
+    ),
+    "bro_exchange.broxml.gld.timeseries": (
+        "GldTimeseries",
+        "RECORD_FIELDS",
+        "TABLE_COLUMNS",
+        "coerce_timeseries",
+    ),
+    "bro_exchange.broxml.gmn.constructables": (
+        "MEASURINGPOINT_ARGS",
+        "gen_enddate",
+        "gen_measuringpoint",
+        "gen_measuringpoint_element",
+        "gen_measuringpoints",
+        "gen_startdatemonitoring",
+    ),
+    "bro_exchange.broxml.gmn.requests": (
+        "get_supported_gmn_srcdocs",
+        "gmn_registration_request",
+        "gmn_replace_request",
+    ),
+    "bro_exchange.broxml.gmn.sourcedocs": (
+        "gen_gmn_closure",
+        "gen_gmn_measuringpoint",
+        "gen_gmn_measuringpoint_enddate",
+        "gen_gmn_startregistartion",
+    ),
+    "bro_exchange.broxml.gmw.constructables": (
+        "adjust_electrode",
+        "gen_deliveredlocation",
+        "gen_deliveredverticalposition",
+        "gen_electrode",
+        "gen_eventdate",
+        "gen_geoohmcable",
+        "gen_materialused",
+        "gen_monitoringtube",
+        "gen_plaintubepart",
+        "gen_removaldate",
+        "gen_screen",
+        "gen_sedimentsump",
+        "gen_wellconstructiondate",
+        "normalize_gmw_srcdocdata",
+    ),
+    "bro_exchange.broxml.gmw.requests": (
+        "get_supported_gmw_srcdocs",
+        "gmw_delete_request",
+        "gmw_insert_request",
+        "gmw_move_request",
+        "gmw_registration_request",
+        "gmw_replace_request",
+    ),
+    "bro_exchange.broxml.gmw.sourcedocs": (
+        "gen_gmw_construction",
+        "gen_gmw_constructionwithhistory",
+        "gen_gmw_electrodestatus",
+        "gen_gmw_groundlevel",
+        "gen_gmw_groundlevelmeasuring",
+        "gen_gmw_insertion",
+        "gen_gmw_lengthening_shortening",
+        "gen_gmw_maintainer",
+        "gen_gmw_owner",
+        "gen_gmw_positions",
+        "gen_gmw_positionsmeasuring",
+        "gen_gmw_removal",
+        "gen_gmw_shift",
+        "gen_gmw_tubestatus",
+        "gen_gmw_wellheadprotector",
+    ),
+    "bro_exchange.broxml.mappings": (
+        "codespace_map_gld1",
+        "codespace_map_gmn1",
+        "codespace_map_gmw1",
+        "frd_namespaces",
+        "frd_nsmap",
+        "ns_gml",
+        "ns_isfrd",
+        "ns_regreq_map_gld1",
+        "ns_regreq_map_gld2",
+        "ns_regreq_map_gld3",
+        "ns_regreq_map_gmn1",
+        "ns_regreq_map_gmn2",
+        "ns_regreq_map_gmw1",
+        "xsi_regreq_map_gld1",
+        "xsi_regreq_map_gmn1",
+    ),
+    "bro_exchange.broxml.request_helpers": (
+        "check_required_kwargs",
+        "coerce_list_of_mapping_like",
+        "coerce_mapping_like",
+        "coerce_srcdocdata",
+        "has_value",
+        "normalize_optional_kwargs",
+        "normalize_srcdocdata",
+    ),
+    "bro_exchange.broxml.tags": ("qualified_names",),
+    "bro_exchange.broxml.xsd": (
+        "SCHEMA_HOST",
+        "XSD_DIR_ENV",
+        "XsdValidator",
+        "schema_url",
+        "validate_xsd",
+    ),
+    "bro_exchange.checks": ("check_missing_args",),
+}
+
+__getattr__, __dir__ = _lazy_star_imports(
+    __name__,
+    [
+        "bro_exchange.broxml.gld",
+        "bro_exchange.broxml.gmn",
+        "bro_exchange.broxml.gmw",
+        "bro_exchange.broxml.frd",
+        "bro_exchange.broxml.mappings",
+        "bro_exchange.broxml.batch",
+        "bro_exchange.broxml.xsd",
+    ],
+    _LAZY_NAMES,
+)
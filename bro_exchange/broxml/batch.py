@@ -0,0 +1,452 @@
+"""Batch operations on request objects.
+
+`generate_many` generates requests over a process pool. `validate_many`
+accepts any mix of generated GLD, GMW, GMN and FRD request objects
+(anything with the `REQUEST_ATTRIBUTES`) and talks to the bronhouderportaal
+through one pooled `BronhouderportaalClient`. `DeliveryBatcher` and
+`deliver_many` deliver validated request objects as multi-document uploads.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+# Attributes every request object has, see e.g. `gmn_registration_request`
+REQUEST_ATTRIBUTES = (
+    "request",
+    "requestreference",
+    "validation_info",
+    "delivery_info",
+    "delivery_id",
+)
+
+
+def _check_request(request: Any, delivering: bool = False) -> None:
+    """
+    Raise an exception for objects that aren't request objects, and when
+    `delivering` for requests without a request reference (used as the
+    filename in the upload).
+    """
+
+    missing = [name for name in REQUEST_ATTRIBUTES if not hasattr(request, name)]
+    if missing:
+        raise Exception(
+            f"Unsupported request object {type(request).__name__}, "
+            f"it has no {', '.join(missing)}"
+        )
+    if delivering and request.requestreference is None:
+        raise Exception(
+            f"Request object {type(request).__name__} has no request reference"
+        )
+
+
+def _open_client(client: Any, auth: dict[str, Any]) -> tuple[Any, bool]:
+    """Return the client to use and whether it was created here."""
+
+    if client is not None:
+        return client, False
+    from bro_exchange.bhp.client import BronhouderportaalClient
+
+    return BronhouderportaalClient(**auth), True
+
+
+def validate_many(
+    requests: list[Any],
+    client: Any = None,
+    max_workers: int = 8,
+    token: dict[str, str] | None = None,
+    user: str | None = None,
+    password: str | None = None,
+    project_id: Any = None,
+    demo: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Validate generated requests concurrently.
+
+    `validation_info` and `validation_status` are filled in on each request,
+    exactly like `request.validate()` does. A request whose validation call
+    fails keeps its previous validation attributes; the error is reported in
+    the summary.
+
+    Parameters
+    ----------
+    requests : list
+        generated request objects
+    client : BronhouderportaalClient, optional
+        client to validate with. If not given, a client is created from the
+        authentication arguments and closed afterwards.
+    max_workers : int
+        maximum number of validations in flight at the same time
+    token, user, password, project_id, demo :
+        authentication, used when no client is given
+
+    Returns
+    -------
+    list of dict
+        summary row per request, in input order, with the keys
+        `requestReference`, `type`, `status`, `errors` (number of
+        validation errors) and `exception`. Use
+        `pandas.DataFrame(validate_many(...))` for a table.
+    """
+
+    requests = list(requests)
+    for request in requests:
+        _check_request(request)
+        if request.request is None:
+            raise Exception(f"Request {request.requestreference} isn't generated yet")
+
+    client, owned = _open_client(
+        client,
+        {
+            "token": token,
+            "user": user,
+            "password": password,
+            "project_id": project_id,
+            "demo": demo,
+        },
+    )
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(client.validate_request, request.request)
+                for request in requests
+            ]
+
+            summary = []
+            for request, future in zip(requests, futures):
+                row = {
+                    "requestReference": request.requestreference,
+                    "type": type(request).__name__,
+                    "status": None,
+                    "errors": None,
+                    "exception": None,
+                }
+                try:
+                    request.validation_info = future.result()
+                except Exception as e:
+                    row["exception"] = repr(e)
+                    summary.append(row)
+                    continue
+
+                info = request.validation_info
+                if isinstance(info, dict):
+                    if "status" in info:
+                        request.validation_status = info["status"]
+                    row["status"] = info.get("status")
+                    row["errors"] = len(info.get("errors") or [])
+                summary.append(row)
+    finally:
+        if owned:
+            client.close()
+
+    return summary
+
+
+class DeliveryBatcher:
+    """
+    Deliver validated request objects as multi-document uploads.
+
+    `request.deliver()` creates an upload per request, so every document
+    costs its own create upload, add source document, create delivery and
+    get delivery round trips. The batcher collects requests with `add()`
+    and delivers them together, starting a new upload when the next
+    request would exceed `max_documents` or `max_bytes`. After a delivery,
+    `delivery_info` and `delivery_id` are filled in on every request of the
+    upload, exactly like `request.deliver()` does.
+
+    Used as a context manager, the remaining requests are delivered on exit
+    and a client created by the batcher is closed.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        max_documents: int = 100,
+        max_bytes: int | None = None,
+        max_workers: int = 4,
+        raise_errors: bool = True,
+        token: dict[str, str] | None = None,
+        user: str | None = None,
+        password: str | None = None,
+        project_id: Any = None,
+        demo: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        client : BronhouderportaalClient, optional
+            client to deliver with. If not given, a client is created from
+            the authentication arguments and closed by `close()`.
+        max_documents : int
+            maximum number of source documents per upload
+        max_bytes : int, optional
+            maximum total size of the source documents per upload. A single
+            request that is larger is delivered in an upload of its own.
+        max_workers : int
+            maximum number of source documents posted at the same time
+        raise_errors : Bool
+            Defaults to True. If false, a failed upload is only recorded in
+            `deliveries` and the batcher continues with the next one.
+        token, user, password, project_id, demo :
+            authentication, used when no client is given
+        """
+
+        if max_documents < 1:
+            raise Exception("max_documents should be at least 1")
+
+        self.client, self._owned = _open_client(
+            client,
+            {
+                "token": token,
+                "user": user,
+                "password": password,
+                "project_id": project_id,
+                "demo": demo,
+            },
+        )
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.raise_errors = raise_errors
+
+        self.pending: list[Any] = []
+        self._pending_bytes = 0
+        self.deliveries: list[dict[str, Any]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the client if the batcher created it."""
+
+        if self._owned:
+            self.client.close()
+
+    def add(self, request: Any) -> None:
+        """
+        Add a validated request, delivering the pending requests first when
+        the upload would exceed its limits.
+        """
+
+        _check_request(request, delivering=True)
+        if request.delivery_id is not None:
+            raise Exception(
+                f"Request {request.requestreference} has already been delivered"
+            )
+        if getattr(request, "validation_status", None) != "VALIDE":
+            raise Exception(f"Request {request.requestreference} isn't valid")
+
+        size = len(request.request)
+        references = {pending.requestreference for pending in self.pending}
+        if self.pending and (
+            len(self.pending) >= self.max_documents
+            or (
+                self.max_bytes is not None
+                and self._pending_bytes + size > self.max_bytes
+            )
+            # Filenames in an upload have to be unique
+            or request.requestreference in references
+        ):
+            self.flush()
+
+        self.pending.append(request)
+        self._pending_bytes += size
+
+    def flush(self) -> Any:
+        """
+        Deliver the pending requests in one upload.
+
+        Returns
+        -------
+        Request response with the delivery info, or None if nothing was
+        delivered.
+
+        Raises
+        ------
+        Exception
+            If the upload or delivery failed and `raise_errors` is set. The
+            requests of a failed upload keep `delivery_id` None, so they can
+            be added again.
+        """
+
+        if not self.pending:
+            return None
+
+        requests, self.pending, self._pending_bytes = self.pending, [], 0
+        reqs = {request.requestreference: request.request for request in requests}
+        record = {
+            "requestReferences": list(reqs),
+            "upload": None,
+            "delivery_id": None,
+            "exception": None,
+        }
+        self.deliveries.append(record)
+
+        try:
+            record["upload"] = self.client.create_upload()
+            self.client.add_sourcedocuments(
+                record["upload"], reqs, max_workers=self.max_workers
+            )
+            delivery = self.client.create_delivery(record["upload"])
+        except Exception as e:
+            record["exception"] = repr(e)
+            if not self.raise_errors:
+                return None
+            raise Exception(
+                f"Error: failed to deliver requests {list(reqs)} - {e}"
+            ) from e
+
+        try:
+            record["delivery_id"] = delivery.json()["identifier"]
+        except Exception:
+            pass
+        for request in requests:
+            request.delivery_info = delivery
+            request.delivery_id = record["delivery_id"]
+
+        return delivery
+
+
+def deliver_many(
+    requests: list[Any],
+    client: Any = None,
+    max_documents: int = 100,
+    max_bytes: int | None = None,
+    max_workers: int = 4,
+    token: dict[str, str] | None = None,
+    user: str | None = None,
+    password: str | None = None,
+    project_id: Any = None,
+    demo: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Deliver validated requests as multi-document uploads.
+
+    See `DeliveryBatcher` for the parameters. All requests are checked
+    before the first upload; a failed upload doesn't stop the next ones.
+
+    Returns
+    -------
+    list of dict
+        row per upload, in delivery order, with the keys
+        `requestReferences`, `upload` (url), `delivery_id` and `exception`.
+    """
+
+    requests = list(requests)
+    for request in requests:
+        _check_request(request, delivering=True)
+        if request.delivery_id is not None:
+            raise Exception(
+                f"Request {request.requestreference} has already been delivered"
+            )
+        if getattr(request, "validation_status", None) != "VALIDE":
+            raise Exception(f"Request {request.requestreference} isn't valid")
+
+    with DeliveryBatcher(
+        client,
+        max_documents=max_documents,
+        max_bytes=max_bytes,
+        max_workers=max_workers,
+        raise_errors=False,
+        token=token,
+        user=user,
+        password=password,
+        project_id=project_id,
+        demo=demo,
+    ) as batcher:
+        for request in requests:
+            batcher.add(request)
+
+    return batcher.deliveries
+
+
+def _generate_job(
+    request_class: type, job: tuple[str, dict[str, Any]], output_dir: str | None
+) -> dict[str, Any]:
+    """Generate one request in a worker process, capturing any error."""
+
+    srcdoc, kwargs = job
+    result = {
+        "requestReference": kwargs.get("requestReference"),
+        "request": None,
+        "file": None,
+        "error": None,
+    }
+    try:
+        request = request_class(srcdoc, **kwargs)
+        request.generate()
+        if output_dir is None:
+            result["request"] = request.request
+        else:
+            path = os.path.join(output_dir, f"{request.requestreference}.xml")
+            with open(path, "wb") as file:
+                file.write(request.request)
+            result["file"] = path
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def generate_many(
+    jobs: Any,
+    request_class: type | None = None,
+    max_workers: int | None = None,
+    output_dir: Any = None,
+    chunksize: int = 16,
+) -> list[dict[str, Any]]:
+    """
+    Generate many requests in parallel over a process pool.
+
+    The requests are serialized in the worker processes, only the bytes
+    (or the written filename) are sent back, because lxml trees can't be
+    pickled.
+
+    Parameters
+    ----------
+    jobs : iterable of (srcdoc, kwargs)
+        srcdoc and keyword arguments of each request, e.g.
+        `("GMW_Construction", {"requestReference": ..., "srcdocdata": ...})`
+    request_class : type, optional
+        request class to generate with. Defaults to `gmw_registration_request`.
+    max_workers : int, optional
+        number of worker processes. Defaults to the number of processors.
+    output_dir : string or path, optional
+        if given, every request is written to `<requestReference>.xml` in
+        this directory instead of being returned
+    chunksize : int
+        number of jobs sent to a worker process at a time
+
+    Returns
+    -------
+    list of dict
+        result per job, in input order, with the keys `requestReference`,
+        `request` (bytes), `file` and `error` (None if generated).
+    """
+
+    if request_class is None:
+        from bro_exchange.broxml.gmw.requests import gmw_registration_request
+
+        request_class = gmw_registration_request
+    if output_dir is not None:
+        output_dir = os.fspath(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+
+    jobs = list(jobs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                _generate_job,
+                [request_class] * len(jobs),
+                jobs,
+                [output_dir] * len(jobs),
+                chunksize=chunksize,
+            )
+        )
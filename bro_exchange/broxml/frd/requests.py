@@ -16,10 +16,35 @@ class FRDRequest(ABC):
         self.xml_tree = None
         self.source_document = None
         self.id_count = 1
+        self._request = None
+        self.validation_info = None
+        self.validation_status = None
+        self.delivery_info = None
+        self.delivery_id = None
+
+    @property
+    def requestreference(self):
+        """The request reference from the metadata, or None."""
+        return self.metadata.get("request_reference")
+
+    @property
+    def request(self):
+        """ The generated request as XML bytes, or None if it isn't generated
+        yet. Serialized on first use, like `request` of the other request
+        classes.
+        """
+        if not isinstance(self.xml_tree, etree._ElementTree):
+            return None
+        if self._request is None:
+            self._request = etree.tostring(
+                self.xml_tree, encoding="utf8", method="xml"
+            )
+        return self._request
 
     def generate_xml_file(self):
         """ Generates the XML file, based on the provide sourcedocsdata
         """
+        self._request = None
         self.setup_xml_tree()
         self.add_metadata()
 
@@ -97,6 +122,56 @@ class FRDRequest(ABC):
         """Creates the sourcedocs XML structure."""
         pass
 
+    def validate(
+        self,
+        token=None,
+        user=None,
+        password=None,
+        project_id=None,
+        demo=False,
+    ):
+        if self.request is None:
+            raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
+        self.validation_info = validate_request(
+            self.request, token, user, password, project_id, demo
+        )
+        try:
+            self.validation_status = self.validation_info["status"]
+        except (KeyError, TypeError):
+            pass
+
+    def deliver(
+        self,
+        token=None,
+        user=None,
+        password=None,
+        project_id=None,
+        demo=False,
+    ):
+        if self.delivery_id is not None:
+            raise Exception("Request has already been delivered")
+        if self.validation_status is None:
+            raise Exception("Request isn't validated")
+        if self.validation_status != "VALIDE":
+            raise Exception("Request isn't valid")
+        if self.requestreference is None:
+            raise Exception("Request has no request_reference in its metadata")
+
+        reqs = {self.requestreference: self.request}
+
+        from bro_exchange.bhp.connector import deliver_requests
+
+        self.delivery_info = deliver_requests(
+            reqs, token, user, password, project_id, demo
+        )
+
+        try:
+            self.delivery_id = self.delivery_info.json()["identifier"]
+        except Exception:
+            pass
+
 
 class FRDStartRegistrationTool(FRDRequest):
     """ Handles the requests for startregistration of a FRD.
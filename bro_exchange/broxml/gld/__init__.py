@@ -1,3 +1,4 @@
 from bro_exchange.broxml.gld.constructables import *
 from bro_exchange.broxml.gld.requests import *
 from bro_exchange.broxml.gld.sourcedocs import *
+from bro_exchange.broxml.gld.timeseries import *
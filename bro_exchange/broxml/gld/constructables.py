@@ -1,8 +1,9 @@
+import copy
 import datetime
-import pytz
+import os
+import re
 import uuid as uuid_gen
 
-import pandas as pd
 from lxml import etree
 
 from bro_exchange.broxml.request_helpers import (
@@ -10,11 +11,14 @@ from bro_exchange.broxml.request_helpers import (
     coerce_mapping_like,
     coerce_srcdocdata,
 )
+from bro_exchange.broxml.tags import qualified_names
 from bro_exchange.checks import check_missing_args
 from bro_exchange.broxml.mappings import (  # mappings
     codespace_map_gld1,
 )
 
+from .timeseries import GldTimeseries, coerce_timeseries
+
 # =============================================================================
 # General info
 # =============================================================================
@@ -30,6 +34,7 @@ from bro_exchange.broxml.mappings import (  # mappings
 
 
 def gen_groundwatermonitoringnet(data, net, nsmap, count):
+    names = qualified_names(nsmap)
     data = coerce_srcdocdata(data)
     data["groundwaterMonitoringNets"] = coerce_list_of_mapping_like(
         data["groundwaterMonitoringNets"], "groundwaterMonitoringNets"
@@ -47,16 +52,13 @@ def gen_groundwatermonitoringnet(data, net, nsmap, count):
 
     GroundwaterMonitoringNet = etree.SubElement(
         groundwaterMonitoringNet,
-        ("{%s}" % nsmap["gldcom"]) + "GroundwaterMonitoringNet",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["gml"]) + "id": f"id_000{str(count)}"},
+        names["gldcom", "GroundwaterMonitoringNet"],
+        attrib={names["gml", "id"]: f"id_000{str(count)}"},
     )
 
     count += 1
 
-    broId = etree.SubElement(
-        GroundwaterMonitoringNet, ("{%s}" % nsmap["gldcom"]) + "broId", nsmap=nsmap
-    )
+    broId = etree.SubElement(GroundwaterMonitoringNet, names["gldcom", "broId"])
     broId.text = data["groundwaterMonitoringNets"][net]["broId"]
 
     return (groundwaterMonitoringNet, count)
@@ -66,6 +68,7 @@ def gen_groundwatermonitoringnet(data, net, nsmap, count):
 
 
 def gen_monitoringpoint(data, point, nsmap, count):
+    names = qualified_names(nsmap)
     data = coerce_srcdocdata(data)
     data["monitoringPoints"] = coerce_list_of_mapping_like(
         data["monitoringPoints"], "monitoringPoints"
@@ -83,22 +86,18 @@ def gen_monitoringpoint(data, point, nsmap, count):
 
     GroundwaterMonitoringTube = etree.SubElement(
         monitoringPoint,
-        ("{%s}" % nsmap["gldcom"]) + "GroundwaterMonitoringTube",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["gml"]) + "id": f"id_000{str(count)}"},
+        names["gldcom", "GroundwaterMonitoringTube"],
+        attrib={names["gml", "id"]: f"id_000{str(count)}"},
     )
 
     count += 1
 
-    broId = etree.SubElement(
-        GroundwaterMonitoringTube, ("{%s}" % nsmap["gldcom"]) + "broId", nsmap=nsmap
-    )
+    broId = etree.SubElement(GroundwaterMonitoringTube, names["gldcom", "broId"])
     broId.text = data["monitoringPoints"][point]["broId"]
 
     tubeNumber = etree.SubElement(
         GroundwaterMonitoringTube,
-        ("{%s}" % nsmap["gldcom"]) + "tubeNumber",
-        nsmap=nsmap,
+        names["gldcom", "tubeNumber"],
     )
     tubeNumber.text = str(data["monitoringPoints"][point]["tubeNumber"])
 
@@ -115,6 +114,7 @@ def gen_monitoringpoint(data, point, nsmap, count):
 
 
 def gen_metadata_parameters(data, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     data = coerce_srcdocdata(data)
     data["metadata"] = coerce_mapping_like(data["metadata"], "metadata")
     data["metadata"]["parameters"] = coerce_mapping_like(
@@ -132,37 +132,27 @@ def gen_metadata_parameters(data, nsmap, codespacemap):
     parameters = list(data["metadata"]["parameters"].keys())
 
     # principal investigator
-    parameterlist["principalInvestigator"] = etree.Element(
-        ("{%s}" % nsmap["wml2"]) + "parameter", nsmap=nsmap
-    )
+    parameterlist["principalInvestigator"] = names.element("wml2", "parameter")
     principalInvestigator_namevalue = etree.SubElement(
         parameterlist["principalInvestigator"],
-        ("{%s}" % nsmap["om"]) + "NamedValue",
-        nsmap=nsmap,
+        names["om", "NamedValue"],
     )
     principalInvestigator_omname = etree.SubElement(
         principalInvestigator_namevalue,
-        ("{%s}" % nsmap["om"]) + "name",
-        nsmap=nsmap,
-        attrib={
-            ("{%s}" % nsmap["xlink"]) + "href": codespace_map_gld1[
-                "principalInvestigator"
-            ]
-        },
+        names["om", "name"],
+        attrib={names["xlink", "href"]: codespace_map_gld1["principalInvestigator"]},
     )
 
     principalInvestigator_omvalue = etree.SubElement(
         principalInvestigator_namevalue,
-        ("{%s}" % nsmap["om"]) + "value",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["xsi"]) + "type": "gldcom:OrganizationType"},
+        names["om", "value"],
+        attrib={names["xsi", "type"]: "gldcom:OrganizationType"},
     )
     if "principalInvestigator" in parameters:
         if type(data["metadata"]["parameters"]["principalInvestigator"]) != dict:
             chamberOfCommerceNumber = etree.SubElement(
                 principalInvestigator_omvalue,
-                ("{%s}" % nsmap["gldcom"]) + "chamberOfCommerceNumber",
-                nsmap=nsmap,
+                names["gldcom", "chamberOfCommerceNumber"],
             )
             chamberOfCommerceNumber.text = str(
                 data["metadata"]["parameters"]["principalInvestigator"]
@@ -173,8 +163,7 @@ def gen_metadata_parameters(data, nsmap, codespacemap):
             ):
                 chamberOfCommerceNumber = etree.SubElement(
                     principalInvestigator_omvalue,
-                    ("{%s}" % nsmap["gldcom"]) + "chamberOfCommerceNumber",
-                    nsmap=nsmap,
+                    names["gldcom", "chamberOfCommerceNumber"],
                 )
                 chamberOfCommerceNumber.text = str(
                     data["metadata"]["parameters"]["principalInvestigator"][
@@ -186,8 +175,7 @@ def gen_metadata_parameters(data, nsmap, codespacemap):
             ):
                 europeanCompanyRegistrationNumber = etree.SubElement(
                     principalInvestigator_omvalue,
-                    ("{%s}" % nsmap["gldcom"]) + "europeanCompanyRegistrationNumber",
-                    nsmap=nsmap,
+                    names["gldcom", "europeanCompanyRegistrationNumber"],
                 )
                 europeanCompanyRegistrationNumber.text = str(
                     data["metadata"]["parameters"]["principalInvestigator"][
@@ -196,29 +184,22 @@ def gen_metadata_parameters(data, nsmap, codespacemap):
                 )
 
     # observation_type_metadata
-    parameterlist["observationType"] = etree.Element(
-        ("{%s}" % nsmap["wml2"]) + "parameter", nsmap=nsmap
-    )
+    parameterlist["observationType"] = names.element("wml2", "parameter")
     observationType_namevalue = etree.SubElement(
         parameterlist["observationType"],
-        ("{%s}" % nsmap["om"]) + "NamedValue",
-        nsmap=nsmap,
+        names["om", "NamedValue"],
     )
     observationType_omname = etree.SubElement(
         observationType_namevalue,
-        ("{%s}" % nsmap["om"]) + "name",
-        nsmap=nsmap,
-        attrib={
-            ("{%s}" % nsmap["xlink"]) + "href": codespace_map_gld1["observationType"]
-        },
+        names["om", "name"],
+        attrib={names["xlink", "href"]: codespace_map_gld1["observationType"]},
     )
 
     observationType_omvalue = etree.SubElement(
         observationType_namevalue,
-        ("{%s}" % nsmap["om"]) + "value",
-        nsmap=nsmap,
+        names["om", "value"],
         attrib={
-            ("{%s}" % nsmap["xsi"]) + "type": "gml:CodeWithAuthorityType",
+            names["xsi", "type"]: "gml:CodeWithAuthorityType",
             "codeSpace": codespace_map_gld1["ObservationType"],
         },
     )
@@ -232,6 +213,7 @@ def gen_metadata_parameters(data, nsmap, codespacemap):
 
 
 def gen_metadata(data, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     data = coerce_srcdocdata(data)
     data["metadata"] = coerce_mapping_like(data["metadata"], "metadata")
 
@@ -245,34 +227,27 @@ def gen_metadata(data, nsmap, codespacemap):
 
     check_missing_args(data["metadata"], arglist, "gen_monitoringpoint, metadata")
 
-    metadata = etree.Element(("{%s}" % nsmap["om"]) + "metadata", nsmap=nsmap)
+    metadata = names.element("om", "metadata")
 
     ObservationMetadata = etree.SubElement(
-        metadata, ("{%s}" % nsmap["wml2"]) + "ObservationMetadata", nsmap=nsmap
+        metadata, names["wml2", "ObservationMetadata"]
     )
 
     # Contact
-    contact = etree.SubElement(
-        ObservationMetadata, ("{%s}" % nsmap["gmd"]) + "contact", nsmap=nsmap
-    )
-    CI_ResponsibleParty = etree.SubElement(
-        contact, ("{%s}" % nsmap["gmd"]) + "CI_ResponsibleParty", nsmap=nsmap
-    )
+    contact = etree.SubElement(ObservationMetadata, names["gmd", "contact"])
+    CI_ResponsibleParty = etree.SubElement(contact, names["gmd", "CI_ResponsibleParty"])
     organisationName = etree.SubElement(
-        CI_ResponsibleParty, ("{%s}" % nsmap["gmd"]) + "organisationName", nsmap=nsmap
+        CI_ResponsibleParty, names["gmd", "organisationName"]
     )
     CharacterString = etree.SubElement(
-        organisationName, ("{%s}" % nsmap["gco"]) + "CharacterString", nsmap=nsmap
-    )
-    role = etree.SubElement(
-        CI_ResponsibleParty, ("{%s}" % nsmap["gmd"]) + "role", nsmap=nsmap
+        organisationName, names["gco", "CharacterString"]
     )
+    role = etree.SubElement(CI_ResponsibleParty, names["gmd", "role"])
 
     if "contact" in data["metadata"].keys():
         CI_RoleCode = etree.SubElement(
             role,
-            ("{%s}" % nsmap["gmd"]) + "CI_RoleCode",
-            nsmap=nsmap,
+            names["gmd", "CI_RoleCode"],
             codeList=codespacemap["codeList"],
             codeListValue=data["metadata"]["contact"],
         )
@@ -281,18 +256,15 @@ def gen_metadata(data, nsmap, codespacemap):
     else:
         CI_RoleCode = etree.SubElement(
             role,
-            ("{%s}" % nsmap["gmd"]) + "CI_RoleCode",
-            nsmap=nsmap,
+            names["gmd", "CI_RoleCode"],
             codeList=codespacemap["codeList"],
             codeListValue="principalInvestigator",
         )
         CI_RoleCode.text = "principalInvestigator "
 
     # Datestamp:
-    dateStamp = etree.SubElement(
-        ObservationMetadata, ("{%s}" % nsmap["gmd"]) + "dateStamp", nsmap=nsmap
-    )
-    Date = etree.SubElement(dateStamp, ("{%s}" % nsmap["gco"]) + "Date", nsmap=nsmap)
+    dateStamp = etree.SubElement(ObservationMetadata, names["gmd", "dateStamp"])
+    Date = etree.SubElement(dateStamp, names["gco", "Date"])
 
     if "dateStamp" in data["metadata"].keys():
         Date.text = data["metadata"]["dateStamp"]
@@ -303,20 +275,14 @@ def gen_metadata(data, nsmap, codespacemap):
     if "identificationInfo" in data["metadata"].keys():
         identificationInfo = etree.SubElement(
             ObservationMetadata,
-            ("{%s}" % nsmap["gmd"]) + "identificationInfo",
-            nsmap=nsmap,
-            attrib={
-                ("{%s}" % nsmap["gco"]) + "nilReason": data["metadata"][
-                    "identificationInfo"
-                ]
-            },
+            names["gmd", "identificationInfo"],
+            attrib={names["gco", "nilReason"]: data["metadata"]["identificationInfo"]},
         )
     else:
         identificationInfo = etree.SubElement(
             ObservationMetadata,
-            ("{%s}" % nsmap["gmd"]) + "identificationInfo",
-            nsmap=nsmap,
-            attrib={("{%s}" % nsmap["gco"]) + "nilReason": "unknown"},
+            names["gmd", "identificationInfo"],
+            attrib={names["gco", "nilReason"]: "unknown"},
         )
     # status
     if "status" in data["metadata"].keys():
@@ -324,12 +290,9 @@ def gen_metadata(data, nsmap, codespacemap):
             if data["metadata"]["parameters"]["observationType"] != "controlemeting":
                 status = etree.SubElement(
                     ObservationMetadata,
-                    ("{%s}" % nsmap["wml2"]) + "status",
-                    nsmap=nsmap,
+                    names["wml2", "status"],
                     attrib={
-                        ("{%s}" % nsmap["xlink"]) + "href": codespace_map_gld1[
-                            "StatusCode"
-                        ]
+                        names["xlink", "href"]: codespace_map_gld1["StatusCode"]
                         + ":{}".format(data["metadata"]["status"])
                     },
                 )
@@ -362,38 +325,36 @@ def gen_metadata(data, nsmap, codespacemap):
 
 
 def gen_phenomenontime(data, nsmap, codespacemap, count):
+    names = qualified_names(nsmap)
+    # Invalid results raise their own error
+    times = coerce_timeseries(data["result"]).time
     try:
-        beginPosition = str(pd.DataFrame(data["result"])["time"][0])[:10]
-        endPosition = str(
-            pd.DataFrame(data["result"])["time"][len(pd.DataFrame(data["result"])) - 1]
-        )
+        beginPosition = str(times[0])[:10]
+        endPosition = str(times[-1])
+        import pytz
+
         tz_info = pytz.timezone("Europe/Amsterdam")
-        endPosition = datetime.datetime.strptime(endPosition, "%Y-%m-%dT%H:%M:%S%z").astimezone(tz=tz_info)
+        endPosition = datetime.datetime.strptime(
+            endPosition, "%Y-%m-%dT%H:%M:%S%z"
+        ).astimezone(tz=tz_info)
         endPosition = endPosition.strftime("%Y-%m-%d")
     except:
         raise Exception("Error: phenomenonTime cannot be derived from timeseries")
 
-    phenomenonTime = etree.Element(
-        ("{%s}" % nsmap["om"]) + "phenomenonTime", nsmap=nsmap
-    )
+    phenomenonTime = names.element("om", "phenomenonTime")
 
     TimePeriod = etree.SubElement(
         phenomenonTime,
-        ("{%s}" % nsmap["gml"]) + "TimePeriod",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["gml"]) + "id": f"id_000{str(count)}"},
+        names["gml", "TimePeriod"],
+        attrib={names["gml", "id"]: f"id_000{str(count)}"},
     )
 
     count += 1
 
-    beginPosition_ = etree.SubElement(
-        TimePeriod, ("{%s}" % nsmap["gml"]) + "beginPosition", nsmap=nsmap
-    )
+    beginPosition_ = etree.SubElement(TimePeriod, names["gml", "beginPosition"])
     beginPosition_.text = beginPosition
 
-    endPosition_ = etree.SubElement(
-        TimePeriod, ("{%s}" % nsmap["gml"]) + "endPosition", nsmap=nsmap
-    )
+    endPosition_ = etree.SubElement(TimePeriod, names["gml", "endPosition"])
     endPosition_.text = endPosition
 
     return (phenomenonTime, count)
@@ -403,6 +364,7 @@ def gen_phenomenontime(data, nsmap, codespacemap, count):
 
 
 def gen_resulttime(data, nsmap, codespacemap, count):
+    names = qualified_names(nsmap)
     # try:
 
     #     if 'status' in data['metadata'].keys():
@@ -424,19 +386,16 @@ def gen_resulttime(data, nsmap, codespacemap, count):
     # except:
     #     raise Exception('Error: resultTime cannot be derived from timeseries')
     timeposition = data["resultTime"]
-    resultTime = etree.Element(("{%s}" % nsmap["om"]) + "resultTime", nsmap=nsmap)
+    resultTime = names.element("om", "resultTime")
     TimeInstant = etree.SubElement(
         resultTime,
-        ("{%s}" % nsmap["gml"]) + "TimeInstant",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["gml"]) + "id": f"id_000{str(count)}"},
+        names["gml", "TimeInstant"],
+        attrib={names["gml", "id"]: f"id_000{str(count)}"},
     )
 
     count += 1
 
-    timePosition = etree.SubElement(
-        TimeInstant, ("{%s}" % nsmap["gml"]) + "timePosition", nsmap=nsmap
-    )
+    timePosition = etree.SubElement(TimeInstant, names["gml", "timePosition"])
     timePosition.text = timeposition
 
     return (resultTime, count)
@@ -446,27 +405,26 @@ def gen_resulttime(data, nsmap, codespacemap, count):
 
 
 def gen_procedure_parameters(data, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     parameterlist = {}
 
     parameters = list(data["procedure"]["parameters"].keys())
 
     # airPressureCompensationType
     if "airPressureCompensationType" in parameters:
-        parameterlist["airPressureCompensationType"] = etree.Element(
-            ("{%s}" % nsmap["wml2"]) + "parameter", nsmap=nsmap
+        parameterlist["airPressureCompensationType"] = names.element(
+            "wml2", "parameter"
         )
         airPressureCompensationType_namevalue = etree.SubElement(
             parameterlist["airPressureCompensationType"],
-            ("{%s}" % nsmap["om"]) + "NamedValue",
-            nsmap=nsmap,
+            names["om", "NamedValue"],
         )
 
         airPressureCompensationType_name = etree.SubElement(
             airPressureCompensationType_namevalue,
-            ("{%s}" % nsmap["om"]) + "name",
-            nsmap=nsmap,
+            names["om", "name"],
             attrib={
-                ("{%s}" % nsmap["xlink"]) + "href": codespace_map_gld1[
+                names["xlink", "href"]: codespace_map_gld1[
                     "airPressureCompensationType"
                 ]
             },
@@ -474,10 +432,9 @@ def gen_procedure_parameters(data, nsmap, codespacemap):
 
         airPressureCompensationType_value = etree.SubElement(
             airPressureCompensationType_namevalue,
-            ("{%s}" % nsmap["om"]) + "value",
-            nsmap=nsmap,
+            names["om", "value"],
             attrib={
-                ("{%s}" % nsmap["xsi"]) + "type": "gml:CodeWithAuthorityType",
+                names["xsi", "type"]: "gml:CodeWithAuthorityType",
                 "codeSpace": codespace_map_gld1["AirPressureCompensationType"],
             },
         )
@@ -488,32 +445,23 @@ def gen_procedure_parameters(data, nsmap, codespacemap):
 
     # evaluationProcedure
     if "evaluationProcedure" in parameters:
-        parameterlist["evaluationProcedure"] = etree.Element(
-            ("{%s}" % nsmap["wml2"]) + "parameter", nsmap=nsmap
-        )
+        parameterlist["evaluationProcedure"] = names.element("wml2", "parameter")
         evaluationProcedure_namevalue = etree.SubElement(
             parameterlist["evaluationProcedure"],
-            ("{%s}" % nsmap["om"]) + "NamedValue",
-            nsmap=nsmap,
+            names["om", "NamedValue"],
         )
 
         evaluationProcedure_name = etree.SubElement(
             evaluationProcedure_namevalue,
-            ("{%s}" % nsmap["om"]) + "name",
-            nsmap=nsmap,
-            attrib={
-                ("{%s}" % nsmap["xlink"]) + "href": codespace_map_gld1[
-                    "evaluationProcedure"
-                ]
-            },
+            names["om", "name"],
+            attrib={names["xlink", "href"]: codespace_map_gld1["evaluationProcedure"]},
         )
 
         evaluationProcedure_value = etree.SubElement(
             evaluationProcedure_namevalue,
-            ("{%s}" % nsmap["om"]) + "value",
-            nsmap=nsmap,
+            names["om", "value"],
             attrib={
-                ("{%s}" % nsmap["xsi"]) + "type": "gml:CodeWithAuthorityType",
+                names["xsi", "type"]: "gml:CodeWithAuthorityType",
                 "codeSpace": codespace_map_gld1["EvaluationProcedure"],
             },
         )
@@ -524,32 +472,25 @@ def gen_procedure_parameters(data, nsmap, codespacemap):
 
     # measurementInstrumentType
     if "measurementInstrumentType" in parameters:
-        parameterlist["measurementInstrumentType"] = etree.Element(
-            ("{%s}" % nsmap["wml2"]) + "parameter", nsmap=nsmap
-        )
+        parameterlist["measurementInstrumentType"] = names.element("wml2", "parameter")
         measurementInstrumentType_namevalue = etree.SubElement(
             parameterlist["measurementInstrumentType"],
-            ("{%s}" % nsmap["om"]) + "NamedValue",
-            nsmap=nsmap,
+            names["om", "NamedValue"],
         )
 
         measurementInstrumentType_name = etree.SubElement(
             measurementInstrumentType_namevalue,
-            ("{%s}" % nsmap["om"]) + "name",
-            nsmap=nsmap,
+            names["om", "name"],
             attrib={
-                ("{%s}" % nsmap["xlink"]) + "href": codespace_map_gld1[
-                    "measurementInstrumentType"
-                ]
+                names["xlink", "href"]: codespace_map_gld1["measurementInstrumentType"]
             },
         )
 
         measurementInstrumentType_value = etree.SubElement(
             measurementInstrumentType_namevalue,
-            ("{%s}" % nsmap["om"]) + "value",
-            nsmap=nsmap,
+            names["om", "value"],
             attrib={
-                ("{%s}" % nsmap["xsi"]) + "type": "gml:CodeWithAuthorityType",
+                names["xsi", "type"]: "gml:CodeWithAuthorityType",
                 "codeSpace": codespace_map_gld1["MeasurementInstrumentType"],
             },
         )
@@ -565,12 +506,12 @@ def gen_procedure_parameters(data, nsmap, codespacemap):
 
 
 def gen_procedure(data, nsmap, codespacemap):
-    procedure = etree.Element(("{%s}" % nsmap["om"]) + "procedure", nsmap=nsmap)
+    names = qualified_names(nsmap)
+    procedure = names.element("om", "procedure")
     ObservationProcess = etree.SubElement(
         procedure,
-        ("{%s}" % nsmap["wml2"]) + "ObservationProcess",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["gml"]) + "id": f"_{uuid_gen.uuid4()}"},
+        names["wml2", "ObservationProcess"],
+        attrib={names["gml", "id"]: f"_{uuid_gen.uuid4()}"},
     )
     if "processType" not in data["procedure"].keys():
         processTypestr = "http://www.opengis.net/def/waterml/2.0/processType/Algorithm"
@@ -579,9 +520,8 @@ def gen_procedure(data, nsmap, codespacemap):
 
     processType = etree.SubElement(
         ObservationProcess,
-        ("{%s}" % nsmap["wml2"]) + "processType",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["xlink"]) + "href": processTypestr},
+        names["wml2", "processType"],
+        attrib={names["xlink", "href"]: processTypestr},
     )
     if "processReference" not in data["procedure"].keys():
         processReferencestr = codespace_map_gld1["ProcessReference"] + ":NEN5120v1991"
@@ -594,9 +534,8 @@ def gen_procedure(data, nsmap, codespacemap):
 
     processReference = etree.SubElement(
         ObservationProcess,
-        ("{%s}" % nsmap["wml2"]) + "processReference",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["xlink"]) + "href": processReferencestr},
+        names["wml2", "processReference"],
+        attrib={names["xlink", "href"]: processReferencestr},
     )
 
     if "parameters" in data["procedure"].keys():
@@ -614,56 +553,44 @@ def gen_procedure(data, nsmap, codespacemap):
 
 
 def gen_point_metadata_qualifiers(data, rec, nsmap, codespacemap, count):
+    names = qualified_names(nsmap)
     qualifierlist = {}
 
     metadata = list(rec["metadata"].keys())
 
     if "StatusQualityControl" in metadata:
-        qualifierlist["StatusQualityControl"] = etree.Element(
-            ("{%s}" % nsmap["wml2"]) + "qualifier", nsmap=nsmap
-        )
+        qualifierlist["StatusQualityControl"] = names.element("wml2", "qualifier")
         StatusQualityControl_category = etree.SubElement(
             qualifierlist["StatusQualityControl"],
-            ("{%s}" % nsmap["swe"]) + "Category",
-            nsmap=nsmap,
+            names["swe", "Category"],
         )
         StatusQualityControl_codeSpace = etree.SubElement(
             StatusQualityControl_category,
-            ("{%s}" % nsmap["swe"]) + "codeSpace",
-            nsmap=nsmap,
-            attrib={
-                ("{%s}" % nsmap["xlink"]) + "href": codespace_map_gld1[
-                    "StatusQualityControl"
-                ]
-            },
+            names["swe", "codeSpace"],
+            attrib={names["xlink", "href"]: codespace_map_gld1["StatusQualityControl"]},
         )
 
         StatusQualityControl_value = etree.SubElement(
             StatusQualityControl_category,
-            ("{%s}" % nsmap["swe"]) + "value",
-            nsmap=nsmap,
+            names["swe", "value"],
         )
         StatusQualityControl_value.text = str(rec["metadata"]["StatusQualityControl"])
 
     if "censoringLimitvalue" in metadata:
-        qualifierlist["censoringLimitvalue"] = etree.Element(
-            ("{%s}" % nsmap["wml2"]) + "qualifier", nsmap=nsmap
-        )
+        qualifierlist["censoringLimitvalue"] = names.element("wml2", "qualifier")
         censoringLimitvalue_category = etree.SubElement(
             qualifierlist["censoringLimitvalue"],
-            ("{%s}" % nsmap["swe"]) + "Quantity",
-            nsmap=nsmap,
+            names["swe", "Quantity"],
             attrib={"definition": codespace_map_gld1["censoringLimitvalue"]},
         )
         censoringLimitvalue_value = etree.SubElement(
             censoringLimitvalue_category,
-            ("{%s}" % nsmap["swe"]) + "uom",
-            nsmap=nsmap,
+            names["swe", "uom"],
             attrib={"code": "m"},
         )
 
         censoringLimitvalue_value = etree.SubElement(
-            censoringLimitvalue_category, ("{%s}" % nsmap["swe"]) + "value", nsmap=nsmap
+            censoringLimitvalue_category, names["swe", "value"]
         )
         censoringLimitvalue_value.text = str(rec["metadata"]["censoringLimitvalue"])
 
@@ -674,9 +601,10 @@ def gen_point_metadata_qualifiers(data, rec, nsmap, codespacemap, count):
 
 
 def gen_point_metadata(data, rec, nsmap, codespacemap, count):
-    metadata = etree.Element(("{%s}" % nsmap["wml2"]) + "metadata", nsmap=nsmap)
+    names = qualified_names(nsmap)
+    metadata = names.element("wml2", "metadata")
     TVPMeasurementMetadata = etree.SubElement(
-        metadata, ("{%s}" % nsmap["wml2"]) + "TVPMeasurementMetadata", nsmap=nsmap
+        metadata, names["wml2", "TVPMeasurementMetadata"]
     )
 
     if "StatusQualityControl" not in rec["metadata"].keys():
@@ -694,11 +622,11 @@ def gen_point_metadata(data, rec, nsmap, codespacemap, count):
         if "interpolationType" in rec["metadata"].keys():
             interpolationType = etree.SubElement(
                 TVPMeasurementMetadata,
-                ("{%s}" % nsmap["wml2"]) + "interpolationType",
-                nsmap=nsmap,
+                names["wml2", "interpolationType"],
                 attrib={
-                    ("{%s}" % nsmap["xlink"])
-                    + "href": "http://www.opengis.net/def/waterml/2.0/interpolationType/{}".format(
+                    names[
+                        "xlink", "href"
+                    ]: "http://www.opengis.net/def/waterml/2.0/interpolationType/{}".format(
                         rec["metadata"]["interpolationType"]
                     )
                 },
@@ -708,11 +636,11 @@ def gen_point_metadata(data, rec, nsmap, codespacemap, count):
             if not rec["metadata"]["censoredReason"] in ["nan", None, ""]:
                 censoredReason = etree.SubElement(
                     TVPMeasurementMetadata,
-                    ("{%s}" % nsmap["wml2"]) + "censoredReason",
-                    nsmap=nsmap,
+                    names["wml2", "censoredReason"],
                     attrib={
-                        ("{%s}" % nsmap["xlink"])
-                        + "href": "http://www.opengis.net/def/nil/OGC/0/{}".format(
+                        names[
+                            "xlink", "href"
+                        ]: "http://www.opengis.net/def/nil/OGC/0/{}".format(
                             rec["metadata"]["censoredReason"]
                         )
                     },
@@ -727,21 +655,17 @@ def gen_point_metadata(data, rec, nsmap, codespacemap, count):
 
 
 def gen_point(data, rec, nsmap, codespacemap, count):
-    point = etree.Element(("{%s}" % nsmap["wml2"]) + "point", nsmap=nsmap)
-    MeasurementTVP = etree.SubElement(
-        point, ("{%s}" % nsmap["wml2"]) + "MeasurementTVP", nsmap=nsmap
-    )
+    names = qualified_names(nsmap)
+    point = names.element("wml2", "point")
+    MeasurementTVP = etree.SubElement(point, names["wml2", "MeasurementTVP"])
 
-    time = etree.SubElement(
-        MeasurementTVP, ("{%s}" % nsmap["wml2"]) + "time", nsmap=nsmap
-    )
+    time = etree.SubElement(MeasurementTVP, names["wml2", "time"])
     time.text = rec["time"]
 
     if rec["value"] != "None":
         value = etree.SubElement(
             MeasurementTVP,
-            ("{%s}" % nsmap["wml2"]) + "value",
-            nsmap=nsmap,
+            names["wml2", "value"],
             attrib={"uom": "m"},
         )
         value.text = str(rec["value"])
@@ -749,9 +673,8 @@ def gen_point(data, rec, nsmap, codespacemap, count):
         # Note, mogelijk nog aanpassen
         value = etree.SubElement(
             MeasurementTVP,
-            ("{%s}" % nsmap["wml2"]) + "value",
-            nsmap=nsmap,
-            attrib={("{%s}" % nsmap["xsi"]) + "nil": "true"},
+            names["wml2", "value"],
+            attrib={names["xsi", "nil"]: "true"},
         )
 
     # Generate metadata from qualifiers:
@@ -761,25 +684,269 @@ def gen_point(data, rec, nsmap, codespacemap, count):
 
 
 # %%
-def gen_result(data, nsmap, codespacemap, count):
-    result = etree.Element(("{%s}" % nsmap["om"]) + "result", nsmap=nsmap)
+def gen_result(data, nsmap, codespacemap, count, points=True):
+    names = qualified_names(nsmap)
+    result = names.element("om", "result")
     MeasurementTimeseries = etree.SubElement(
         result,
-        ("{%s}" % nsmap["wml2"]) + "MeasurementTimeseries",
-        nsmap=nsmap,
-        attrib={("{%s}" % nsmap["gml"]) + "id": f"_{uuid_gen.uuid4()}"},
+        names["wml2", "MeasurementTimeseries"],
+        attrib={names["gml", "id"]: f"_{uuid_gen.uuid4()}"},
     )
 
-    timeseriesdata = pd.DataFrame(data["result"])
-    timeseriesdata.index = range(len(timeseriesdata))
+    # points=False leaves the MeasurementTimeseries empty, for writers that
+    # serialize the points separately with gen_points_xml
+    if points:
+        timeseries = coerce_timeseries(data["result"])
+        gen_points(MeasurementTimeseries, timeseries, nsmap)
 
-    # Generate points out of timeseriesdata
-    points = {}
+    return (result, count)
+
+
+# %%
 
-    for point in range(len(timeseriesdata)):
-        points[f"points_{str(point)}"], count = gen_point(
-            data, timeseriesdata.iloc[point], nsmap, codespacemap, count
+
+def gen_tvp_metadata(
+    nsmap,
+    statusQualityControl,
+    interpolationType,
+    censoredReason=None,
+    censoringLimitvalue=None,
+):
+    """
+    Build the wml2:metadata element of a point.
+
+    Parameters
+    ----------
+    nsmap : dictionary
+        namespace mapping
+    statusQualityControl : str
+        StatusQualityControl qualifier
+    interpolationType : str
+        interpolationType of the point
+    censoredReason : str, optional
+        censoredReason, omitted if None
+    censoringLimitvalue : str, optional
+        censoringLimitvalue qualifier, omitted if None
+
+    Returns
+    -------
+    wml2:metadata element, as child of a wml2:MeasurementTVP element that
+    declares the namespaces.
+
+    """
+    names = qualified_names(nsmap)
+    href_attr = names["xlink", "href"]
+
+    MeasurementTVP = names.element("wml2", "MeasurementTVP")
+    metadata = names.subelement(MeasurementTVP, "wml2", "metadata")
+    TVPMeasurementMetadata = names.subelement(
+        metadata, "wml2", "TVPMeasurementMetadata"
+    )
+
+    qualifier = names.subelement(TVPMeasurementMetadata, "wml2", "qualifier")
+    Category = names.subelement(qualifier, "swe", "Category")
+    names.subelement(
+        Category,
+        "swe",
+        "codeSpace",
+        {href_attr: codespace_map_gld1["StatusQualityControl"]},
+    )
+    names.subelement(Category, "swe", "value").text = statusQualityControl
+
+    if censoringLimitvalue is not None:
+        qualifier = names.subelement(TVPMeasurementMetadata, "wml2", "qualifier")
+        Quantity = names.subelement(
+            qualifier,
+            "swe",
+            "Quantity",
+            {"definition": codespace_map_gld1["censoringLimitvalue"]},
         )
-        MeasurementTimeseries.append(points[f"points_{str(point)}"])
+        names.subelement(Quantity, "swe", "uom", {"code": "m"})
+        names.subelement(Quantity, "swe", "value").text = censoringLimitvalue
+
+    names.subelement(
+        TVPMeasurementMetadata,
+        "wml2",
+        "interpolationType",
+        {
+            href_attr: "http://www.opengis.net/def/waterml/2.0/interpolationType/"
+            + interpolationType
+        },
+    )
 
-    return (result, count)
+    if censoredReason is not None:
+        names.subelement(
+            TVPMeasurementMetadata,
+            "wml2",
+            "censoredReason",
+            {href_attr: "http://www.opengis.net/def/nil/OGC/0/" + censoredReason},
+        )
+
+    return metadata
+
+
+def gen_points(MeasurementTimeseries, timeseries, nsmap):
+    """
+    Append a wml2:point element for every measurement in the timeseries.
+
+    The metadata of a point only depends on its qualifiers, so every
+    distinct combination is built once (gen_tvp_metadata) and copied.
+
+    Parameters
+    ----------
+    MeasurementTimeseries : etree.Element
+        wml2:MeasurementTimeseries element to append the points to. Its
+        ancestors should already declare the namespaces in nsmap.
+    timeseries : GldTimeseries
+        columnar timeseries data
+    nsmap : dictionary
+        namespace mapping
+
+    Returns
+    -------
+    None.
+
+    """
+    names = qualified_names(nsmap)
+
+    SubElement = etree.SubElement
+    deepcopy = copy.deepcopy
+
+    point_tag = names["wml2", "point"]
+    MeasurementTVP_tag = names["wml2", "MeasurementTVP"]
+    time_tag = names["wml2", "time"]
+    value_tag = names["wml2", "value"]
+    nil_attrib = {names["xsi", "nil"]: "true"}
+    value_attrib = {"uom": "m"}
+
+    metadata_cache = {}
+    rows = zip(
+        timeseries.time,
+        timeseries.value,
+        zip(
+            timeseries.status_quality_control,
+            timeseries.interpolation_type,
+            timeseries.censored_reason,
+            timeseries.censoring_limitvalue,
+        ),
+    )
+    for time, value, qualifiers in rows:
+        point = SubElement(MeasurementTimeseries, point_tag)
+        MeasurementTVP = SubElement(point, MeasurementTVP_tag)
+
+        SubElement(MeasurementTVP, time_tag).text = time
+        if value is not None:
+            SubElement(MeasurementTVP, value_tag, attrib=value_attrib).text = value
+        else:
+            SubElement(MeasurementTVP, value_tag, attrib=nil_attrib)
+
+        metadata = metadata_cache.get(qualifiers)
+        if metadata is None:
+            metadata = metadata_cache[qualifiers] = gen_tvp_metadata(nsmap, *qualifiers)
+        MeasurementTVP.append(deepcopy(metadata))
+
+
+# %%
+
+
+_XML_TEXT_SPECIAL = re.compile(
+    r"[&<>\r\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]"
+)
+
+
+def _xml_text(text):
+    """Serialize element text the way lxml does."""
+    if _XML_TEXT_SPECIAL.search(text) is None:
+        return text.encode("utf8")
+    element = etree.Element("text")
+    element.text = text
+    xml = etree.tostring(element, encoding="utf8", method="xml")
+    return xml[xml.index(b">") + 1 : xml.rindex(b"</")]
+
+
+def gen_point_template(nsmap, nil, *qualifiers):
+    """
+    Serialize a wml2:point around its time and value text.
+
+    Parameters
+    ----------
+    nsmap : dictionary
+        namespace mapping
+    nil : bool
+        whether the value is nil
+    *qualifiers :
+        statusQualityControl, interpolationType, censoredReason and
+        censoringLimitvalue, as in gen_tvp_metadata
+
+    Returns
+    -------
+    tuple of bytes
+        the serialized point split at the time text and, unless nil, the
+        value text.
+
+    """
+    marker = f"text_{os.urandom(16).hex()}"
+    timeseries = GldTimeseries(
+        [marker], [None if nil else marker], *[[item] for item in qualifiers]
+    )
+    MeasurementTimeseries = qualified_names(nsmap).element(
+        "wml2", "MeasurementTimeseries"
+    )
+    gen_points(MeasurementTimeseries, timeseries, nsmap)
+    xml = etree.tostring(MeasurementTimeseries, encoding="utf8", method="xml")
+    return tuple(xml[xml.index(b">") + 1 : xml.rindex(b"</")].split(marker.encode()))
+
+
+def gen_points_xml(timeseries, nsmap, batch_size=1000):
+    """
+    Serialize the wml2:point elements of a timeseries in batches.
+
+    Points are written from pre-serialized templates (gen_point_template),
+    one per distinct combination of qualifiers, so no elements are built
+    per point.
+
+    Parameters
+    ----------
+    timeseries : GldTimeseries
+        columnar timeseries data
+    nsmap : dictionary
+        namespace mapping, should match the nsmap of the request root
+    batch_size : int
+        number of points serialized at a time
+
+    Yields
+    ------
+    bytes
+        serialized points, without namespace declarations. The batches
+        concatenate to the content gen_result would give the
+        MeasurementTimeseries element.
+
+    """
+    templates = {}
+    for start in range(0, len(timeseries), batch_size):
+        stop = start + batch_size
+        rows = zip(
+            timeseries.time[start:stop],
+            timeseries.value[start:stop],
+            timeseries.status_quality_control[start:stop],
+            timeseries.interpolation_type[start:stop],
+            timeseries.censored_reason[start:stop],
+            timeseries.censoring_limitvalue[start:stop],
+        )
+        xml = []
+        for time, value, *qualifiers in rows:
+            key = (value is None, *qualifiers)
+            template = templates.get(key)
+            if template is None:
+                template = templates[key] = gen_point_template(nsmap, *key)
+            if value is None:
+                xml += (template[0], _xml_text(time), template[1])
+            else:
+                xml += (
+                    template[0],
+                    _xml_text(time),
+                    template[1],
+                    _xml_text(value),
+                    template[2],
+                )
+        yield b"".join(xml)
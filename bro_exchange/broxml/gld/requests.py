@@ -3,7 +3,6 @@ from typing import Any
 
 from lxml import etree
 
-from bro_exchange.bhp.connector import deliver_requests, validate_request
 from bro_exchange.broxml.mappings import (  # mappings
     codespace_map_gld1,
     ns_regreq_map_gld1,
@@ -17,9 +16,12 @@ from bro_exchange.broxml.request_helpers import (
     has_value,
     normalize_optional_kwargs,
 )
+from bro_exchange.broxml.tags import qualified_names
 from bro_exchange.checks import check_missing_args
 
+from .constructables import gen_points_xml
 from .sourcedocs import gen_gld_startregistration, gen_gld_addition
+from .timeseries import coerce_timeseries
 
 
 def get_supported_gld_srcdocs() -> dict[str, tuple[str, ...]]:
@@ -32,6 +34,90 @@ def get_supported_gld_srcdocs() -> dict[str, tuple[str, ...]]:
     }
 
 
+def write_gld_addition_request(req, timeseries, output, batch_size=1000):
+    """
+    Write a GLD_Addition request to output, streaming in the points.
+
+    Parameters
+    ----------
+    req : etree.Element
+        request root, generated with an empty MeasurementTimeseries
+        (`gen_gld_addition(..., points=False)`).
+    timeseries : GldTimeseries
+        points to write into the MeasurementTimeseries
+    output : string, path or binary file-like object
+        destination of the request XML
+    batch_size : int
+        number of points serialized at a time
+    """
+    MeasurementTimeseries = req.find(
+        ".//" + qualified_names(ns_regreq_map_gld3)["wml2", "MeasurementTimeseries"]
+    )
+    if MeasurementTimeseries is None:
+        raise Exception("Request does not contain a MeasurementTimeseries")
+
+    # Serialize the request around a placeholder and write the points in its place
+    placeholder = f"points_{os.urandom(16).hex()}"
+    MeasurementTimeseries.text = placeholder
+    xml = etree.tostring(etree.ElementTree(req), encoding="utf8", method="xml")
+    MeasurementTimeseries.text = None
+    head, tail = xml.split(placeholder.encode())
+
+    if isinstance(output, (str, os.PathLike)):
+        file = open(output, "wb")
+    else:
+        file = None
+
+    try:
+        target = output if file is None else file
+        target.write(head)
+        for points in gen_points_xml(timeseries, ns_regreq_map_gld3, batch_size):
+            target.write(points)
+        target.write(tail)
+    finally:
+        if file is not None:
+            file.close()
+
+
+class _GldRequestGeneration:
+    """
+    Generation shared by the GLD registration and replace requests, which
+    build their request root with `_gen_request(srcdocdata, points=...)`.
+    """
+
+    def generate(self):
+        req = self._gen_request(self.kwargs["srcdocdata"])
+
+        self.requesttree = etree.ElementTree(req)
+        self.request = etree.tostring(self.requesttree, encoding="utf8", method="xml")
+
+    def generate_stream(self, output, batch_size=1000):
+        """
+        Generate a GLD_Addition request and write it to output incrementally.
+
+        The points are built and serialized per batch, so memory use does not
+        grow with the length of the timeseries. The written document is
+        identical to `self.request` after `generate()`; `self.request` and
+        `self.requesttree` are not set.
+
+        Parameters
+        ----------
+        output : string, path or binary file-like object
+            destination of the request XML
+        batch_size : int
+            number of points serialized at a time
+        """
+        if self.srcdoc != "GLD_Addition":
+            raise Exception("Streaming generation is only supported for GLD_Addition")
+
+        srcdocdata = dict(self.kwargs["srcdocdata"])
+        if "result" in srcdocdata:
+            srcdocdata["result"] = coerce_timeseries(srcdocdata["result"])
+        req = self._gen_request(srcdocdata, points=False)
+
+        write_gld_addition_request(req, srcdocdata["result"], output, batch_size)
+
+
 # =============================================================================
 # General info
 # =============================================================================
@@ -42,7 +128,7 @@ def get_supported_gld_srcdocs() -> dict[str, tuple[str, ...]]:
 # %%
 
 
-class gld_registration_request:
+class gld_registration_request(_GldRequestGeneration):
 
     """
     Build a GLD registration request XML.
@@ -101,7 +187,7 @@ class gld_registration_request:
 
         self.requestreference = self.kwargs["requestReference"]
 
-    def generate(self):
+    def _gen_request(self, srcdocdata, points=True):
         # Generate xml document base:
         if self.srcdoc == "GLD_StartRegistration":
             req = etree.Element(
@@ -165,7 +251,7 @@ class gld_registration_request:
                 )
             else:
                 sourceDocument = gen_gld_startregistration(
-                    self.kwargs["srcdocdata"], ns_regreq_map_gld2, codespace_map_gld1
+                    srcdocdata, ns_regreq_map_gld2, codespace_map_gld1
                 )
                 req.append(sourceDocument)
 
@@ -176,13 +262,11 @@ class gld_registration_request:
                 )
             else:
                 sourceDocument = gen_gld_addition(
-                    self.kwargs["srcdocdata"], ns_regreq_map_gld3, codespace_map_gld1
+                    srcdocdata, ns_regreq_map_gld3, codespace_map_gld1, points=points
                 )
                 req.append(sourceDocument)
 
-        self.requesttree = etree.ElementTree(req)
-        self.request = etree.tostring(self.requesttree, encoding="utf8", method="xml")
-        # print(etree.tostring(req, pretty_print=True,encoding='unicode'))
+        return req
 
     def write_request(self, filename, output_dir=None):
         if output_dir is None:
@@ -202,6 +286,8 @@ class gld_registration_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -227,6 +313,8 @@ class gld_registration_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -240,7 +328,7 @@ class gld_registration_request:
 # %% gld replace request
 
 
-class gld_replace_request:
+class gld_replace_request(_GldRequestGeneration):
     # VRAAG: WAT IS VOOR GLD ADDITION DE EENHEID VAN CORRECTIE? WORDEN DE
     # GML IDS VAN HET OBSPROC EN OBS VERVANGEN OF NIET?
 
@@ -308,7 +396,7 @@ class gld_replace_request:
 
         self.requestreference = self.kwargs["requestReference"]
 
-    def generate(self):
+    def _gen_request(self, srcdocdata, points=True):
         # Generate xml document base:
         if self.srcdoc in ["GLD_StartRegistration", "GLD_Addition"]:
             req = etree.Element(
@@ -371,7 +459,7 @@ class gld_replace_request:
                 )
             else:
                 sourceDocument = gen_gld_startregistration(
-                    self.kwargs["srcdocdata"], ns_regreq_map_gld2, codespace_map_gld1
+                    srcdocdata, ns_regreq_map_gld2, codespace_map_gld1
                 )
                 req.append(sourceDocument)
 
@@ -382,13 +470,11 @@ class gld_replace_request:
                 )
             else:
                 sourceDocument = gen_gld_addition(
-                    self.kwargs["srcdocdata"], ns_regreq_map_gld3, codespace_map_gld1
+                    srcdocdata, ns_regreq_map_gld3, codespace_map_gld1, points=points
                 )
                 req.append(sourceDocument)
 
-        self.requesttree = etree.ElementTree(req)
-        self.request = etree.tostring(self.requesttree, encoding="utf8", method="xml")
-        # print(etree.tostring(req, pretty_print=True,encoding='unicode'))
+        return req
 
     def write_request(self, filename, output_dir=None):
         if output_dir is None:
@@ -408,6 +494,8 @@ class gld_replace_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -433,6 +521,8 @@ class gld_replace_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -549,6 +639,8 @@ class gld_delete_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -574,6 +666,8 @@ class gld_delete_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -581,3 +675,101 @@ class gld_delete_request:
             self.delivery_id = self.delivery_info.json()["identifier"]
         except:
             pass
+
+
+def gen_gld_addition_requests(
+    srcdocdata,
+    requestReference,
+    max_points=None,
+    max_bytes=None,
+    request_type="registration",
+    **kwargs,
+):
+    """
+    Split one long GLD_Addition result over multiple generated requests.
+
+    The requests are generated lazily, one chunk at a time. Every chunk gets
+    its own phenomenonTime and gml ids, and the requestReference is suffixed
+    with the chunk number (`<requestReference>_1`, `<requestReference>_2`, ...).
+
+    Parameters
+    ----------
+    srcdocdata : dict, SourceDocData or dataclass
+        GLD_Addition source document data, with the full timeseries as result
+    requestReference : string
+        base requestReference of the chunks
+    max_points : int, optional
+        maximum number of points per request
+    max_bytes : int, optional
+        maximum size of the request XML in bytes
+    request_type : string
+        'registration' or 'replace'
+    **kwargs :
+        other request arguments (qualityRegime, broId, deliveryAccountableParty)
+
+    Yields
+    ------
+    gld_registration_request or gld_replace_request
+        generated request per chunk
+    """
+    request_classes = {
+        "registration": gld_registration_request,
+        "replace": gld_replace_request,
+    }
+    if request_type not in request_classes:
+        raise Exception("Request type should be 'registration' or 'replace'")
+    if max_points is None and max_bytes is None:
+        raise Exception("Either max_points or max_bytes should be given")
+    if max_points is not None and max_points < 1:
+        raise Exception("max_points should be at least 1")
+
+    request_class = request_classes[request_type]
+    srcdocdata = coerce_srcdocdata(srcdocdata)
+    if "result" not in srcdocdata:
+        raise Exception("Error: result should be in srcdocdata")
+    timeseries = coerce_timeseries(srcdocdata["result"])
+    length = len(timeseries)
+
+    def gen_chunk(number, start, stop):
+        chunkdata = dict(srcdocdata)
+        chunkdata["result"] = timeseries[start:stop]
+        request = request_class(
+            "GLD_Addition",
+            requestReference=f"{requestReference}_{number}",
+            srcdocdata=chunkdata,
+            **kwargs,
+        )
+        request.generate()
+        return request
+
+    size = length if max_points is None else max_points
+    if max_bytes is not None and length > 0:
+        # Estimate the request overhead and point size from the first points
+        sample = timeseries[:100]
+        point_bytes = sum(
+            len(points) for points in gen_points_xml(sample, ns_regreq_map_gld3)
+        ) / len(sample)
+        first_point = next(gen_points_xml(timeseries[:1], ns_regreq_map_gld3))
+        overhead = len(gen_chunk(1, 0, 1).request) - len(first_point)
+        size = min(size, max(1, int((max_bytes - overhead) // point_bytes)))
+
+    number = 1
+    start = 0
+    while start < length:
+        stop = min(start + size, length)
+        request = gen_chunk(number, start, stop)
+
+        while max_bytes is not None and len(request.request) > max_bytes:
+            if stop - start == 1:
+                raise Exception(
+                    f"GLD_Addition request with a single point exceeds max_bytes ({max_bytes})"
+                )
+            point_bytes = (len(request.request) - overhead) / (stop - start)
+            size = int((max_bytes - overhead) // point_bytes)
+            size = min(max(1, size), stop - start - 1)
+            stop = start + size
+            request = gen_chunk(number, start, stop)
+
+        yield request
+        start = stop
+        number += 1
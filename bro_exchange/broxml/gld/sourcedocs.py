@@ -1,6 +1,5 @@
 import uuid as uuid_gen
 
-import pandas as pd
 from lxml import etree
 
 from bro_exchange.broxml.request_helpers import coerce_srcdocdata
@@ -15,6 +14,7 @@ from .constructables import (
     gen_result,
     gen_resulttime,
 )
+from .timeseries import coerce_timeseries
 
 # =============================================================================
 # General info
@@ -107,7 +107,7 @@ def gen_gld_startregistration(data, nsmap, codespacemap):
 # %%
 
 
-def gen_gld_addition(data, nsmap, codespacemap):
+def gen_gld_addition(data, nsmap, codespacemap, points=True):
     data = coerce_srcdocdata(data)
 
     count = 2
@@ -119,7 +119,7 @@ def gen_gld_addition(data, nsmap, codespacemap):
         "procedure": "obligated",
         "observedProperty": "fixed",
         "featureOfInterest": "fixed",
-        "result": "obligated",  # Note, timeseries input in datetime string with format %Y-%m-%dT%H:%M:%S
+        "result": "obligated",  # Note, timeseries input in datetime string with format %Y-%m-%dT%H:%M:%S, iterable of dicts, table with the same columns or GldTimeseries
     }
 
     # Note: mapSheetCode is a valid optional argument that hasn't been included yet
@@ -127,6 +127,9 @@ def gen_gld_addition(data, nsmap, codespacemap):
     # Check wether all obligated arguments are in data
     check_missing_args(data, arglist, "gen_gld_addition")
 
+    # Parse and validate the timeseries once; phenomenonTime and result share it
+    data["result"] = coerce_timeseries(data["result"])
+
     sourceDocument = etree.Element("sourceDocument")
     GLD_Addition = etree.SubElement(
         sourceDocument,
@@ -213,26 +216,10 @@ def gen_gld_addition(data, nsmap, codespacemap):
                     nsmap=nsmap,
                 )
             elif arg == "result":
-                # try:
-                if type(data["result"]) != list:
-                    raise Exception(
-                        "Error: invalid input type for result, should be list with dictionaries"
-                    )
-                elif list(pd.DataFrame(data["result"]).columns) != [
-                    "time",
-                    "value",
-                    "metadata",
-                ]:
-                    raise Exception(
-                        "Error: invalid input fields for result, fields should be ['time','value','qualifiers']"
-                    )
-                else:
-                    OM_Observation_subelements["result"], count = gen_result(
-                        data, nsmap, codespacemap, count
-                    )
-                    OM_Observation.append(OM_Observation_subelements["result"])
-        # except:
-        # raise Exception("Error: failed to compose timeseriesdata, probably due to input format")
+                OM_Observation_subelements["result"], count = gen_result(
+                    data, nsmap, codespacemap, count, points=points
+                )
+                OM_Observation.append(OM_Observation_subelements["result"])
 
         else:  # fixed arguments (in case not in data)
             if arg == "phenomenonTime":
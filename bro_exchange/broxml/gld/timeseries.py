@@ -0,0 +1,372 @@
+"""Columnar timeseries input for GLD_Addition source documents.
+
+`GldTimeseries` holds the `result` of a GLD_Addition as parallel columns
+instead of a list of `{"time", "value", "metadata"}` records, so the
+`wml2:point` elements can be emitted in a single loop over plain lists.
+
+Array-like input (lists, iterators, NumPy arrays, pandas Series and
+DataFrames, pyarrow Tables) is read through duck typing; pandas, NumPy and
+pyarrow are never imported here.
+"""
+
+from collections.abc import Iterable, Mapping
+from numbers import Integral, Real
+from typing import Any
+
+RECORD_FIELDS = ["time", "value", "metadata"]
+
+# Flat table column: from_columns argument
+TABLE_COLUMNS = {
+    "time": "time",
+    "value": "value",
+    "status_quality_control": "status_quality_control",
+    "interpolation_type": "interpolation_type",
+    "censored_reason": "censored_reason",
+    "censoring_limit": "censoring_limitvalue",
+}
+
+
+def _as_list(values: Any) -> list[Any]:
+    """Return a column as a plain list (NumPy arrays and pandas Series via
+    `tolist`, Arrow arrays via `to_pylist`)."""
+
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    if hasattr(values, "to_pylist"):
+        return values.to_pylist()
+    return list(values)
+
+
+def _column_names(table: Any) -> list[str]:
+    """Column names of a pandas DataFrame or a pyarrow Table."""
+
+    if hasattr(table, "column_names"):
+        return list(table.column_names)
+    return list(table.columns)
+
+
+def _time_text(value: Any) -> Any:
+    """
+    Return timezone aware datetimes (also pandas Timestamps) as ISO 8601
+    text. Naive datetimes are rejected, as their offset is unknown.
+    """
+
+    if hasattr(value, "isoformat"):
+        utcoffset = getattr(value, "utcoffset", None)
+        if utcoffset is None or utcoffset() is None:
+            raise ValueError(
+                f"Time {value} has no timezone, use timezone aware datetimes"
+            )
+        return value.isoformat()
+    return value
+
+
+def _broadcast(values: Any, length: int, context: str) -> list[Any]:
+    """Return a column of `length` items, repeating scalar input."""
+
+    if values is None or isinstance(values, (str, Real)):
+        return [values] * length
+
+    values = _as_list(values)
+    if len(values) != length:
+        raise ValueError(
+            f"Column '{context}' has {len(values)} items, expected {length}"
+        )
+    return values
+
+
+def _is_missing(value: Any) -> bool:
+    """Return True for `None`, `"None"` and NaN."""
+
+    if value is None or value == "None":
+        return True
+    return isinstance(value, float) and value != value
+
+
+def _legacy_value_column(values: list[Any]) -> list[Any]:
+    """Apply the dtype upcasting pandas used to do on the value column.
+
+    A column containing only real numbers and `None`, with at least one float
+    or `None`, used to become float64 (ints rendered as `1.0`, `None` as
+    `nan`). The records path keeps rendering values that way.
+    """
+
+    upcast = False
+    all_none = True
+    for value in values:
+        if value is None:
+            upcast = True
+            continue
+        all_none = False
+        if isinstance(value, bool) or not isinstance(value, Real):
+            return values
+        if not isinstance(value, Integral):
+            upcast = True
+
+    if upcast and not all_none:
+        return [float("nan") if value is None else float(value) for value in values]
+    return values
+
+
+class GldTimeseries:
+    """
+    Parallel-column representation of a GLD_Addition result.
+
+    All columns hold the text that ends up in the XML. `value` entries that
+    are `None` are written as `xsi:nil="true"`; `censored_reason` and
+    `censoring_limitvalue` entries that are `None` are omitted.
+
+    Use `from_columns()` for array input and `from_records()` for the
+    list-of-dictionaries input accepted by `gen_gld_addition`.
+    """
+
+    __slots__ = (
+        "time",
+        "value",
+        "status_quality_control",
+        "interpolation_type",
+        "censored_reason",
+        "censoring_limitvalue",
+    )
+
+    def __init__(
+        self,
+        time: list[str],
+        value: list[str | None],
+        status_quality_control: list[str],
+        interpolation_type: list[str],
+        censored_reason: list[str | None],
+        censoring_limitvalue: list[str | None],
+    ):
+        self.time = time
+        self.value = value
+        self.status_quality_control = status_quality_control
+        self.interpolation_type = interpolation_type
+        self.censored_reason = censored_reason
+        self.censoring_limitvalue = censoring_limitvalue
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index: slice) -> "GldTimeseries":
+        """Return the points in a slice as a new `GldTimeseries`."""
+
+        if not isinstance(index, slice):
+            raise TypeError("GldTimeseries can only be indexed with a slice")
+
+        return GldTimeseries(
+            self.time[index],
+            self.value[index],
+            self.status_quality_control[index],
+            self.interpolation_type[index],
+            self.censored_reason[index],
+            self.censoring_limitvalue[index],
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        time: Any,
+        value: Any,
+        status_quality_control: Any,
+        interpolation_type: Any = "Discontinuous",
+        censored_reason: Any = None,
+        censoring_limitvalue: Any = None,
+    ) -> "GldTimeseries":
+        """
+        Build a timeseries from parallel arrays.
+
+        Parameters
+        ----------
+        time : sequence of str or datetime
+            Measurement times, formatted as %Y-%m-%dT%H:%M:%S%z, or
+            timezone aware datetimes.
+        value : sequence
+            Measured values (m). `None`, `"None"` and NaN become nil values.
+        status_quality_control : str or sequence of str
+            StatusQualityControl per point, or one value for all points.
+        interpolation_type : str or sequence of str
+            interpolationType per point, or one value for all points.
+        censored_reason : str or sequence, optional
+            censoredReason per point; empty entries are omitted.
+        censoring_limitvalue : str, number or sequence, optional
+            censoringLimitvalue per point; `None` entries are omitted.
+
+        Returns
+        -------
+        GldTimeseries
+        """
+
+        time = [_time_text(t) for t in _as_list(time)]
+        length = len(time)
+
+        value = [
+            None if _is_missing(v) else str(v)
+            for v in _broadcast(value, length, "value")
+        ]
+
+        status_quality_control = _broadcast(
+            status_quality_control, length, "status_quality_control"
+        )
+        interpolation_type = _broadcast(
+            interpolation_type, length, "interpolation_type"
+        )
+        if None in status_quality_control:
+            raise Exception("Error: StatusQualityControl should be in qualifiers")
+        if None in interpolation_type:
+            raise Exception("Error: interpolationType should be in qualifiers")
+
+        censored_reason = [
+            None if v in ["nan", None, ""] or _is_missing(v) else str(v)
+            for v in _broadcast(censored_reason, length, "censored_reason")
+        ]
+        censoring_limitvalue = [
+            None if _is_missing(v) else str(v)
+            for v in _broadcast(censoring_limitvalue, length, "censoring_limitvalue")
+        ]
+
+        return cls(
+            time,
+            value,
+            [str(v) for v in status_quality_control],
+            [str(v) for v in interpolation_type],
+            censored_reason,
+            censoring_limitvalue,
+        )
+
+    @classmethod
+    def from_table(cls, table: Any) -> "GldTimeseries":
+        """
+        Build a timeseries from a pandas DataFrame or a pyarrow Table.
+
+        The table either has flat columns `time`, `value`,
+        `status_quality_control` and optionally `interpolation_type`
+        (default Discontinuous), `censored_reason` and `censoring_limit`,
+        or the `time`, `value` and `metadata` columns of the records input.
+        The columns are read as whole lists; missing values (NaN, null)
+        become nil values or are omitted.
+        """
+
+        columns = _column_names(table)
+        if sorted(columns) == sorted(RECORD_FIELDS):
+            return cls._from_record_table(table)
+
+        unknown = [column for column in columns if column not in TABLE_COLUMNS]
+        missing = [
+            column
+            for column in ("time", "value", "status_quality_control")
+            if column not in columns
+        ]
+        if unknown or missing:
+            raise Exception(
+                "Error: invalid input fields for result table, columns should be "
+                f"{list(TABLE_COLUMNS)}; unknown: {unknown}, missing: {missing}"
+            )
+
+        return cls.from_columns(
+            **{TABLE_COLUMNS[column]: _as_list(table[column]) for column in columns}
+        )
+
+    @classmethod
+    def _from_record_table(cls, table: Any) -> "GldTimeseries":
+        metadata = _as_list(table["metadata"])
+        for row in metadata:
+            if "StatusQualityControl" not in row:
+                raise Exception("Error: StatusQualityControl should be in qualifiers")
+            if "interpolationType" not in row:
+                raise Exception("Error: interpolationType should be in qualifiers")
+
+        return cls.from_columns(
+            _as_list(table["time"]),
+            _as_list(table["value"]),
+            [row["StatusQualityControl"] for row in metadata],
+            [row["interpolationType"] for row in metadata],
+            [row.get("censoredReason") for row in metadata],
+            [row.get("censoringLimitvalue") for row in metadata],
+        )
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> "GldTimeseries":
+        """
+        Build a timeseries from `{"time", "value", "metadata"}` records.
+
+        The records are rendered exactly like the previous DataFrame based
+        implementation of `gen_result` did.
+        """
+
+        length = len(records)
+        time = [None] * length
+        value = [None] * length
+        status_quality_control = [None] * length
+        interpolation_type = [None] * length
+        censored_reason = [None] * length
+        censoring_limitvalue = [None] * length
+
+        for index, record in enumerate(records):
+            time[index] = _time_text(record["time"])
+            value[index] = record["value"]
+
+            metadata = record["metadata"]
+            if "StatusQualityControl" not in metadata:
+                raise Exception("Error: StatusQualityControl should be in qualifiers")
+            if "interpolationType" not in metadata:
+                raise Exception("Error: interpolationType should be in qualifiers")
+            status_quality_control[index] = str(metadata["StatusQualityControl"])
+            interpolation_type[index] = str(metadata["interpolationType"])
+
+            if "censoringLimitvalue" in metadata:
+                censoring_limitvalue[index] = str(metadata["censoringLimitvalue"])
+            if "censoredReason" in metadata:
+                if metadata["censoredReason"] not in ["nan", None, ""]:
+                    censored_reason[index] = str(metadata["censoredReason"])
+
+        value = [None if v == "None" else str(v) for v in _legacy_value_column(value)]
+
+        return cls(
+            time,
+            value,
+            status_quality_control,
+            interpolation_type,
+            censored_reason,
+            censoring_limitvalue,
+        )
+
+
+def coerce_timeseries(result: Any) -> GldTimeseries:
+    """
+    Convert GLD_Addition result input to a `GldTimeseries`.
+
+    Accepted are a `GldTimeseries` (returned as is, so the conversion only
+    happens once per source document), an iterable of
+    `{"time", "value", "metadata"}` dictionaries and a pandas DataFrame or
+    pyarrow Table (see `GldTimeseries.from_table`).
+
+    Raises
+    ------
+    Exception
+        If the result is none of the above.
+    """
+
+    if isinstance(result, GldTimeseries):
+        return result
+
+    if hasattr(result, "columns") or hasattr(result, "column_names"):
+        return GldTimeseries.from_table(result)
+
+    if isinstance(result, (str, bytes, Mapping)) or not isinstance(result, Iterable):
+        raise Exception(
+            "Error: invalid input type for result, should be list with dictionaries"
+        )
+    result = list(result)
+
+    columns = []
+    for record in result:
+        for key in record:
+            if key not in columns:
+                columns.append(key)
+    if columns != RECORD_FIELDS:
+        raise Exception(
+            "Error: invalid input fields for result, fields should be ['time','value','qualifiers']"
+        )
+
+    return GldTimeseries.from_records(result)
@@ -3,12 +3,14 @@
 from lxml import etree
 
 from bro_exchange.broxml.request_helpers import (
-    coerce_list_of_mapping_like,
     coerce_mapping_like,
     coerce_srcdocdata,
 )
+from bro_exchange.broxml.tags import qualified_names
 from bro_exchange.checks import check_missing_args
 
+MEASURINGPOINT_ARGS = {"measuringPointCode": "obligated", "monitoringTube": "obligated"}
+
 # %%
 
 
@@ -136,87 +138,96 @@ def gen_measuringpoint(data, nsmap, mp=None):
 
     data = coerce_srcdocdata(data)
 
-    arglist = {"measuringPointCode": "obligated", "monitoringTube": "obligated"}
-
     if mp is not None:
-        data["measuringPoints"] = coerce_list_of_mapping_like(
-            data["measuringPoints"], "measuringPoints"
-        )
-        data["measuringPoints"][mp]["monitoringTube"] = coerce_mapping_like(
-            data["measuringPoints"][mp]["monitoringTube"],
-            "measuringPoints.monitoringTube",
-        )
+        # Only the selected measuringpoint is coerced, so generating all
+        # measuringpoints this way stays linear in their number
+        return gen_measuringpoint_element(data["measuringPoints"][mp], nsmap, mp)
 
-        check_missing_args(
-            data["measuringPoints"][mp],
-            arglist,
-            f"gen_monitoringtube, tube with index {str(mp)}",
-        )
+    return gen_measuringpoint_element(
+        coerce_mapping_like(data["measuringPoint"], "measuringPoint"), nsmap, 0
+    )
 
-        measuringpoint = etree.Element("measuringPoint")
 
-        measuringpoint_ = etree.SubElement(
-            measuringpoint,
-            "MeasuringPoint",
-            attrib={("{%s}" % nsmap["gml"]) + "id": f"id_mp{str(mp)}"},
-        )
+def gen_measuringpoint_element(point, nsmap, index):
+    """
 
-        measuringpointcode = etree.SubElement(measuringpoint_, "measuringPointCode")
-        measuringpointcode.text = data["measuringPoints"][mp]["measuringPointCode"]
+    Parameters
+    ----------
+    point : dictionary, mapping-like or dataclass
+        attribute data of a single measuringpoint, with a monitoringTube item
+    nsmap : dictionary
+        namespace mapping
+    index : int
+        index of the measuringpoint, used in the gml ids
 
-        monitoringTube = etree.SubElement(measuringpoint_, "monitoringTube")
+    Returns
+    -------
+    measuringPoint element of the measuringpoint
 
-        GroundwaterMonitoringTube = etree.SubElement(
-            monitoringTube,
-            "GroundwaterMonitoringTube",
-            attrib={("{%s}" % nsmap["gml"]) + "id": f"id_mpgwmt{str(mp)}"},
-        )
+    """
 
-        broId = etree.SubElement(GroundwaterMonitoringTube, "broId")
-        broId.text = str(data["measuringPoints"][mp]["monitoringTube"]["broId"])
+    names = qualified_names(nsmap)
 
-        tubeNumber = etree.SubElement(GroundwaterMonitoringTube, "tubeNumber")
-        tubeNumber.text = str(
-            data["measuringPoints"][mp]["monitoringTube"]["tubeNumber"]
-        )
+    point = coerce_mapping_like(point, f"measuringPoints[{index}]")
+    check_missing_args(
+        point,
+        MEASURINGPOINT_ARGS,
+        f"gen_monitoringtube, tube with index {str(index)}",
+    )
+    monitoringtube = coerce_mapping_like(
+        point["monitoringTube"], "measuringPoints.monitoringTube"
+    )
 
-        return measuringpoint
+    measuringpoint = etree.Element("measuringPoint")
 
-    else:
-        data["measuringPoint"] = coerce_mapping_like(data["measuringPoint"], "measuringPoint")
-        data["measuringPoint"]["monitoringTube"] = coerce_mapping_like(
-            data["measuringPoint"]["monitoringTube"], "measuringPoint.monitoringTube"
-        )
+    measuringpoint_ = etree.SubElement(
+        measuringpoint,
+        "MeasuringPoint",
+        attrib={names["gml", "id"]: f"id_mp{str(index)}"},
+    )
 
-        check_missing_args(
-            data["measuringPoint"],
-            arglist,
-            f"gen_monitoringtube, tube with index {str(0)}",
-        )
+    measuringpointcode = etree.SubElement(measuringpoint_, "measuringPointCode")
+    measuringpointcode.text = point["measuringPointCode"]
 
-        measuringpoint = etree.Element("measuringPoint")
+    monitoringTube = etree.SubElement(measuringpoint_, "monitoringTube")
 
-        measuringpoint_ = etree.SubElement(
-            measuringpoint,
-            "MeasuringPoint",
-            attrib={("{%s}" % nsmap["gml"]) + "id": f"id_mp{str(0)}"},
-        )
+    GroundwaterMonitoringTube = etree.SubElement(
+        monitoringTube,
+        "GroundwaterMonitoringTube",
+        attrib={names["gml", "id"]: f"id_mpgwmt{str(index)}"},
+    )
 
-        measuringpointcode = etree.SubElement(measuringpoint_, "measuringPointCode")
-        measuringpointcode.text = data["measuringPoint"]["measuringPointCode"]
+    broId = etree.SubElement(GroundwaterMonitoringTube, "broId")
+    broId.text = str(monitoringtube["broId"])
 
-        monitoringTube = etree.SubElement(measuringpoint_, "monitoringTube")
+    tubeNumber = etree.SubElement(GroundwaterMonitoringTube, "tubeNumber")
+    tubeNumber.text = str(monitoringtube["tubeNumber"])
 
-        GroundwaterMonitoringTube = etree.SubElement(
-            monitoringTube,
-            "GroundwaterMonitoringTube",
-            attrib={("{%s}" % nsmap["gml"]) + "id": f"id_mpgwmt{str(0)}"},
-        )
+    return measuringpoint
 
-        broId = etree.SubElement(GroundwaterMonitoringTube, "broId")
-        broId.text = str(data["measuringPoint"]["monitoringTube"]["broId"])
 
-        tubeNumber = etree.SubElement(GroundwaterMonitoringTube, "tubeNumber")
-        tubeNumber.text = str(data["measuringPoint"]["monitoringTube"]["tubeNumber"])
+def gen_measuringpoints(parent, measuringpoints, nsmap):
+    """
+
+    Parameters
+    ----------
+    parent : etree element
+        element to append the measuringPoint elements to
+    measuringpoints : iterable
+        dictionaries (mapping-like or dataclasses) with the attribute data
+        of the measuringpoints. Iterated once, so a generator over e.g.
+        database rows works without building a list first.
+    nsmap : dictionary
+        namespace mapping
+
+    Returns
+    -------
+    number of appended measuringpoints
+
+    """
 
-        return measuringpoint
+    count = 0
+    for index, point in enumerate(measuringpoints):
+        parent.append(gen_measuringpoint_element(point, nsmap, index))
+        count += 1
+    return count
@@ -1,9 +1,9 @@
 import os
+from collections.abc import Iterator
 from typing import Any
 
 from lxml import etree
 
-from bro_exchange.bhp.connector import deliver_requests, validate_request
 from bro_exchange.broxml.mappings import (  # mappings
     codespace_map_gmn1,
     ns_regreq_map_gmn1,
@@ -25,6 +25,16 @@ from .sourcedocs import (
 )
 
 
+def _materialize_measuringpoints(srcdocdata: dict[str, Any]) -> None:
+    """
+    Read measuringPoints given as an iterator into a list, so the request can
+    be generated (and validated) more than once.
+    """
+
+    if isinstance(srcdocdata.get("measuringPoints"), Iterator):
+        srcdocdata["measuringPoints"] = list(srcdocdata["measuringPoints"])
+
+
 def get_supported_gmn_srcdocs() -> dict[str, tuple[str, ...]]:
     """Return supported GMN source-document names per request type."""
 
@@ -95,6 +105,7 @@ class gmn_registration_request:
             self.kwargs, arglist, "gmw_registration with method initialize"
         )
         self.kwargs["srcdocdata"] = coerce_srcdocdata(self.kwargs["srcdocdata"])
+        _materialize_measuringpoints(self.kwargs["srcdocdata"])
 
         self.requestreference = self.kwargs["requestReference"]
 
@@ -197,6 +208,8 @@ class gmn_registration_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -222,6 +235,8 @@ class gmn_registration_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -289,6 +304,7 @@ class gmn_replace_request:
         check_missing_args(self.kwargs, arglist, "gmw_replace with method initialize")
         check_required_kwargs(self.kwargs, arglist, "gmw_replace with method initialize")
         self.kwargs["srcdocdata"] = coerce_srcdocdata(self.kwargs["srcdocdata"])
+        _materialize_measuringpoints(self.kwargs["srcdocdata"])
 
         self.requestreference = self.kwargs["requestReference"]
 
@@ -375,6 +391,8 @@ class gmn_replace_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -400,6 +418,8 @@ class gmn_replace_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
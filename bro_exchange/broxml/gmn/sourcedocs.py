@@ -11,6 +11,7 @@ from .constructables import (
     gen_enddate,
     gen_eventdate,
     gen_measuringpoint,
+    gen_measuringpoints,
     gen_startdatemonitoring,
 )
 
@@ -65,20 +66,14 @@ def gen_gmn_startregistartion(data):
                 GMN_StartRegistration.append(GMN_StartRegistration_subelements[arg])
 
             elif arg == "measuringPoints":
-                if len(data["measuringPoints"]) < 1:
+                # Single pass, so measuringPoints may also be an iterator
+                count = gen_measuringpoints(
+                    GMN_StartRegistration, data[arg], ns_regreq_map_gmn2
+                )
+                if count < 1:
                     raise Exception(
                         "No measuringPoints provided in input, at least 1 measuringPoint should be provided"
                     )
-                else:
-                    for mp in range(len(data[arg])):
-                        GMN_StartRegistration_subelements[
-                            f"measuringPoint{str(mp)}"
-                        ] = gen_measuringpoint(data, ns_regreq_map_gmn2, mp)
-                        GMN_StartRegistration.append(
-                            GMN_StartRegistration_subelements[
-                                f"measuringPoint{str(mp)}"
-                            ]
-                        )
 
     return sourceDocument
 
@@ -2,10 +2,8 @@ import uuid
 
 from lxml import etree
 
-from bro_exchange.broxml.request_helpers import (
-    coerce_list_of_mapping_like,
-    coerce_mapping_like,
-)
+from bro_exchange.broxml.request_helpers import normalize_srcdocdata
+from bro_exchange.broxml.tags import qualified_names
 from bro_exchange.checks import check_missing_args
 
 # =============================================================================
@@ -17,31 +15,39 @@ from bro_exchange.checks import check_missing_args
 # %%
 
 
-def gen_wellconstructiondate(data, nsmap):
-    WellConstructionDate = etree.Element(
-        ("{%s}" % nsmap["ns"]) + "wellConstructionDate", nsmap=nsmap
-    )
-    date = etree.SubElement(
-        WellConstructionDate, ("{%s}" % nsmap["ns1"]) + "date", nsmap=nsmap
+def normalize_gmw_srcdocdata(data):
+    """
+    Coerce GMW srcdocdata, including deliveredLocation,
+    deliveredVerticalPosition and the monitoringTubes list, once per source
+    document. The constructables use the result without copying it again.
+    """
+    return normalize_srcdocdata(
+        data,
+        mappings=("deliveredLocation", "deliveredVerticalPosition"),
+        lists=("monitoringTubes",),
     )
+
+
+def gen_wellconstructiondate(data, nsmap):
+    names = qualified_names(nsmap)
+    WellConstructionDate = names.element("ns", "wellConstructionDate")
+    date = etree.SubElement(WellConstructionDate, names["ns1", "date"])
     date.text = data["wellConstructionDate"]
     return WellConstructionDate
 
 
 def gen_eventdate(data, nsmap):
-    eventDate = etree.Element(("{%s}" % nsmap["ns"]) + "eventDate", nsmap=nsmap)
-    date = etree.SubElement(eventDate, ("{%s}" % nsmap["ns1"]) + "date", nsmap=nsmap)
+    names = qualified_names(nsmap)
+    eventDate = names.element("ns", "eventDate")
+    date = etree.SubElement(eventDate, names["ns1", "date"])
     date.text = data["eventDate"]
     return eventDate
 
 
 def gen_removaldate(data, nsmap):
-    wellRemovalDate = etree.Element(
-        ("{%s}" % nsmap["ns"]) + "wellRemovalDate", nsmap=nsmap
-    )
-    date = etree.SubElement(
-        wellRemovalDate, ("{%s}" % nsmap["ns1"]) + "date", nsmap=nsmap
-    )
+    names = qualified_names(nsmap)
+    wellRemovalDate = names.element("ns", "wellRemovalDate")
+    date = etree.SubElement(wellRemovalDate, names["ns1", "date"])
     date.text = data["wellRemovalDate"]
     return wellRemovalDate
 
@@ -73,6 +79,7 @@ def gen_deliveredlocation(data, nsmap, codespacemap):
     -------
     The coordinate system is restricted to EPSG::28992
     """
+    names = qualified_names(nsmap)
 
     arglist = {
         "X": "obligated",
@@ -80,27 +87,22 @@ def gen_deliveredlocation(data, nsmap, codespacemap):
         "horizontalPositioningMethod": "obligated",
     }
 
-    data["deliveredLocation"] = coerce_mapping_like(
-        data["deliveredLocation"], "deliveredLocation"
-    )
+    data = normalize_gmw_srcdocdata(data)
 
     check_missing_args(data["deliveredLocation"], arglist, "gen_deliveredlocation")
 
-    deliveredLocation = etree.Element(
-        ("{%s}" % nsmap["ns"]) + "deliveredLocation", nsmap=nsmap
-    )
+    deliveredLocation = names.element("ns", "deliveredLocation")
 
     location = etree.SubElement(
         deliveredLocation,
-        ("{%s}" % nsmap["ns2"]) + "location",
-        nsmap=nsmap,
+        names["ns2", "location"],
         attrib={
-            ("{%s}" % nsmap["ns3"]) + "id": "id-" + str(uuid.uuid4()),
+            names["ns3", "id"]: "id-" + str(uuid.uuid4()),
             "srsName": "urn:ogc:def:crs:EPSG::28992",
         },
     )
 
-    pos = etree.SubElement(location, ("{%s}" % nsmap["ns3"]) + "pos", nsmap=nsmap)
+    pos = etree.SubElement(location, names["ns3", "pos"])
 
     pos.text = "{X} {Y}".format(
         X=str(data["deliveredLocation"]["X"]), Y=str(data["deliveredLocation"]["Y"])
@@ -108,8 +110,7 @@ def gen_deliveredlocation(data, nsmap, codespacemap):
 
     horizontalPositioningMethod = etree.SubElement(
         deliveredLocation,
-        ("{%s}" % nsmap["ns2"]) + "horizontalPositioningMethod",
-        nsmap=nsmap,
+        names["ns2", "horizontalPositioningMethod"],
         codeSpace=codespacemap["horizontalPositioningMethod"],
     )
     horizontalPositioningMethod.text = data["deliveredLocation"][
@@ -123,6 +124,7 @@ def gen_deliveredlocation(data, nsmap, codespacemap):
 
 
 def gen_deliveredverticalposition(data, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     arglist = {
         "localVerticalReferencePoint": "obligated",
         "offset": "obligated",
@@ -131,21 +133,16 @@ def gen_deliveredverticalposition(data, nsmap, codespacemap):
         "groundLevelPositioningMethod": "obligated",
     }
 
-    data["deliveredVerticalPosition"] = coerce_mapping_like(
-        data["deliveredVerticalPosition"], "deliveredVerticalPosition"
-    )
+    data = normalize_gmw_srcdocdata(data)
 
     check_missing_args(
         data["deliveredVerticalPosition"], arglist, "gen_deliveredverticalposition"
     )
 
-    deliveredVerticalPosition = etree.Element(
-        ("{%s}" % nsmap["ns"]) + "deliveredVerticalPosition", nsmap=nsmap
-    )
+    deliveredVerticalPosition = names.element("ns", "deliveredVerticalPosition")
     localVerticalReferencePoint = etree.SubElement(
         deliveredVerticalPosition,
-        ("{%s}" % nsmap["ns2"]) + "localVerticalReferencePoint",
-        nsmap=nsmap,
+        names["ns2", "localVerticalReferencePoint"],
         codeSpace=codespacemap["localVerticalReferencePoint"],
     )
     localVerticalReferencePoint.text = data["deliveredVerticalPosition"][
@@ -154,24 +151,21 @@ def gen_deliveredverticalposition(data, nsmap, codespacemap):
 
     offset = etree.SubElement(
         deliveredVerticalPosition,
-        ("{%s}" % nsmap["ns2"]) + "offset",
-        nsmap=nsmap,
+        names["ns2", "offset"],
         uom="m",
     )
     offset.text = str(data["deliveredVerticalPosition"]["offset"])
 
     verticalDatum = etree.SubElement(
         deliveredVerticalPosition,
-        ("{%s}" % nsmap["ns2"]) + "verticalDatum",
-        nsmap=nsmap,
+        names["ns2", "verticalDatum"],
         codeSpace="urn:bro:gmw:VerticalDatum",
     )
     verticalDatum.text = data["deliveredVerticalPosition"]["verticalDatum"]
 
     groundLevelPosition = etree.SubElement(
         deliveredVerticalPosition,
-        ("{%s}" % nsmap["ns2"]) + "groundLevelPosition",
-        nsmap=nsmap,
+        names["ns2", "groundLevelPosition"],
         uom="m",
     )
     groundLevelPosition.text = str(
@@ -180,8 +174,7 @@ def gen_deliveredverticalposition(data, nsmap, codespacemap):
 
     groundLevelPositioningMethod = etree.SubElement(
         deliveredVerticalPosition,
-        ("{%s}" % nsmap["ns2"]) + "groundLevelPositioningMethod",
-        nsmap=nsmap,
+        names["ns2", "groundLevelPositioningMethod"],
         codeSpace=codespacemap["groundLevelPositioningMethod"],
     )
     groundLevelPositioningMethod.text = data["deliveredVerticalPosition"][
@@ -195,6 +188,7 @@ def gen_deliveredverticalposition(data, nsmap, codespacemap):
 
 
 def gen_materialused(data, tube, nsmap, codespacemap, sourcedoctype):
+    names = qualified_names(nsmap)
     if sourcedoctype in ["GMW_Construction", "construction"]:
         arglist = {
             "tubePackingMaterial": "obligated",
@@ -215,15 +209,14 @@ def gen_materialused(data, tube, nsmap, codespacemap, sourcedoctype):
         f"gen_monitoringtube, tube with index {str(tube)}, gen_materialused",
     )
 
-    materialUsed = etree.Element(("{%s}" % nsmap["ns"]) + "materialUsed", nsmap=nsmap)
+    materialUsed = names.element("ns", "materialUsed")
 
     if "tubePackingMaterial" in list(
         data["monitoringTubes"][tube]["materialUsed"].keys()
     ):
         tubePackingMaterial = etree.SubElement(
             materialUsed,
-            ("{%s}" % nsmap["ns2"]) + "tubePackingMaterial",
-            nsmap=nsmap,
+            names["ns2", "tubePackingMaterial"],
             codeSpace=codespacemap["tubePackingMaterial"],
         )
         tubePackingMaterial.text = str(
@@ -233,8 +226,7 @@ def gen_materialused(data, tube, nsmap, codespacemap, sourcedoctype):
     if "tubeMaterial" in list(data["monitoringTubes"][tube]["materialUsed"].keys()):
         tubeMaterial = etree.SubElement(
             materialUsed,
-            ("{%s}" % nsmap["ns2"]) + "tubeMaterial",
-            nsmap=nsmap,
+            names["ns2", "tubeMaterial"],
             codeSpace=codespacemap["tubeMaterial"],
         )
         tubeMaterial.text = str(
@@ -244,8 +236,7 @@ def gen_materialused(data, tube, nsmap, codespacemap, sourcedoctype):
     if "glue" in list(data["monitoringTubes"][tube]["materialUsed"].keys()):
         glue = etree.SubElement(
             materialUsed,
-            ("{%s}" % nsmap["ns2"]) + "glue",
-            nsmap=nsmap,
+            names["ns2", "glue"],
             codeSpace="urn:bro:gmw:Glue",
         )
         glue.text = str(data["monitoringTubes"][tube]["materialUsed"]["glue"])
@@ -257,6 +248,7 @@ def gen_materialused(data, tube, nsmap, codespacemap, sourcedoctype):
 
 
 def gen_screen(data, tube, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     arglist = {"screenLength": "obligated", "sockMaterial": "obligated"}
 
     check_missing_args(
@@ -265,17 +257,14 @@ def gen_screen(data, tube, nsmap, codespacemap):
         f"gen_monitoringtube, tube with index {str(tube)}, gen_screen",
     )
 
-    screen = etree.Element(("{%s}" % nsmap["ns"]) + "screen", nsmap=nsmap)
+    screen = names.element("ns", "screen")
 
-    screenLength = etree.SubElement(
-        screen, ("{%s}" % nsmap["ns"]) + "screenLength", nsmap=nsmap, uom="m"
-    )
+    screenLength = etree.SubElement(screen, names["ns", "screenLength"], uom="m")
     screenLength.text = str(data["monitoringTubes"][tube]["screen"]["screenLength"])
 
     sockmaterial = etree.SubElement(
         screen,
-        ("{%s}" % nsmap["ns"]) + "sockMaterial",
-        nsmap=nsmap,
+        names["ns", "sockMaterial"],
         codeSpace=codespacemap["sockMaterial"],
     )
     sockmaterial.text = str(data["monitoringTubes"][tube]["screen"]["sockMaterial"])
@@ -287,6 +276,7 @@ def gen_screen(data, tube, nsmap, codespacemap):
 
 
 def gen_plaintubepart(data, tube, nsmap, sourcedoctype):
+    names = qualified_names(nsmap)
     arglist = {"plainTubePartLength": "obligated"}
 
     check_missing_args(
@@ -295,12 +285,11 @@ def gen_plaintubepart(data, tube, nsmap, sourcedoctype):
         f"gen_monitoringtube, tube with index {str(tube)}, gen_plaintubepart",
     )
 
-    plainTubePart = etree.Element(("{%s}" % nsmap["ns"]) + "plainTubePart", nsmap=nsmap)
+    plainTubePart = names.element("ns", "plainTubePart")
 
     plainTubePartLength = etree.SubElement(
         plainTubePart,
-        ("{%s}" % nsmap["ns2"]) + "plainTubePartLength",
-        nsmap=nsmap,
+        names["ns2", "plainTubePartLength"],
         uom="m",
     )
     plainTubePartLength.text = str(
@@ -314,6 +303,7 @@ def gen_plaintubepart(data, tube, nsmap, sourcedoctype):
 
 
 def gen_sedimentsump(data, tube, nsmap):
+    names = qualified_names(nsmap)
     arglist = {"sedimentSumpLength": "obligated"}
 
     check_missing_args(
@@ -322,12 +312,11 @@ def gen_sedimentsump(data, tube, nsmap):
         f"gen_monitoringtube, tube with index {str(tube)}, gen_sedimentsump",
     )
 
-    sedimentSump = etree.Element(("{%s}" % nsmap["ns"]) + "sedimentSump", nsmap=nsmap)
+    sedimentSump = names.element("ns", "sedimentSump")
 
     sedimentSumpLength = etree.SubElement(
         sedimentSump,
-        ("{%s}" % nsmap["ns2"]) + "sedimentSumpLength",
-        nsmap=nsmap,
+        names["ns2", "sedimentSumpLength"],
         uom="m",
     )
     sedimentSumpLength.text = str(
@@ -339,6 +328,7 @@ def gen_sedimentsump(data, tube, nsmap):
 
 # %%
 def gen_electrode(data, tube, geoOhmCableId, electrode, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     arglist = {
         "electrodeNumber": "obligated",
         "electrodePackingMaterial": "obligated",
@@ -356,31 +346,27 @@ def gen_electrode(data, tube, geoOhmCableId, electrode, nsmap, codespacemap):
         f"gen_monitoringtube, tube with index {str(tube)}, geoOhmCable with index {str(geoOhmCableId)}, electrode with index {str(electrode)}",
     )
 
-    electrode = etree.Element(("{%s}" % nsmap["ns"]) + "electrode", nsmap=nsmap)
+    electrode = names.element("ns", "electrode")
 
-    electrodeNumber = etree.SubElement(
-        electrode, ("{%s}" % nsmap["ns2"]) + "electrodeNumber", nsmap=nsmap
-    )
+    electrodeNumber = etree.SubElement(electrode, names["ns2", "electrodeNumber"])
     electrodeNumber.text = str(targetdata["electrodeNumber"])
 
     electrodePackingMaterial = etree.SubElement(
         electrode,
-        ("{%s}" % nsmap["ns2"]) + "electrodePackingMaterial",
-        nsmap=nsmap,
+        names["ns2", "electrodePackingMaterial"],
         codeSpace=codespacemap["electrodePackingMaterial"],
     )
     electrodePackingMaterial.text = str(targetdata["electrodePackingMaterial"])
 
     electrodeStatus = etree.SubElement(
         electrode,
-        ("{%s}" % nsmap["ns2"]) + "electrodeStatus",
-        nsmap=nsmap,
+        names["ns2", "electrodeStatus"],
         codeSpace=codespacemap["electrodeStatus"],
     )
     electrodeStatus.text = str(targetdata["electrodeStatus"])
 
     electrodePosition = etree.SubElement(
-        electrode, ("{%s}" % nsmap["ns2"]) + "electrodePosition", nsmap=nsmap, uom="m"
+        electrode, names["ns2", "electrodePosition"], uom="m"
     )
     electrodePosition.text = str(targetdata["electrodePosition"])
 
@@ -388,6 +374,7 @@ def gen_electrode(data, tube, geoOhmCableId, electrode, nsmap, codespacemap):
 
 
 def adjust_electrode(data, electrode, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     arglist = {
         "tubeNumber": "obligated",
         "cableNumber": "obligated",
@@ -407,27 +394,20 @@ def adjust_electrode(data, electrode, nsmap, codespacemap):
         ),
     )
 
-    electrode = etree.Element(("{%s}" % nsmap["ns"]) + "electrode", nsmap=nsmap)
+    electrode = names.element("ns", "electrode")
 
-    tubeNumber = etree.SubElement(
-        electrode, ("{%s}" % nsmap["ns"]) + "tubeNumber", nsmap=nsmap
-    )
+    tubeNumber = etree.SubElement(electrode, names["ns", "tubeNumber"])
     tubeNumber.text = str(targetdata["tubeNumber"])
 
-    cableNumber = etree.SubElement(
-        electrode, ("{%s}" % nsmap["ns"]) + "cableNumber", nsmap=nsmap
-    )
+    cableNumber = etree.SubElement(electrode, names["ns", "cableNumber"])
     cableNumber.text = str(targetdata["cableNumber"])
 
-    electrodeNumber = etree.SubElement(
-        electrode, ("{%s}" % nsmap["ns"]) + "electrodeNumber", nsmap=nsmap
-    )
+    electrodeNumber = etree.SubElement(electrode, names["ns", "electrodeNumber"])
     electrodeNumber.text = str(targetdata["electrodeNumber"])
 
     electrodeStatus = etree.SubElement(
         electrode,
-        ("{%s}" % nsmap["ns"]) + "electrodeStatus",
-        nsmap=nsmap,
+        names["ns", "electrodeStatus"],
         codeSpace=codespacemap["electrodeStatus"],
     )
     electrodeStatus.text = str(targetdata["electrodeStatus"])
@@ -439,6 +419,7 @@ def adjust_electrode(data, electrode, nsmap, codespacemap):
 
 
 def gen_geoohmcable(data, tube, geoOhmCableId, nsmap, codespacemap):
+    names = qualified_names(nsmap)
     arglist = {"cableNumber": "obligated", "electrodes": "obligated"}
 
     check_missing_args(
@@ -456,11 +437,9 @@ def gen_geoohmcable(data, tube, geoOhmCableId, nsmap, codespacemap):
         )
 
     else:
-        geoOhmCable = etree.Element(("{%s}" % nsmap["ns"]) + "geoOhmCable", nsmap=nsmap)
+        geoOhmCable = names.element("ns", "geoOhmCable")
 
-        cableNumber = etree.SubElement(
-            geoOhmCable, ("{%s}" % nsmap["ns"]) + "cableNumber", nsmap=nsmap
-        )
+        cableNumber = etree.SubElement(geoOhmCable, names["ns", "cableNumber"])
         cableNumber.text = str(geoOhmCableId + 1)
 
         electrodes = {}
@@ -507,6 +486,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
     selected monitoringtube
 
     """
+    names = qualified_names(nsmap)
 
     if sourcedoctype in ["GMW_Construction", "construction"]:
         arglist = {
@@ -552,9 +532,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
     elif sourcedoctype in ["GMW_TubeStatus", "tubeStatus"]:
         arglist = {"tubeNumber": "obligated", "tubeStatus": "obligated"}
 
-    data["monitoringTubes"] = coerce_list_of_mapping_like(
-        data["monitoringTubes"], "monitoringTubes"
-    )
+    data = normalize_gmw_srcdocdata(data)
 
     check_missing_args(
         data["monitoringTubes"][tube],
@@ -562,22 +540,17 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         f"gen_monitoringtube, tube with index {str(tube)}",
     )
 
-    monitoringTube = etree.Element(
-        ("{%s}" % nsmap["ns"]) + "monitoringTube", nsmap=nsmap
-    )
+    monitoringTube = names.element("ns", "monitoringTube")
 
     if sourcedoctype in ["GMW_Construction", "construction"]:
         if "tubeNumber" in list(data["monitoringTubes"][tube].keys()):
-            tubeNumber = etree.SubElement(
-                monitoringTube, ("{%s}" % nsmap["ns"]) + "tubeNumber", nsmap=nsmap
-            )
+            tubeNumber = etree.SubElement(monitoringTube, names["ns", "tubeNumber"])
             tubeNumber.text = str(data["monitoringTubes"][tube]["tubeNumber"])
 
         if "tubeType" in list(data["monitoringTubes"][tube].keys()):
             tubeType = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeType",
-                nsmap=nsmap,
+                names["ns", "tubeType"],
                 codeSpace=codespacemap["tubeType"],
             )
             tubeType.text = data["monitoringTubes"][tube]["tubeType"]
@@ -585,8 +558,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "artesianWellCapPresent" in list(data["monitoringTubes"][tube].keys()):
             artesianWellCapPresent = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "artesianWellCapPresent",
-                nsmap=nsmap,
+                names["ns", "artesianWellCapPresent"],
             )
             artesianWellCapPresent.text = data["monitoringTubes"][tube][
                 "artesianWellCapPresent"
@@ -595,8 +567,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "sedimentSumpPresent" in list(data["monitoringTubes"][tube].keys()):
             sedimentSumpPresent = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "sedimentSumpPresent",
-                nsmap=nsmap,
+                names["ns", "sedimentSumpPresent"],
             )
             sedimentSumpPresent.text = data["monitoringTubes"][tube][
                 "sedimentSumpPresent"
@@ -605,8 +576,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "numberOfGeoOhmCables" in list(data["monitoringTubes"][tube].keys()):
             numberOfGeoOhmCables = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "numberOfGeoOhmCables",
-                nsmap=nsmap,
+                names["ns", "numberOfGeoOhmCables"],
             )
             numberOfGeoOhmCables.text = str(
                 data["monitoringTubes"][tube]["numberOfGeoOhmCables"]
@@ -616,8 +586,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
             if data["monitoringTubes"][tube]["tubeTopDiameter"] is not None:
                 tubeTopDiameter = etree.SubElement(
                     monitoringTube,
-                    ("{%s}" % nsmap["ns"]) + "tubeTopDiameter",
-                    nsmap=nsmap,
+                    names["ns", "tubeTopDiameter"],
                     uom="mm",
                 )
                 tubeTopDiameter.text = str(
@@ -626,15 +595,14 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
             else:
                 tubeTopDiameter = etree.SubElement(
                     monitoringTube,
-                    ("{%s}" % nsmap["ns"]) + "tubeTopDiameter",
-                    nsmap=nsmap,
+                    names["ns", "tubeTopDiameter"],
                     uom="mm",
-                    attrib={("{%s}" % nsmap["xsi"]) + "nil": "true"},
+                    attrib={names["xsi", "nil"]: "true"},
                 )
 
         if "variableDiameter" in list(data["monitoringTubes"][tube].keys()):
             variableDiameter = etree.SubElement(
-                monitoringTube, ("{%s}" % nsmap["ns"]) + "variableDiameter", nsmap=nsmap
+                monitoringTube, names["ns", "variableDiameter"]
             )
             variableDiameter.text = str(
                 data["monitoringTubes"][tube]["variableDiameter"]
@@ -643,8 +611,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "tubeStatus" in list(data["monitoringTubes"][tube].keys()):
             tubeStatus = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeStatus",
-                nsmap=nsmap,
+                names["ns", "tubeStatus"],
                 codeSpace=codespacemap["tubeStatus"],
             )
             tubeStatus.text = data["monitoringTubes"][tube]["tubeStatus"]
@@ -652,8 +619,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "tubeTopPosition" in list(data["monitoringTubes"][tube].keys()):
             tubeTopPosition = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeTopPosition",
-                nsmap=nsmap,
+                names["ns", "tubeTopPosition"],
                 uom="m",
             )
             tubeTopPosition.text = str(data["monitoringTubes"][tube]["tubeTopPosition"])
@@ -661,8 +627,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "tubeTopPositioningMethod" in list(data["monitoringTubes"][tube].keys()):
             tubeTopPositioningMethod = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeTopPositioningMethod",
-                nsmap=nsmap,
+                names["ns", "tubeTopPositioningMethod"],
                 codeSpace=codespacemap["tubeTopPositioningMethod"],
             )
             tubeTopPositioningMethod.text = str(
@@ -707,17 +672,14 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         "shortening",
     ]:
         if "tubeNumber" in list(data["monitoringTubes"][tube].keys()):
-            tubeNumber = etree.SubElement(
-                monitoringTube, ("{%s}" % nsmap["ns"]) + "tubeNumber", nsmap=nsmap
-            )
+            tubeNumber = etree.SubElement(monitoringTube, names["ns", "tubeNumber"])
             tubeNumber.text = str(data["monitoringTubes"][tube]["tubeNumber"])
 
         if sourcedoctype not in ["GMW_Shortening", "shortening"]:
             if "variableDiameter" in list(data["monitoringTubes"][tube].keys()):
                 variableDiameter = etree.SubElement(
                     monitoringTube,
-                    ("{%s}" % nsmap["ns"]) + "variableDiameter",
-                    nsmap=nsmap,
+                    names["ns", "variableDiameter"],
                 )
                 variableDiameter.text = str(
                     data["monitoringTubes"][tube]["variableDiameter"]
@@ -726,8 +688,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
             if "tubeStatus" in list(data["monitoringTubes"][tube].keys()):
                 tubeStatus = etree.SubElement(
                     monitoringTube,
-                    ("{%s}" % nsmap["ns"]) + "tubeStatus",
-                    nsmap=nsmap,
+                    names["ns", "tubeStatus"],
                     codeSpace=codespacemap["tubeStatus"],
                 )
                 tubeStatus.text = data["monitoringTubes"][tube]["tubeStatus"]
@@ -735,8 +696,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "tubeTopPosition" in list(data["monitoringTubes"][tube].keys()):
             tubeTopPosition = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeTopPosition",
-                nsmap=nsmap,
+                names["ns", "tubeTopPosition"],
                 uom="m",
             )
             tubeTopPosition.text = str(data["monitoringTubes"][tube]["tubeTopPosition"])
@@ -744,8 +704,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "tubeTopPositioningMethod" in list(data["monitoringTubes"][tube].keys()):
             tubeTopPositioningMethod = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeTopPositioningMethod",
-                nsmap=nsmap,
+                names["ns", "tubeTopPositioningMethod"],
                 codeSpace=codespacemap["tubeTopPositioningMethod"],
             )
             tubeTopPositioningMethod.text = str(
@@ -758,8 +717,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
             ):
                 tubeMaterial = etree.SubElement(
                     monitoringTube,
-                    ("{%s}" % nsmap["ns"]) + "tubeMaterial",
-                    nsmap=nsmap,
+                    names["ns", "tubeMaterial"],
                     codeSpace=codespacemap["tubeMaterial"],
                 )
                 tubeMaterial.text = str(
@@ -769,8 +727,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
             if "glue" in list(data["monitoringTubes"][tube]["materialUsed"].keys()):
                 glue = etree.SubElement(
                     monitoringTube,
-                    ("{%s}" % nsmap["ns"]) + "glue",
-                    nsmap=nsmap,
+                    names["ns", "glue"],
                     codeSpace="urn:bro:gmw:Glue",
                 )
                 glue.text = str(data["monitoringTubes"][tube]["materialUsed"]["glue"])
@@ -780,8 +737,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         ):
             plainTubePartLength = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "plainTubePartLength",
-                nsmap=nsmap,
+                names["ns", "plainTubePartLength"],
                 uom="m",
             )
             plainTubePartLength.text = str(
@@ -795,16 +751,13 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         "positionsMeasuring",
     ]:
         if "tubeNumber" in list(data["monitoringTubes"][tube].keys()):
-            tubeNumber = etree.SubElement(
-                monitoringTube, ("{%s}" % nsmap["ns"]) + "tubeNumber", nsmap=nsmap
-            )
+            tubeNumber = etree.SubElement(monitoringTube, names["ns", "tubeNumber"])
             tubeNumber.text = str(data["monitoringTubes"][tube]["tubeNumber"])
 
         if "tubeTopPosition" in list(data["monitoringTubes"][tube].keys()):
             tubeTopPosition = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeTopPosition",
-                nsmap=nsmap,
+                names["ns", "tubeTopPosition"],
                 uom="m",
             )
             tubeTopPosition.text = str(data["monitoringTubes"][tube]["tubeTopPosition"])
@@ -812,8 +765,7 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
         if "tubeTopPositioningMethod" in list(data["monitoringTubes"][tube].keys()):
             tubeTopPositioningMethod = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeTopPositioningMethod",
-                nsmap=nsmap,
+                names["ns", "tubeTopPositioningMethod"],
                 codeSpace=codespacemap["tubeTopPositioningMethod"],
             )
             tubeTopPositioningMethod.text = str(
@@ -822,16 +774,13 @@ def gen_monitoringtube(data, tube, nsmap, codespacemap, sourcedoctype):
 
     elif sourcedoctype in ["GMW_TubeStatus", "tubeStatus"]:
         if "tubeNumber" in list(data["monitoringTubes"][tube].keys()):
-            tubeNumber = etree.SubElement(
-                monitoringTube, ("{%s}" % nsmap["ns"]) + "tubeNumber", nsmap=nsmap
-            )
+            tubeNumber = etree.SubElement(monitoringTube, names["ns", "tubeNumber"])
             tubeNumber.text = str(data["monitoringTubes"][tube]["tubeNumber"])
 
         if "tubeStatus" in list(data["monitoringTubes"][tube].keys()):
             tubeStatus = etree.SubElement(
                 monitoringTube,
-                ("{%s}" % nsmap["ns"]) + "tubeStatus",
-                nsmap=nsmap,
+                names["ns", "tubeStatus"],
                 codeSpace=codespacemap["tubeStatus"],
             )
             tubeStatus.text = data["monitoringTubes"][tube]["tubeStatus"]
@@ -3,7 +3,6 @@ from typing import Any
 
 from lxml import etree
 
-from bro_exchange.bhp.connector import deliver_requests, validate_request
 from bro_exchange.broxml.mappings import (  # mappings
     codespace_map_gmw1,
     ns_regreq_map_gmw1,
@@ -475,6 +474,8 @@ class gmw_registration_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -500,6 +501,8 @@ class gmw_registration_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -830,6 +833,8 @@ class gmw_replace_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -855,6 +860,8 @@ class gmw_replace_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -1213,6 +1220,8 @@ class gmw_move_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -1238,6 +1247,8 @@ class gmw_move_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -1568,6 +1579,8 @@ class gmw_delete_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -1593,6 +1606,8 @@ class gmw_delete_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -1909,6 +1924,8 @@ class gmw_insert_request:
     ):
         if self.request is None:
             raise Exception("Request isn't generated yet")
+        from bro_exchange.bhp.connector import validate_request
+
         self.validation_info = validate_request(
             self.request, token, user, password, project_id, demo
         )
@@ -1934,6 +1951,8 @@ class gmw_insert_request:
 
         reqs = {self.requestreference: self.request}
 
+        from bro_exchange.bhp.connector import deliver_requests
+
         self.delivery_info = deliver_requests(
             reqs, token, user, password, project_id, demo
         )
@@ -1,10 +1,5 @@
 from lxml import etree
 
-from bro_exchange.broxml.request_helpers import (
-    coerce_list_of_mapping_like,
-    coerce_mapping_like,
-    coerce_srcdocdata,
-)
 from bro_exchange.checks import check_missing_args
 
 from .constructables import (
@@ -15,6 +10,7 @@ from .constructables import (
     gen_monitoringtube,
     gen_removaldate,
     gen_wellconstructiondate,
+    normalize_gmw_srcdocdata,
 )
 
 # =============================================================================
@@ -28,7 +24,7 @@ from .constructables import (
 
 
 def gen_gmw_construction(data, nsmap, codespacemap, sourcedoctype):
-    data = coerce_srcdocdata(data)
+    data = normalize_gmw_srcdocdata(data)
 
     arglist = {
         "objectIdAccountableParty": "obligated",
@@ -58,19 +54,6 @@ def gen_gmw_construction(data, nsmap, codespacemap, sourcedoctype):
         "monitoringTubes",
     ]
 
-    if "deliveredLocation" in data:
-        data["deliveredLocation"] = coerce_mapping_like(
-            data["deliveredLocation"], "deliveredLocation"
-        )
-    if "deliveredVerticalPosition" in data:
-        data["deliveredVerticalPosition"] = coerce_mapping_like(
-            data["deliveredVerticalPosition"], "deliveredVerticalPosition"
-        )
-    if "monitoringTubes" in data:
-        data["monitoringTubes"] = coerce_list_of_mapping_like(
-            data["monitoringTubes"], "monitoringTubes"
-        )
-
     # Check wether all obligated arguments are in data
     check_missing_args(data, arglist, "gen_gmw_construction")
 
@@ -236,6 +219,8 @@ def gen_gmw_lengthening_shortening(data, nsmap, codespacemap, sourcedoctype):
     # Note: mapSheetCode is a valid optional argument that hasn't been included yet
     constructables = ["eventDate", "monitoringTubes"]
 
+    data = normalize_gmw_srcdocdata(data)
+
     # Check wether all obligated arguments are in data
     check_missing_args(data, arglist, "gen_gmw_lenghtening - gen_gmw_lenghtening")
 
@@ -467,7 +452,7 @@ def gen_gmw_owner(data, nsmap, codespacemap, sourcedoctype):
 
 
 def gen_gmw_positions(data, nsmap, codespacemap, sourcedoctype):
-    data = coerce_srcdocdata(data)
+    data = normalize_gmw_srcdocdata(data)
 
     arglist = {
         "eventDate": "obligated",
@@ -481,15 +466,6 @@ def gen_gmw_positions(data, nsmap, codespacemap, sourcedoctype):
     # Note: mapSheetCode is a valid optional argument that hasn't been included yet
     constructables = ["eventDate", "deliveredVerticalPosition", "monitoringTubes"]
 
-    if "deliveredVerticalPosition" in data:
-        data["deliveredVerticalPosition"] = coerce_mapping_like(
-            data["deliveredVerticalPosition"], "deliveredVerticalPosition"
-        )
-    if "monitoringTubes" in data:
-        data["monitoringTubes"] = coerce_list_of_mapping_like(
-            data["monitoringTubes"], "monitoringTubes"
-        )
-
     # Check wether all obligated arguments are in data
     check_missing_args(data, arglist, "gen_gmw_positions")
 
@@ -721,6 +697,8 @@ def gen_gmw_maintainer(data, nsmap, codespacemap, sourcedoctype):
 
 
 def gen_gmw_tubestatus(data, nsmap, codespacemap, sourcedoctype):
+    data = normalize_gmw_srcdocdata(data)
+
     arglist = {
         "eventDate": "obligated",
         "numberOfTubesChanged": "obligated",
@@ -1112,7 +1090,7 @@ def gen_gmw_groundlevelmeasuring(data, nsmap, codespacemap, sourcedoctype):
 
 
 def gen_gmw_positionsmeasuring(data, nsmap, codespacemap, sourcedoctype):
-    data = coerce_srcdocdata(data)
+    data = normalize_gmw_srcdocdata(data)
 
     arglist = {
         "eventDate": "obligated",
@@ -1124,15 +1102,6 @@ def gen_gmw_positionsmeasuring(data, nsmap, codespacemap, sourcedoctype):
     # Note: mapSheetCode is a valid optional argument that hasn't been included yet
     constructables = ["eventDate", "deliveredVerticalPosition", "monitoringTubes"]
 
-    if "deliveredVerticalPosition" in data:
-        data["deliveredVerticalPosition"] = coerce_mapping_like(
-            data["deliveredVerticalPosition"], "deliveredVerticalPosition"
-        )
-    if "monitoringTubes" in data:
-        data["monitoringTubes"] = coerce_list_of_mapping_like(
-            data["monitoringTubes"], "monitoringTubes"
-        )
-
     # Check wether all obligated arguments are in data
     check_missing_args(data, arglist, "gen_gmw_positionsmeasuring")
 
@@ -135,4 +135,4 @@ ns_gml = "http://www.opengis.net/gml/3.2"
 frd_nsmap = {
     None: ns_isfrd,
     'gml': ns_gml
-}
\ No newline at end of file
+}
@@ -108,3 +108,40 @@ def coerce_list_of_mapping_like(values: Any, context: str) -> list[dict[str, Any
         raise TypeError(f"{context} must be a list")
 
     return [coerce_mapping_like(value, f"{context}[{index}]") for index, value in enumerate(values)]
+
+
+class NormalizedSrcDocData(dict):
+    """Source-document payload whose nested items are already coerced.
+
+    Returned by `normalize_srcdocdata`; normalizing it again is a no-op.
+    """
+
+
+def normalize_srcdocdata(
+    value: Any,
+    mappings: list[str] | tuple[str, ...] = (),
+    lists: list[str] | tuple[str, ...] = (),
+) -> NormalizedSrcDocData:
+    """Coerce srcdocdata and its nested items once.
+
+    Parameters
+    ----------
+    value:
+        srcdocdata input, see `coerce_srcdocdata`.
+    mappings:
+        keys of items that are a single mapping-like object.
+    lists:
+        keys of items that are a list of mapping-like objects.
+    """
+
+    if isinstance(value, NormalizedSrcDocData):
+        return value
+
+    data = NormalizedSrcDocData(coerce_srcdocdata(value))
+    for key in mappings:
+        if data.get(key) is not None:
+            data[key] = coerce_mapping_like(data[key], key)
+    for key in lists:
+        if data.get(key) is not None:
+            data[key] = coerce_list_of_mapping_like(data[key], key)
+    return data
@@ -0,0 +1,67 @@
+"""Cached Clark-notation tag names and element creation per namespace map.
+
+The builders used to format every tag as `("{%s}" % nsmap["ns"]) + "name"`
+and pass `nsmap=` to every SubElement. With `QualifiedNames` each
+`{namespace}name` string is built once per namespace map, and only the
+element that starts a fragment declares the namespace map; its
+descendants use those declarations.
+"""
+
+import functools
+from typing import Any
+
+from lxml import etree
+
+
+class QualifiedNames(dict):
+    """
+    Qualified (Clark notation) names of one namespace map, computed on first
+    use and cached.
+
+    `names["wml2", "point"]` gives `"{http://www.opengis.net/waterml/2.0}point"`
+    for `names = qualified_names(ns_regreq_map_gld3)`.
+    """
+
+    def __init__(self, nsmap: dict[Any, str]):
+        super().__init__()
+        self.nsmap = nsmap
+
+    def __missing__(self, key: tuple[Any, str]) -> str:
+        prefix, name = key
+        qname = self[key] = f"{{{self.nsmap[prefix]}}}{name}"
+        return qname
+
+    def element(
+        self, prefix: Any, name: str, attrib: dict[str, str] | None = None, **extra
+    ) -> etree._Element:
+        """Create an element that declares the namespace map."""
+
+        return etree.Element(self[prefix, name], attrib, nsmap=self.nsmap, **extra)
+
+    def subelement(
+        self,
+        parent: etree._Element,
+        prefix: Any,
+        name: str,
+        attrib: dict[str, str] | None = None,
+        **extra,
+    ) -> etree._Element:
+        """Create a child element that relies on the declarations of its parent."""
+
+        return etree.SubElement(parent, self[prefix, name], attrib, **extra)
+
+
+@functools.lru_cache(maxsize=64)
+def _qualified_names(items: frozenset[tuple[Any, str]]) -> QualifiedNames:
+    return QualifiedNames(dict(items))
+
+
+def qualified_names(nsmap: dict[Any, str]) -> QualifiedNames:
+    """
+    Return the shared `QualifiedNames` of a namespace map.
+
+    Names are cached by the contents of the namespace map, so equal maps
+    share their names; the least recently used of many maps are dropped.
+    """
+
+    return _qualified_names(frozenset(nsmap.items()))
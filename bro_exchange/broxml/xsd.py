@@ -0,0 +1,173 @@
+"""Offline XSD validation of generated requests.
+
+The BRO message schemas (isgmw, isgmn, isgld, isfrd and the schemas they
+import) are read from a local directory that mirrors their urls, e.g.
+`<schema_dir>/isgld/1.0/isgld-messages.xsd` for
+`https://schema.broservices.nl/xsd/isgld/1.0/isgld-messages.xsd`. Schemas
+from other hosts are looked up under `<schema_dir>/<host>/<path>`.
+
+Each schema is compiled into an `lxml.etree.XMLSchema` once and cached per
+request namespace, so validating a request takes no network call.
+"""
+
+import os
+import threading
+from typing import Any
+from urllib.parse import urlparse
+
+from lxml import etree
+
+SCHEMA_HOST = "schema.broservices.nl"
+XSD_DIR_ENV = "BRO_EXCHANGE_XSD_DIR"
+
+
+def schema_url(namespace: str) -> str:
+    """Return the url of the messages schema for a request namespace.
+
+    `http://www.broservices.nl/xsd/isgld/1.0` gives
+    `https://schema.broservices.nl/xsd/isgld/1.0/isgld-messages.xsd`.
+    """
+
+    if "/xsd/" not in namespace:
+        raise Exception(f"Not a BRO request namespace: {namespace}")
+    path = namespace.split("/xsd/", 1)[1].strip("/")
+    name = path.split("/")[0]
+    return f"https://{SCHEMA_HOST}/xsd/{path}/{name}-messages.xsd"
+
+
+class _LocalResolver(etree.Resolver):
+    """Resolve schema urls to files in the local schema directory."""
+
+    def __init__(self, validator: "XsdValidator"):
+        super().__init__()
+        self.validator = validator
+
+    def resolve(self, system_url, public_id, context):
+        path = self.validator.local_path(system_url)
+        if path is None:
+            return None
+        return self.resolve_filename(path, context)
+
+
+class XsdValidator:
+    """
+    Validate requests against locally stored BRO schemas.
+
+    Parameters
+    ----------
+    schema_dir : string or path, optional
+        directory with the schemas. Defaults to the `BRO_EXCHANGE_XSD_DIR`
+        environment variable.
+    """
+
+    def __init__(self, schema_dir: Any = None):
+        if schema_dir is None:
+            schema_dir = os.environ.get(XSD_DIR_ENV)
+        if schema_dir is None:
+            raise Exception(f"No schema directory given and {XSD_DIR_ENV} is not set")
+        self.schema_dir = os.fspath(schema_dir)
+        self._schemas: dict[str, etree.XMLSchema] = {}
+        self._lock = threading.Lock()
+        self._validate_lock = threading.Lock()
+
+    def local_path(self, url: str) -> str | None:
+        """Return the local file of a schema url, or None if not available."""
+
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return url if os.path.exists(url) else None
+
+        path = parsed.path.lstrip("/")
+        candidates = [os.path.join(self.schema_dir, parsed.netloc, path)]
+        if parsed.netloc == SCHEMA_HOST and path.startswith("xsd/"):
+            candidates.insert(0, os.path.join(self.schema_dir, path[4:]))
+
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
+    def schema(self, namespace: str) -> etree.XMLSchema:
+        """Return the compiled schema for a request namespace."""
+
+        schema = self._schemas.get(namespace)
+        if schema is not None:
+            return schema
+
+        with self._lock:
+            if namespace not in self._schemas:
+                url = schema_url(namespace)
+                path = self.local_path(url)
+                if path is None:
+                    raise Exception(f"Schema {url} not found in {self.schema_dir}")
+
+                parser = etree.XMLParser(no_network=True)
+                parser.resolvers.add(_LocalResolver(self))
+                document = etree.parse(path, parser)
+                self._schemas[namespace] = etree.XMLSchema(document)
+            return self._schemas[namespace]
+
+    def validate(self, request: Any) -> dict[str, Any]:
+        """
+        Validate a request against its schema.
+
+        Parameters
+        ----------
+        request : request object, ElementTree, Element, bytes or string
+            generated request; for request objects `request` is used
+
+        Returns
+        -------
+        dict
+            `{"status": "VALIDE" | "NIET_VALIDE", "errors": [...]}`, like
+            the validation info of the bronhouderportaal.
+        """
+
+        root = _request_root(request)
+        schema = self.schema(etree.QName(root).namespace)
+        # The error log lives on the schema, so validations are serialized
+        with self._validate_lock:
+            if schema.validate(root):
+                return {"status": "VALIDE", "errors": []}
+            errors = [
+                f"line {error.line}: {error.message}" for error in schema.error_log
+            ]
+        return {"status": "NIET_VALIDE", "errors": errors}
+
+
+def _request_root(request: Any) -> etree._Element:
+    if not isinstance(request, (bytes, str, etree._Element, etree._ElementTree)):
+        generated = getattr(request, "request", None)
+        if generated is None:
+            # Tree of objects that don't serialize their request, e.g. FRD tools
+            generated = getattr(request, "xml_tree", None)
+        if generated is None:
+            raise Exception("Request isn't generated yet")
+        request = generated
+    if isinstance(request, etree._ElementTree):
+        request = request.getroot()
+    if isinstance(request, etree._Element):
+        if etree.QName(request).namespace is not None:
+            return request
+        # Generated trees set the default namespace as a plain xmlns
+        # attribute, which only takes effect once serialized
+        request = etree.tostring(request)
+    if isinstance(request, str):
+        request = request.encode("utf-8")
+    return etree.fromstring(request)
+
+
+_validators: dict[str, XsdValidator] = {}
+
+
+def validate_xsd(request: Any, schema_dir: Any = None) -> dict[str, Any]:
+    """
+    Validate a request against the local BRO schemas.
+
+    The compiled schemas are kept per schema directory, so repeated calls
+    only pay for the validation itself. See `XsdValidator.validate`.
+    """
+
+    validator = XsdValidator(schema_dir)
+    validator = _validators.setdefault(validator.schema_dir, validator)
+    return validator.validate(request)
@@ -0,0 +1,118 @@
+"""Lazy star re-exports for packages (PEP 562).
+
+`bro_exchange` and `bro_exchange.broxml` used to star import all of their
+submodules, so importing any part of the package loaded the connector
+(requests) and every source document family. They now resolve their
+re-exported names on first attribute access instead, through a static map
+of the module that defines each name:
+
+    import bro_exchange.broxml.gmn      # loads gmn and what it imports
+    bro_exchange.gld_registration_request  # loads the gld modules on demand
+    from bro_exchange import *          # loads everything, as before
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def _public_names(module):
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith("_")]
+    return names
+
+
+def _name_index(names):
+    """
+    Flatten {module: names} into {name: module}, a name of a later module
+    winning. Modules with names None contribute the `_LAZY_NAMES` of that
+    (lazy) package.
+    """
+    index = {}
+    for module, module_names in names.items():
+        if module_names is None:
+            index.update(_name_index(importlib.import_module(module)._LAZY_NAMES))
+        else:
+            index.update(dict.fromkeys(module_names, module))
+    return index
+
+
+def lazy_star_imports(package, submodules, names):
+    """
+    Return the module `__getattr__` and `__dir__` of a package that
+    re-exports the public names of its submodules.
+
+    Parameters
+    ----------
+    package : string
+        `__name__` of the package.
+    submodules : list of strings
+        full names of the modules that used to be star imported, in the
+        same order. `__all__` (and so a star import) loads all of them.
+    names : dict
+        {module: names} of the re-exported names; looking one up only
+        imports its module. A name of a later module wins over an earlier
+        one. A lazy package may be given with names None, for the names it
+        re-exports itself. Other public names of the submodules (e.g.
+        modules they import) are found by importing the submodules in turn.
+
+    Returns
+    -------
+    (__getattr__, __dir__)
+    """
+
+    namespace = sys.modules[package].__dict__
+    index = {}
+
+    def _lookup(name):
+        if not index:
+            index.update(_name_index(names))
+        module = index.get(name)
+        if module is not None:
+            return getattr(importlib.import_module(module), name)
+
+        for submodule in reversed(submodules):
+            module = importlib.import_module(submodule)
+            exported = vars(module).get("__all__")
+            if exported is not None and name not in exported:
+                continue
+            try:
+                return getattr(module, name)
+            except AttributeError:
+                continue
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __getattr__(name):
+        if name == "__all__":
+            names = {}
+            for submodule in submodules:
+                module = importlib.import_module(submodule)
+                names[submodule.rpartition(".")[2]] = None
+                names.update(dict.fromkeys(_public_names(module)))
+            # Other submodules that got loaded on the way, as a star import
+            # exported those too
+            names.update(
+                (key, None)
+                for key, value in list(namespace.items())
+                if not key.startswith("_")
+                and isinstance(value, ModuleType)
+                and value.__name__ != __name__
+            )
+            namespace["__all__"] = list(names)
+            return namespace["__all__"]
+        if name.startswith("_"):
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        # Submodules of the package itself, e.g. bro_exchange.broxml.gld
+        if importlib.util.find_spec(f"{package}.{name}") is not None:
+            return importlib.import_module(f"{package}.{name}")
+
+        value = namespace[name] = _lookup(name)
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(__getattr__("__all__")))
+
+    return __getattr__, __dir__
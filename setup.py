@@ -22,7 +22,7 @@ setup(
     author_email="karlschutt@outlook.com, steven.hosper@nelen-schuurmans.nl",
     maintainer="Steven Hosper, Jelle Zitman",
     maintainer_email="steven.hosper@nelen-schuurmans.nl, jelle.zitman@nelen-schuurmans.nl",
-    packages=find_packages(exclude=["tests", "examples"]),
+    packages=find_packages(exclude=["tests", "examples", "benchmarks"]),
     install_requires=["requests>=2.24.0", "lxml>=4.6.1"],
     keywords=[
         "python",
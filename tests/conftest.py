@@ -0,0 +1,93 @@
+import io
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+BASE_URL = "https://demo.bronhouderportaal-bro.nl/api/v2"
+
+
+def _json_response(status_code=200, body=None, headers=None):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = json.dumps({} if body is None else body).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+class RecordingSession(requests.Session):
+    """
+    Session that answers like the demo bronhouderportaal and records the
+    calls and the source documents it receives.
+
+    `failures` maps a url, or the filename or content of a source document,
+    to the status codes of its next responses.
+    """
+
+    def __init__(self, failures=None, delay=0):
+        super().__init__()
+        self.calls = []
+        self.documents = []
+        self.failures = failures or {}
+        self.delay = delay
+        self.uploads = 0
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            self.calls.append((method, url))
+            status_code = self._failure(url)
+        if status_code is not None:
+            return _json_response(status_code)
+        if url.endswith("/brondocumenten"):
+            return self._add_sourcedocument(kwargs)
+        if url.endswith("/uploads"):
+            with self.lock:
+                self.uploads += 1
+                location = f"{BASE_URL}/1/uploads/{self.uploads}"
+            return _json_response(201, headers={"Location": location})
+        if url.endswith("/leveringen") and method == "GET":
+            return _json_response(200, [])
+        if url.endswith("/leveringen"):
+            location = f"{BASE_URL}/1/leveringen/9"
+            return _json_response(201, headers={"Location": location})
+        if url.endswith("/validatie"):
+            return _json_response(200, {"status": "VALIDE"})
+        return _json_response(200, {"identifier": "9"})
+
+    def _failure(self, key):
+        failures = self.failures.get(key)
+        return failures.pop(0) if failures else None
+
+    def _add_sourcedocument(self, kwargs):
+        body = kwargs["data"]
+        streamed = isinstance(body, io.IOBase)
+        content = body.read() if streamed else body
+        filename = kwargs.get("params", {}).get("filename")
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+            self.documents.append(
+                {"filename": filename, "content": content, "streamed": streamed}
+            )
+            status_code = self._failure(filename) or self._failure(content) or 201
+        return _json_response(status_code, {"size": len(content)})
+
+
+@pytest.fixture
+def json_response():
+    """Factory of responses with a json body."""
+    return _json_response
+
+
+@pytest.fixture
+def recording_session():
+    """Factory of sessions that answer like the demo bronhouderportaal."""
+    return RecordingSession
@@ -0,0 +1,175 @@
+import json
+
+import pytest
+import requests
+from lxml import etree
+
+from bro_exchange.broxml import batch as batch_module
+from bro_exchange.broxml.frd.requests import FRDClosureTool
+from bro_exchange.broxml.gld import requests as gld_requests_module
+
+
+def _stub_source_document(*_args, **_kwargs):
+    source_document = etree.Element("sourceDocument")
+    etree.SubElement(source_document, "Stub")
+    return source_document
+
+
+def _response(body):
+    response = requests.models.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+class DeliveryClient:
+    """Client that records the uploads and delivers each one."""
+
+    def __init__(self, fail_uploads=()):
+        self.uploads = {}
+        self.fail_uploads = fail_uploads
+        self.closed = False
+
+    def create_upload(self):
+        upload = f"https://bhp.test/api/v2/1/uploads/{len(self.uploads) + 1}"
+        self.uploads[upload] = None
+        return upload
+
+    def add_sourcedocuments(self, upload_url_id, reqs, max_workers=4):
+        if len(self.uploads) in self.fail_uploads:
+            raise ConnectionError("portal down")
+        self.uploads[upload_url_id] = dict(reqs)
+
+    def create_delivery(self, upload_url_id):
+        identifier = "L" + upload_url_id.rsplit("/", 1)[-1]
+        return _response({"identifier": identifier, "status": "AANGELEVERD"})
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def valid_requests(monkeypatch):
+    monkeypatch.setattr(
+        gld_requests_module, "gen_gld_startregistration", _stub_source_document
+    )
+
+    generated = []
+    for number in range(5):
+        request = gld_requests_module.gld_registration_request(
+            "GLD_StartRegistration",
+            requestReference=f"gld-{number}",
+            qualityRegime="IMBRO",
+            srcdocdata={},
+        )
+        request.generate()
+        request.validation_status = "VALIDE"
+        generated.append(request)
+    return generated
+
+
+def test_batcher_splits_uploads_by_documents(valid_requests):
+    client = DeliveryClient()
+
+    with batch_module.DeliveryBatcher(client, max_documents=2) as batcher:
+        for request in valid_requests:
+            batcher.add(request)
+
+    assert [list(reqs) for reqs in client.uploads.values()] == [
+        ["gld-0", "gld-1"],
+        ["gld-2", "gld-3"],
+        ["gld-4"],
+    ]
+    assert [request.delivery_id for request in valid_requests] == [
+        "L1",
+        "L1",
+        "L2",
+        "L2",
+        "L3",
+    ]
+    assert valid_requests[4].delivery_info.json()["status"] == "AANGELEVERD"
+    assert not client.closed
+
+
+def test_batcher_splits_uploads_by_bytes(valid_requests):
+    client = DeliveryClient()
+    size = len(valid_requests[0].request)
+
+    with batch_module.DeliveryBatcher(client, max_bytes=int(size * 2.5)) as batcher:
+        for request in valid_requests:
+            batcher.add(request)
+
+    assert [len(reqs) for reqs in client.uploads.values()] == [2, 2, 1]
+
+
+def test_batcher_starts_a_new_upload_for_a_duplicate_reference(valid_requests):
+    client = DeliveryClient()
+    valid_requests[1].requestreference = "gld-0"
+
+    with batch_module.DeliveryBatcher(client) as batcher:
+        batcher.add(valid_requests[0])
+        batcher.add(valid_requests[1])
+
+    assert len(client.uploads) == 2
+
+
+def test_batcher_requires_valid_requests(valid_requests):
+    valid_requests[0].validation_status = "NIET_VALIDE"
+    batcher = batch_module.DeliveryBatcher(DeliveryClient())
+
+    with pytest.raises(Exception, match="gld-0 isn't valid"):
+        batcher.add(valid_requests[0])
+
+
+def test_failed_upload_keeps_requests_undelivered(valid_requests):
+    batcher = batch_module.DeliveryBatcher(DeliveryClient(fail_uploads=[1]))
+    batcher.add(valid_requests[0])
+
+    with pytest.raises(Exception, match="failed to deliver requests \\['gld-0'\\]"):
+        batcher.flush()
+
+    assert valid_requests[0].delivery_id is None
+    assert batcher.deliveries[0]["exception"] == "ConnectionError('portal down')"
+
+
+def test_deliver_many_continues_after_a_failed_upload(valid_requests):
+    client = DeliveryClient(fail_uploads=[2])
+
+    deliveries = batch_module.deliver_many(
+        valid_requests, client=client, max_documents=2
+    )
+
+    assert [row["delivery_id"] for row in deliveries] == ["L1", None, "L3"]
+    assert deliveries[1]["requestReferences"] == ["gld-2", "gld-3"]
+    assert [request.delivery_id for request in valid_requests] == [
+        "L1",
+        "L1",
+        None,
+        None,
+        "L3",
+    ]
+
+
+def test_deliver_many_accepts_frd_requests():
+    frd = FRDClosureTool(
+        metadata={"request_reference": "frd-1", "quality_regime": "IMBRO"},
+        srcdocdata={},
+        request_type="registration",
+    )
+    frd.generate_xml_file()
+    frd.validation_status = "VALIDE"
+    client = DeliveryClient()
+
+    deliveries = batch_module.deliver_many([frd], client=client)
+
+    assert deliveries[0]["delivery_id"] == "L1"
+    assert list(client.uploads.values()) == [{"frd-1": frd.request}]
+    assert frd.delivery_id == "L1"
+
+
+def test_frd_request_without_reference_is_rejected():
+    frd = FRDClosureTool(metadata={}, srcdocdata={}, request_type="registration")
+    frd.generate_xml_file()
+
+    with pytest.raises(Exception, match="FRDClosureTool has no request reference"):
+        batch_module.DeliveryBatcher(DeliveryClient()).add(frd)
@@ -0,0 +1,103 @@
+import copy
+
+from bro_exchange.bhp.cache import canonical_request
+from bro_exchange.broxml import batch as batch_module
+from bro_exchange.broxml.gmw.requests import gmw_registration_request
+
+CONSTRUCTION = {
+    "objectIdAccountableParty": "obj-001",
+    "deliveryContext": "aanlevering",
+    "constructionStandard": "NEN",
+    "initialFunction": "monitoring",
+    "numberOfMonitoringTubes": 1,
+    "groundLevelStable": "ja",
+    "owner": 12345678,
+    "wellHeadProtector": "geen",
+    "wellConstructionDate": "2024-01-01",
+    "deliveredLocation": {
+        "X": 120000.0,
+        "Y": 480000.0,
+        "horizontalPositioningMethod": "ingemeten",
+    },
+    "deliveredVerticalPosition": {
+        "localVerticalReferencePoint": "maaiveld",
+        "offset": 0.0,
+        "verticalDatum": "NAP",
+        "groundLevelPosition": 1.2,
+        "groundLevelPositioningMethod": "ingemeten",
+    },
+    "monitoringTubes": [
+        {
+            "tubeNumber": 1,
+            "tubeType": "peilbuis",
+            "artesianWellCapPresent": "nee",
+            "sedimentSumpPresent": "nee",
+            "numberOfGeoOhmCables": 0,
+            "tubeTopDiameter": 63,
+            "variableDiameter": "nee",
+            "tubeStatus": "inGebruik",
+            "tubeTopPosition": 0.5,
+            "tubeTopPositioningMethod": "ingemeten",
+            "materialUsed": {
+                "tubePackingMaterial": "zand",
+                "tubeMaterial": "pvc",
+                "glue": "geen",
+            },
+            "screen": {"screenLength": 2.0, "sockMaterial": "geen"},
+            "plainTubePart": {"plainTubePartLength": 1.0},
+        }
+    ],
+}
+
+
+def _job(number):
+    srcdocdata = copy.deepcopy(CONSTRUCTION)
+    srcdocdata["objectIdAccountableParty"] = f"obj-{number:03d}"
+    return (
+        "GMW_Construction",
+        {
+            "requestReference": f"gmw-{number:03d}",
+            "qualityRegime": "IMBRO",
+            "srcdocdata": srcdocdata,
+        },
+    )
+
+
+def _generate(job):
+    request = gmw_registration_request(job[0], **copy.deepcopy(job[1]))
+    request.generate()
+    return canonical_request(request.request)
+
+
+def test_generate_many_returns_serialized_requests_in_order():
+    jobs = [_job(number) for number in range(6)]
+
+    results = batch_module.generate_many(jobs, max_workers=2, chunksize=2)
+
+    assert [result["requestReference"] for result in results] == [
+        f"gmw-{number:03d}" for number in range(6)
+    ]
+    assert all(result["error"] is None for result in results)
+    assert canonical_request(results[3]["request"]) == _generate(jobs[3])
+
+
+def test_generate_many_captures_errors_per_job():
+    jobs = [_job(0), ("GMW_Unknown", _job(1)[1]), _job(2)]
+
+    results = batch_module.generate_many(jobs, max_workers=2)
+
+    assert results[0]["error"] is None
+    assert results[1]["error"] == "Exception: Sourcedocument type not allowed"
+    assert results[1]["request"] is None
+    assert results[2]["error"] is None
+
+
+def test_generate_many_writes_files(tmp_path):
+    jobs = [_job(number) for number in range(3)]
+
+    results = batch_module.generate_many(jobs, max_workers=2, output_dir=tmp_path)
+
+    for job, result in zip(jobs, results):
+        assert result["request"] is None
+        with open(result["file"], "rb") as file:
+            assert canonical_request(file.read()) == _generate(job)
@@ -0,0 +1,177 @@
+import threading
+import time
+
+import pytest
+from lxml import etree
+
+from bro_exchange.bhp import client as client_module
+from bro_exchange.broxml import batch as batch_module
+from bro_exchange.broxml.frd.requests import FRDClosureTool
+from bro_exchange.broxml.gld import requests as gld_requests_module
+from bro_exchange.broxml.gmn import requests as gmn_requests_module
+
+
+def _stub_source_document(*_args, **_kwargs):
+    source_document = etree.Element("sourceDocument")
+    etree.SubElement(source_document, "Stub")
+    return source_document
+
+
+class ValidationClient:
+    """Client that answers validations per requestReference."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    def validate_request(self, payload):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        reference = etree.fromstring(payload).findtext(".//{*}requestReference")
+        answer = self.answers[reference]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def generated_requests(monkeypatch):
+    monkeypatch.setattr(
+        gld_requests_module, "gen_gld_startregistration", _stub_source_document
+    )
+    monkeypatch.setattr(
+        gmn_requests_module, "gen_gmn_startregistartion", _stub_source_document
+    )
+
+    gld = gld_requests_module.gld_registration_request(
+        "GLD_StartRegistration",
+        requestReference="gld-1",
+        qualityRegime="IMBRO",
+        srcdocdata={},
+    )
+    gmn = gmn_requests_module.gmn_registration_request(
+        "GMN_StartRegistration",
+        requestReference="gmn-1",
+        qualityRegime="IMBRO",
+        srcdocdata={},
+    )
+    gld_replace = gld_requests_module.gld_replace_request(
+        "GLD_StartRegistration",
+        requestReference="gld-2",
+        qualityRegime="IMBRO",
+        correctionReason="other",
+        broId="GLD000000000001",
+        srcdocdata={},
+    )
+    requests = [gld, gmn, gld_replace]
+    for request in requests:
+        request.generate()
+    return requests
+
+
+def test_validate_many_fills_in_validation_results(generated_requests):
+    client = ValidationClient(
+        {
+            "gld-1": {"status": "VALIDE", "errors": []},
+            "gmn-1": {"status": "NIET_VALIDE", "errors": ["a", "b"]},
+            "gld-2": ConnectionError("portal down"),
+        }
+    )
+
+    summary = batch_module.validate_many(generated_requests, client=client)
+
+    assert summary == [
+        {
+            "requestReference": "gld-1",
+            "type": "gld_registration_request",
+            "status": "VALIDE",
+            "errors": 0,
+            "exception": None,
+        },
+        {
+            "requestReference": "gmn-1",
+            "type": "gmn_registration_request",
+            "status": "NIET_VALIDE",
+            "errors": 2,
+            "exception": None,
+        },
+        {
+            "requestReference": "gld-2",
+            "type": "gld_replace_request",
+            "status": None,
+            "errors": None,
+            "exception": "ConnectionError('portal down')",
+        },
+    ]
+    gld, gmn, gld_replace = generated_requests
+    assert gld.validation_status == "VALIDE"
+    assert gmn.validation_info == {"status": "NIET_VALIDE", "errors": ["a", "b"]}
+    assert gld_replace.validation_info is None
+    assert not client.closed
+
+
+def test_validate_many_is_concurrent_and_bounded(generated_requests):
+    requests = generated_requests * 4
+    client = ValidationClient(
+        {reference: {"status": "VALIDE"} for reference in ("gld-1", "gmn-1", "gld-2")}
+    )
+
+    summary = batch_module.validate_many(requests, client=client, max_workers=3)
+
+    assert len(summary) == 12
+    assert 1 < client.max_in_flight <= 3
+
+
+def test_validate_many_creates_and_closes_client(monkeypatch, generated_requests):
+    client = ValidationClient({})
+    created = {}
+
+    def _client(**kwargs):
+        created.update(kwargs)
+        return client
+
+    monkeypatch.setattr(client_module, "BronhouderportaalClient", _client)
+
+    assert (
+        batch_module.validate_many([], user="user", password="pass", project_id=1) == []
+    )
+    assert created["project_id"] == 1
+    assert client.closed
+
+
+def test_validate_many_requires_generated_requests(generated_requests):
+    generated_requests[1].request = None
+
+    with pytest.raises(Exception, match="gmn-1 isn't generated yet"):
+        batch_module.validate_many(generated_requests, client=ValidationClient({}))
+
+
+def test_validate_many_accepts_frd_requests():
+    frd = FRDClosureTool(
+        metadata={"request_reference": "frd-1", "quality_regime": "IMBRO"},
+        srcdocdata={},
+        request_type="registration",
+    )
+    frd.generate_xml_file()
+    client = ValidationClient({"frd-1": {"status": "VALIDE", "errors": []}})
+
+    summary = batch_module.validate_many([frd], client=client)
+
+    assert summary[0]["requestReference"] == "frd-1"
+    assert summary[0]["type"] == "FRDClosureTool"
+    assert frd.validation_status == "VALIDE"
+
+
+def test_validate_many_rejects_unsupported_objects():
+    with pytest.raises(Exception, match="Unsupported request object dict"):
+        batch_module.validate_many([{"request": b"<r/>"}], client=ValidationClient({}))
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bro_exchange.bhp.async_client import AsyncBronhouderportaalClient
+
+
+class StubPortaal(ThreadingHTTPServer):
+    """Local stand-in for the bronhouderportaal api that tracks concurrency."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sourcedocuments = []
+        self.base_url = f"http://127.0.0.1:{self.server_port}/api/v2"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def _reply(self, status, body=None, location=None):
+        content = json.dumps(body or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        if location is not None:
+            self.send_header("Location", self.server.base_url + location)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self):
+        server = self.server
+        payload = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(0.02)
+        with server.lock:
+            server.in_flight -= 1
+
+        if self.path.endswith("/validatie"):
+            self._reply(200, {"status": "VALIDE", "size": len(payload)})
+        elif self.path.endswith("/uploads"):
+            self._reply(201, location="/1/uploads/7")
+        elif "/brondocumenten" in self.path:
+            server.sourcedocuments.append(self.path.split("filename=")[-1])
+            self._reply(201)
+        elif self.path.endswith("/leveringen"):
+            self._reply(201, location="/1/leveringen/9")
+        else:
+            self._reply(404)
+
+    def do_GET(self):
+        self._reply(200, {"identifier": self.path.split("/")[-1]})
+
+
+@pytest.fixture
+def portaal():
+    server = StubPortaal()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(portaal, max_concurrency):
+    return AsyncBronhouderportaalClient(
+        user="user",
+        password="pass",
+        project_id=1,
+        max_concurrency=max_concurrency,
+        base_url=portaal.base_url,
+    )
+
+
+def test_validate_requests_respects_concurrency_limit(portaal):
+    payloads = [b"<a/>" * (i + 1) for i in range(20)]
+
+    async def run():
+        async with _client(portaal, max_concurrency=4) as client:
+            return await client.validate_requests(payloads)
+
+    results = asyncio.run(run())
+
+    assert [result["size"] for result in results] == [len(p) for p in payloads]
+    assert 1 < portaal.max_in_flight <= 4
+
+
+def test_deliver_requests_adds_all_documents_before_delivery(portaal):
+    reqs = {f"doc_{i}.xml": b"<a/>" for i in range(10)}
+
+    async def run():
+        async with _client(portaal, max_concurrency=5) as client:
+            delivery = await client.deliver_requests(reqs)
+            status = await client.check_delivery_status("9")
+            return delivery, status
+
+    delivery, status = asyncio.run(run())
+
+    assert delivery.json() == {"identifier": "9"}
+    assert status.json() == {"identifier": "9"}
+    assert sorted(portaal.sourcedocuments) == sorted(reqs)
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(Exception, match="max_concurrency"):
+        AsyncBronhouderportaalClient(
+            user="user", password="pass", project_id=1, max_concurrency=0
+        )
+
+
+def test_max_concurrency_exceeds_the_default_executor():
+    # One more than the default executor of the event loop allows
+    parties = min(32, (os.cpu_count() or 1) + 4) + 1
+    barrier = threading.Barrier(parties, timeout=5)
+
+    async def run():
+        async with AsyncBronhouderportaalClient(
+            user="user", password="pass", project_id=1, max_concurrency=parties
+        ) as client:
+            client.client.validate_request = lambda payload: barrier.wait()
+            return await client.validate_requests([b"<a/>"] * parties)
+
+    assert sorted(asyncio.run(run())) == list(range(parties))
+
+
+def test_close_does_not_block_the_event_loop():
+    release = threading.Event()
+
+    async def run():
+        client = AsyncBronhouderportaalClient(
+            user="user", password="pass", project_id=1
+        )
+        client.client.validate_request = lambda payload: release.wait(5)
+        call = asyncio.ensure_future(client.validate_request(b"<a/>"))
+        await asyncio.sleep(0.01)
+
+        closing = asyncio.ensure_future(client.close())
+        await asyncio.sleep(0.01)
+        # The loop still runs while close() waits for the call in flight
+        assert not closing.done()
+        release.set()
+        await closing
+        return await call
+
+    assert asyncio.run(run()) is True
@@ -0,0 +1,115 @@
+import json
+import os
+import time
+
+import pytest
+import requests
+
+from bro_exchange.bhp import cache as cache_module
+from bro_exchange.bhp.cache import ValidationCache, canonical_request
+from bro_exchange.bhp.connector import validate_request
+
+REQUEST = """<registrationRequest xmlns="http://www.broservices.nl/xsd/isgld/1.0"
+    xmlns:brocom="http://www.broservices.nl/xsd/brocommon/3.0"
+    xmlns:gml="http://www.opengis.net/gml/3.2"
+    xmlns:xlink="http://www.w3.org/1999/xlink">
+  <brocom:requestReference>{reference}</brocom:requestReference>
+  <observation gml:id="{observation_id}">
+    <time gml:id="{time_id}">2019-01-28</time>
+    <resultTime xlink:href="#{time_id}"/>
+    <value>{value}</value>
+  </observation>
+</registrationRequest>"""
+
+
+def _request(reference="ref-1", observation_id="_a1", time_id="_t1", value="1.0"):
+    return REQUEST.format(
+        reference=reference, observation_id=observation_id, time_id=time_id, value=value
+    ).encode()
+
+
+class CountingSession(requests.Session):
+    def __init__(self):
+        super().__init__()
+        self.posts = 0
+
+    def request(self, method, url, **kwargs):
+        self.posts += 1
+        response = requests.models.Response()
+        response.status_code = 200
+        response._content = json.dumps({"status": "VALIDE", "errors": []}).encode()
+        return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ValidationCache(tmp_path / "cache")
+
+
+def test_key_ignores_request_reference_and_gml_ids(cache):
+    key = cache.key(_request(), 1, "url")
+
+    assert key == cache.key(_request("ref-2", "_b2", "_t9"), 1, "url")
+    assert key != cache.key(_request(value="2.0"), 1, "url")
+    assert key != cache.key(_request(), 2, "url")
+    assert key != cache.key(_request(), 1, "demo-url")
+
+
+def test_references_to_gml_ids_are_renumbered():
+    canonical = canonical_request(_request(time_id="_t7"))
+
+    assert b'xlink:href="#id_1"' in canonical
+    assert b"_t7" not in canonical
+
+
+def test_validate_request_uses_cache(cache):
+    session = CountingSession()
+    kwargs = {"user": "u", "password": "p", "project_id": 1, "session": session}
+
+    first = validate_request(_request(), cache=cache, **kwargs)
+    second = validate_request(_request("ref-2", "_b2"), cache=cache, **kwargs)
+
+    assert first == second == {"status": "VALIDE", "errors": []}
+    assert session.posts == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_default_cache_is_used_by_validate_request(monkeypatch, cache):
+    monkeypatch.setattr(cache_module, "_validation_cache", None)
+    session = CountingSession()
+    kwargs = {"user": "u", "password": "p", "project_id": 1, "session": session}
+
+    cache_module.set_validation_cache(cache)
+    validate_request(_request(), **kwargs)
+    validate_request(_request(), **kwargs)
+
+    assert session.posts == 1
+
+
+def test_expired_entries_are_ignored(cache):
+    cache.ttl = 60
+    cache.put("key", {"status": "VALIDE"})
+    path = os.path.join(cache.directory, "key.json")
+    with open(path) as file:
+        entry = json.load(file)
+    entry["created"] -= 61
+    with open(path, "w") as file:
+        json.dump(entry, file)
+
+    assert cache.get("key") is None
+    assert not os.path.exists(path)
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.max_entries = 2
+    for number, key in enumerate(["a", "b"]):
+        cache.put(key, {"status": key})
+        os.utime(os.path.join(cache.directory, f"{key}.json"), (number, number))
+
+    assert cache.get("a") == {"status": "a"}
+    time.sleep(0.01)
+    cache.put("c", {"status": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"status": "a"}
+    assert cache.get("c") == {"status": "c"}
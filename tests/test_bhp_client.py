@@ -0,0 +1,115 @@
+import pytest
+import requests
+
+from bro_exchange.bhp.client import BronhouderportaalClient
+from bro_exchange.bhp.retry import RetryPolicy
+
+BASE_URL = "https://demo.bronhouderportaal-bro.nl/api/v2"
+
+
+@pytest.fixture
+def client(recording_session):
+    retry_policy = RetryPolicy(jitter=False)
+    retry_policy.sleep = lambda _delay: None
+    with BronhouderportaalClient(
+        user="user",
+        password="pass",
+        project_id=1,
+        demo=True,
+        session=recording_session(delay=0.01),
+        retry_policy=retry_policy,
+    ) as client:
+        yield client
+
+
+def _fail_without_session(*_args, **_kwargs):
+    raise AssertionError("module level requests function used")
+
+
+def test_client_uses_its_session_for_every_call(monkeypatch, client):
+    monkeypatch.setattr(requests, "post", _fail_without_session)
+    monkeypatch.setattr(requests, "get", _fail_without_session)
+
+    assert client.validate_request(b"<xml/>") == {"status": "VALIDE"}
+    delivery = client.deliver_requests({"a.xml": b"<a/>", "b.xml": b"<b/>"})
+    assert delivery.json() == {"identifier": "9"}
+    client.check_delivery_status("9")
+
+    assert client.session.calls == [
+        ("POST", f"{BASE_URL}/1/validatie"),
+        ("POST", f"{BASE_URL}/1/uploads"),
+        ("POST", f"{BASE_URL}/1/uploads/1/brondocumenten"),
+        ("POST", f"{BASE_URL}/1/uploads/1/brondocumenten"),
+        ("POST", f"{BASE_URL}/1/leveringen"),
+        ("GET", f"{BASE_URL}/1/leveringen/9"),
+        ("GET", f"{BASE_URL}/1/leveringen/9"),
+    ]
+
+
+def test_client_resolves_auth_and_pool_once(client):
+    assert client.base_url == BASE_URL
+    assert client.session.auth == ("user", "pass")
+    assert client.session.get_adapter(BASE_URL)._pool_maxsize == 10
+
+
+def test_client_requires_authentication():
+    with pytest.raises(Exception, match="No user / password supplied"):
+        BronhouderportaalClient(project_id=1)
+
+
+def test_sourcedocuments_are_uploaded_concurrently(client):
+    reqs = {f"doc_{i}.xml": b"<a/>" for i in range(12)}
+
+    responses = client.add_sourcedocuments(
+        f"{BASE_URL}/1/uploads/1", reqs, max_workers=3
+    )
+
+    assert list(responses) == list(reqs)
+    assert 1 < client.session.max_in_flight <= 3
+
+
+def test_sourcedocument_upload_is_retried_on_unavailable_and_rate_limit(client):
+    client.session.failures = {"doc_1.xml": [503, 429]}
+
+    responses = client.add_sourcedocuments(
+        f"{BASE_URL}/1/uploads/1", {"doc_0.xml": b"<a/>", "doc_1.xml": b"<b/>"}
+    )
+
+    assert [response.status_code for response in responses.values()] == [201, 201]
+    assert len(client.session.calls) == 4
+    assert client.retry_policy.counters["retries"] == 2
+    assert client.retry_policy.counters["rate_limited"] == 1
+
+
+@pytest.mark.parametrize("status_code", [400, 502])
+def test_sourcedocument_upload_is_not_repeated_after_other_errors(client, status_code):
+    client.session.failures = {"doc_1.xml": [status_code]}
+
+    with pytest.raises(Exception, match="doc_1.xml") as excinfo:
+        client.add_sourcedocuments(
+            f"{BASE_URL}/1/uploads/1", {"doc_0.xml": b"<a/>", "doc_1.xml": b"<b/>"}
+        )
+
+    assert isinstance(excinfo.value.__cause__, requests.HTTPError)
+    assert len(client.session.calls) == 2
+
+
+def test_delivery_waits_for_all_sourcedocuments(client):
+    reqs = {f"doc_{i}.xml": b"<a/>" for i in range(8)}
+
+    client.deliver_requests(reqs, max_workers=4)
+
+    urls = [url for _method, url in client.session.calls]
+    assert urls[0].endswith("/uploads")
+    assert all(url.endswith("/brondocumenten") for url in urls[1:9])
+    assert urls[9:] == [f"{BASE_URL}/1/leveringen", f"{BASE_URL}/1/leveringen/9"]
+
+
+@pytest.mark.parametrize("status_code", [500, 502])
+def test_upload_creation_is_not_repeated_when_possibly_processed(client, status_code):
+    client.session.failures = {f"{BASE_URL}/1/uploads": [status_code]}
+
+    with pytest.raises(Exception, match="unable to create an upload"):
+        client.create_upload()
+
+    assert client.session.calls == [("POST", f"{BASE_URL}/1/uploads")]
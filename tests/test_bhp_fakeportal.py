@@ -0,0 +1,76 @@
+import pytest
+
+from bro_exchange.bhp.client import BronhouderportaalClient
+from bro_exchange.bhp.fakeportal import FakeBronhouderportaal
+from bro_exchange.bhp.retry import RetryPolicy
+
+REQS = {f"doc{number}.xml": f"<request>{number}</request>" for number in range(3)}
+
+
+def _client(portal, **kwargs):
+    return BronhouderportaalClient(
+        user="user",
+        password="pass",
+        project_id=1,
+        base_url=portal.base_url,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def portal():
+    with FakeBronhouderportaal(credentials=("user", "pass")) as portal:
+        yield portal
+
+
+def test_delivery_round_trip(portal):
+    with _client(portal) as client:
+        assert client.validate_request(REQS["doc0.xml"])["status"] == "VALIDE"
+        assert client.validate_request("<request>")["status"] == "NIET_VALIDE"
+
+        delivery = client.deliver_requests(REQS)
+        identifier = delivery.json()["identifier"]
+        statuses = [
+            client.check_delivery_status(identifier).json()["status"] for _ in range(3)
+        ]
+        document = delivery.json()["brondocuments"][0]["identifier"]
+        sourcedocument = client.get_sourcedocument(document).json()
+
+    assert delivery.json()["status"] == "AANGELEVERD"
+    assert statuses == ["GEVALIDEERD", "DOORGELEVERD", "DOORGELEVERD"]
+    assert sorted(sourcedocument) == ["filename", "identifier", "size"]
+    assert len(portal.uploads[1]) == 3
+    assert portal.stats["brondocumenten"] == 3
+
+
+def test_unauthorized_requests_are_refused(portal):
+    client = BronhouderportaalClient(
+        user="user", password="wrong", project_id=1, base_url=portal.base_url
+    )
+
+    assert client.check_delivery_status("1").status_code == 401
+
+
+def test_injected_errors_are_retried():
+    policy = RetryPolicy(retries=10, backoff_factor=0.001, jitter=False)
+
+    with FakeBronhouderportaal(error_rate=0.5, seed=1) as portal:
+        with _client(portal, retry_policy=policy) as client:
+            delivery = client.deliver_requests(REQS)
+
+    assert delivery.json()["status"] == "AANGELEVERD"
+    assert portal.stats["injected_errors"] > 0
+    assert policy.counters["retries"] == portal.stats["injected_errors"]
+    assert len(portal.documents) == 3
+
+
+def test_rate_limit_answers_retry_after():
+    policy = RetryPolicy(retries=0)
+
+    with FakeBronhouderportaal(rate_limit=2) as portal:
+        with _client(portal, retry_policy=policy) as client:
+            responses = [client.check_delivery_status("1") for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [404, 404, 429]
+    assert 0 < float(responses[2].headers["Retry-After"]) <= 0.5
+    assert portal.stats["rate_limited"] == 1
@@ -0,0 +1,159 @@
+import pytest
+import requests
+
+from bro_exchange.bhp import connector as connector_module
+from bro_exchange.bhp.fakeportal import FakeBronhouderportaal
+from bro_exchange.bhp.journal import DeliveryJournal, content_hash
+from bro_exchange.bhp.retry import RetryPolicy
+
+BASE_URL = "https://demo.bronhouderportaal-bro.nl/api/v2"
+
+REQS = {f"doc{number}.xml": f"<request>{number}</request>" for number in range(4)}
+
+
+class Killed(BaseException):
+    """Stands in for the process being killed, nothing handles it."""
+
+
+class InterruptedSession(requests.Session):
+    """Session of a process that is killed right after requesting a delivery."""
+
+    def request(self, method, url, **kwargs):
+        response = super().request(method, url, **kwargs)
+        if method == "POST" and url.endswith("/leveringen"):
+            raise Killed
+        return response
+
+
+@pytest.fixture
+def journal(tmp_path):
+    with DeliveryJournal(tmp_path / "journal.sqlite") as journal:
+        yield journal
+
+
+def _deliver(session, journal, reqs=REQS, **kwargs):
+    return connector_module.upload_sourcedocs_from_dict(
+        reqs,
+        user="user",
+        password="pass",
+        project_id=1,
+        demo=True,
+        session=session,
+        **kwargs,
+        retry_policy=RetryPolicy(jitter=False),
+        max_workers=1,
+        journal=journal,
+    )
+
+
+def _contents(session):
+    return [document["content"].decode() for document in session.documents]
+
+
+def test_interrupted_delivery_resumes_the_same_upload(
+    journal, tmp_path, recording_session
+):
+    failing = recording_session(failures={REQS["doc2.xml"].encode(): [502]})
+    assert _deliver(failing, journal)["status"] == "error"
+    assert failing.uploads == 1
+
+    # A new process opens the same journal file
+    with DeliveryJournal(tmp_path / "journal.sqlite") as reopened:
+        session = recording_session()
+        delivery = _deliver(session, reopened)
+
+    assert delivery.json() == {"identifier": "9"}
+    assert session.uploads == 0
+    assert REQS["doc0.xml"] not in _contents(session)
+    assert REQS["doc2.xml"] in _contents(session)
+    assert [upload["state"] for upload in journal.uploads()] == ["delivered"]
+    assert journal.uploads()[0]["documents"] == 4
+
+
+def test_delivered_documents_are_skipped(journal, recording_session):
+    _deliver(recording_session(), journal)
+
+    session = recording_session()
+    result = _deliver(session, journal, dict(REQS, new="<request>new</request>"))
+
+    assert result.json() == {"identifier": "9"}
+    assert _contents(session) == ["<request>new</request>"]
+
+    assert _deliver(recording_session(), journal)["status"] == "skipped"
+
+
+def test_requested_delivery_is_retried_without_adding_documents(
+    journal, recording_session
+):
+    hashes = {filename: content_hash(payload) for filename, payload in REQS.items()}
+    upload_id = journal.start_upload(
+        journal.batch_key(hashes), f"{BASE_URL}/1/uploads/5"
+    )
+    for filename, digest in hashes.items():
+        journal.record_document(upload_id, filename, digest)
+    journal.start_delivery(upload_id)
+
+    session = recording_session()
+    _deliver(session, journal)
+
+    assert session.calls[:2] == [
+        ("GET", f"{BASE_URL}/1/leveringen"),
+        ("POST", f"{BASE_URL}/1/leveringen"),
+    ]
+    assert journal.is_delivered(hashes["doc3.xml"])
+
+
+def test_delivery_is_not_repeated_after_a_crash_once_requested(journal):
+    with FakeBronhouderportaal() as portal:
+        with pytest.raises(Killed):
+            _deliver(InterruptedSession(), journal, base_url=portal.base_url)
+        assert [upload["state"] for upload in journal.uploads()] == ["delivering"]
+
+        delivery = _deliver(requests.Session(), journal, base_url=portal.base_url)
+
+        assert delivery.json()["upload"] == 1
+        assert len(portal.deliveries) == 1
+        assert len(portal.uploads) == 1
+    assert journal.uploads()[0]["state"] == "delivered"
+    assert journal.uploads()[0]["delivery_url"] == f"{portal.base_url}/1/leveringen/1"
+
+
+def test_rejected_delivery_is_not_resumed(journal):
+    hashes = {filename: content_hash(payload) for filename, payload in REQS.items()}
+    with FakeBronhouderportaal() as portal:
+        # The portal no longer knows the upload of the journal
+        upload_id = journal.start_upload(
+            journal.batch_key(hashes), f"{portal.base_url}/1/uploads/5"
+        )
+        for filename, digest in hashes.items():
+            journal.record_document(upload_id, filename, digest)
+        journal.start_delivery(upload_id)
+
+        assert (
+            _deliver(requests.Session(), journal, base_url=portal.base_url)["status"]
+            == "error"
+        )
+        assert journal.uploads()[0]["state"] == "failed"
+
+        delivery = _deliver(requests.Session(), journal, base_url=portal.base_url)
+
+        assert delivery.json()["upload"] == 1
+    assert [upload["state"] for upload in journal.uploads()] == ["failed", "delivered"]
+
+
+def test_upload_that_rejects_documents_is_not_resumed(journal):
+    hashes = {filename: content_hash(payload) for filename, payload in REQS.items()}
+    with FakeBronhouderportaal() as portal:
+        # The portal no longer knows the upload, e.g. because it expired
+        journal.start_upload(
+            journal.batch_key(hashes), f"{portal.base_url}/1/uploads/5"
+        )
+
+        result = _deliver(requests.Session(), journal, base_url=portal.base_url)
+        assert result["status"] == "error"
+        assert journal.uploads()[0]["state"] == "failed"
+
+        delivery = _deliver(requests.Session(), journal, base_url=portal.base_url)
+
+        assert delivery.json()["upload"] == 1
+    assert [upload["state"] for upload in journal.uploads()] == ["failed", "delivered"]
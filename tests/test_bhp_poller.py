@@ -0,0 +1,140 @@
+import functools
+import threading
+import time
+
+import pytest
+
+from bro_exchange.bhp.poller import DeliveryPoller, delivery_status
+
+
+class FakeClock:
+    """Clock that only advances when slept on."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class StatusClient:
+    """Client that replays a list of statuses per delivery."""
+
+    def __init__(self, statuses, clock=time.monotonic, *, respond):
+        self.respond = respond
+        self.statuses = {identifier: list(s) for identifier, s in statuses.items()}
+        self.clock = clock
+        self.calls = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def check_delivery_status(self, identifier):
+        with self.lock:
+            self.calls.append((identifier, self.clock()))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.005)
+        with self.lock:
+            self.in_flight -= 1
+            status = self.statuses[identifier].pop(0)
+        if isinstance(status, Exception):
+            raise status
+        if isinstance(status, int):
+            return self.respond(status, {"message": "error"})
+        return self.respond(200, {"identifier": identifier, "status": status})
+
+
+@pytest.fixture
+def status_client(json_response):
+    return functools.partial(StatusClient, respond=json_response)
+
+
+def _poller(client, **kwargs):
+    kwargs.setdefault("initial_interval", 0.01)
+    kwargs.setdefault("max_interval", 0.05)
+    return DeliveryPoller(client, client.statuses, **kwargs)
+
+
+def test_deliveries_are_yielded_as_they_complete(status_client):
+    client = status_client(
+        {
+            "slow": ["AANGELEVERD"] * 4 + ["DOORGELEVERD"],
+            "fast": ["DOORGELEVERD"],
+            "rejected": ["AANGELEVERD", "AFGEKEURD"],
+        }
+    )
+
+    results = [
+        (identifier, delivery_status(response))
+        for identifier, response in _poller(client).poll(timeout=5)
+    ]
+
+    assert results == [
+        ("fast", "DOORGELEVERD"),
+        ("rejected", "AFGEKEURD"),
+        ("slow", "DOORGELEVERD"),
+    ]
+
+
+def test_concurrency_is_bounded(status_client):
+    client = status_client({f"id{i}": ["DOORGELEVERD"] for i in range(12)})
+
+    assert len(list(_poller(client, max_workers=3).poll(timeout=5))) == 12
+    assert 1 < client.max_in_flight <= 3
+
+
+def test_interval_grows_while_status_is_unchanged(status_client):
+    clock = FakeClock()
+    client = status_client({"id": ["AANGELEVERD"] * 4 + ["DOORGELEVERD"]}, clock)
+    poller = _poller(
+        client,
+        initial_interval=0.02,
+        backoff=2,
+        max_interval=1,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    list(poller.poll())
+
+    times = [moment for _identifier, moment in client.calls]
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    # Reset to the initial interval when the status first changes, then doubled
+    assert gaps == pytest.approx([0.02, 0.04, 0.08, 0.16])
+
+
+def test_errors_are_retried_and_counted(status_client):
+    client = status_client({"id": [ConnectionError(), "DOORGELEVERD"]})
+    poller = _poller(client)
+
+    assert [identifier for identifier, _ in poller.poll(timeout=5)] == ["id"]
+    assert poller.errors == 1
+    assert poller.polls == 2
+
+
+def test_timeout_reports_pending_deliveries(status_client):
+    client = status_client({"id": ["AANGELEVERD"] * 100})
+
+    with pytest.raises(TimeoutError, match="id"):
+        list(_poller(client).poll(timeout=0.1))
+
+
+def test_client_errors_end_polling(status_client):
+    client = status_client(
+        {
+            "unknown": [404],
+            "unauthorized": [401],
+            "busy": [429, 503, "DOORGELEVERD"],
+        }
+    )
+
+    results = {
+        identifier: response.status_code
+        for identifier, response in _poller(client).poll(timeout=5)
+    }
+
+    assert results == {"unknown": 404, "unauthorized": 401, "busy": 200}
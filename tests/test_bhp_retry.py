@@ -0,0 +1,124 @@
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from bro_exchange.bhp.retry import RetryingHttp, RetryPolicy
+
+
+def _response(status_code, headers=None):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+class ScriptedHttp:
+    """Stand-in for `requests` that replays responses and exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return _response(outcome) if isinstance(outcome, int) else outcome
+
+
+@pytest.fixture
+def policy():
+    policy = RetryPolicy(retries=3, backoff_factor=1, jitter=False)
+    policy.delays = []
+    policy.sleep = policy.delays.append
+    return policy
+
+
+def _connection_refused():
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+def test_idempotent_calls_are_retried_with_exponential_backoff(policy):
+    http = ScriptedHttp(502, requests.ReadTimeout(), 500, 200)
+
+    response = RetryingHttp(http, policy).get("https://example.org")
+
+    assert response.status_code == 200
+    assert policy.delays == [1, 2, 4]
+    assert policy.counters["requests"] == 4
+    assert policy.counters["retries"] == 3
+    assert policy.counters["timeouts"] == 1
+    assert policy.counters["status_502"] == 1
+
+
+def test_last_response_is_returned_when_retries_are_exhausted(policy):
+    http = ScriptedHttp(503, 503, 503, 503)
+
+    response = RetryingHttp(http, policy).get("https://example.org")
+
+    assert response.status_code == 503
+    assert len(http.calls) == 4
+
+
+def test_retry_after_is_honoured(policy):
+    http = ScriptedHttp(_response(429, {"Retry-After": "7"}), 200)
+
+    RetryingHttp(http, policy).post("https://example.org")
+
+    assert policy.delays == [7]
+    assert policy.counters["rate_limited"] == 1
+
+
+def test_retry_after_is_capped(policy):
+    policy.max_retry_after = 5
+    http = ScriptedHttp(_response(503, {"Retry-After": "3600"}), 200)
+
+    RetryingHttp(http, policy).get("https://example.org")
+
+    assert policy.delays == [5]
+
+
+@pytest.mark.parametrize(
+    "outcome", [500, 502, 504, requests.ReadTimeout(), requests.ConnectionError()]
+)
+def test_non_idempotent_calls_are_not_repeated_when_possibly_processed(policy, outcome):
+    http = ScriptedHttp(outcome, 201)
+
+    try:
+        RetryingHttp(http, policy).post("https://example.org")
+    except requests.RequestException:
+        pass
+
+    assert len(http.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "outcome", [429, 503, requests.ConnectTimeout(), _connection_refused()]
+)
+def test_non_idempotent_calls_are_retried_when_not_processed(policy, outcome):
+    http = ScriptedHttp(outcome, 201)
+
+    response = RetryingHttp(http, policy).post("https://example.org")
+
+    assert response.status_code == 201
+    assert len(http.calls) == 2
+
+
+def test_timeout_is_applied_to_every_call(policy):
+    http = ScriptedHttp(200, 200)
+
+    RetryingHttp(http, policy).get("https://example.org")
+    RetryingHttp(http, policy).post("https://example.org", timeout=5)
+
+    assert [call["timeout"] for call in http.calls] == [(10, 60), 5]
+
+
+def test_jitter_keeps_backoff_within_bounds():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=6)
+
+    delays = [policy.backoff(attempt) for attempt in range(5) for _ in range(20)]
+
+    assert all(0.5 <= delay <= 6 for delay in delays)
+    assert len(set(delays)) > 1
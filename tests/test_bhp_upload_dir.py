@@ -0,0 +1,91 @@
+import io
+
+from bro_exchange.bhp import connector as connector_module
+from bro_exchange.bhp.retry import RetryPolicy
+
+BASE_URL = "https://demo.bronhouderportaal-bro.nl/api/v2"
+
+
+def _write_documents(folder):
+    (folder / "small.xml").write_bytes(b"<r/>")
+    (folder / "large.xml").write_bytes(b"<r>" + "ë".encode() * 5000 + b"</r>")
+    (folder / "medium.xml").write_bytes(b"<r>" + b"x" * 100 + b"</r>")
+    (folder / "notes.txt").write_text("not a request")
+    (folder / "subfolder.xml").mkdir()
+
+
+def _upload(folder, session, **kwargs):
+    return connector_module.upload_sourcedocs_from_dir(
+        folder,
+        user="user",
+        password="pass",
+        project_id=1,
+        demo=True,
+        session=session,
+        retry_policy=RetryPolicy(jitter=False),
+        **kwargs,
+    )
+
+
+def _streamed(session):
+    return [
+        (document["filename"], document["streamed"]) for document in session.documents
+    ]
+
+
+def test_files_are_streamed_largest_first(tmp_path, recording_session):
+    _write_documents(tmp_path)
+    session = recording_session()
+
+    delivery = _upload(tmp_path, session, pattern="*.xml", max_workers=1)
+
+    assert delivery.json() == {"identifier": "9"}
+    assert _streamed(session) == [
+        ("large.xml", True),
+        ("medium.xml", True),
+        ("small.xml", True),
+    ]
+
+
+def test_documents_are_posted_concurrently(tmp_path, recording_session):
+    _write_documents(tmp_path)
+    session = recording_session(delay=0.05)
+
+    _upload(tmp_path, session, max_workers=4)
+
+    assert len(session.documents) == 4
+    assert session.max_in_flight > 1
+
+
+def test_specific_file(tmp_path, recording_session):
+    _write_documents(tmp_path)
+    session = recording_session()
+
+    _upload(tmp_path, session, specific_file="medium.xml")
+
+    assert _streamed(session) == [("medium.xml", True)]
+
+
+def test_upload_is_not_delivered_when_a_document_fails(tmp_path, recording_session):
+    _write_documents(tmp_path)
+    session = recording_session(failures={"small.xml": [400]})
+
+    assert _upload(tmp_path, session, pattern="*.xml") is None
+    assert ("POST", f"{BASE_URL}/1/leveringen") not in session.calls
+
+
+def test_file_body_is_rewound_before_a_retry(json_response):
+    body = io.BytesIO(b"<request/>")
+    received = []
+
+    class FlakyHttp:
+        def request(self, method, url, **kwargs):
+            received.append(kwargs["data"].read())
+            return json_response(503 if len(received) == 1 else 201)
+
+    policy = RetryPolicy(retries=1, jitter=False)
+    policy.sleep = lambda delay: None
+    response = policy.request(FlakyHttp(), "POST", "/", idempotent=True, data=body)
+
+    assert response.status_code == 201
+    assert received == [b"<request/>", b"<request/>"]
@@ -0,0 +1,436 @@
+import datetime
+import io
+import itertools
+import uuid
+
+import pytest
+
+from bro_exchange.broxml.gld import constructables as gld_constructables_module
+from bro_exchange.broxml.gld import requests as gld_requests_module
+from bro_exchange.broxml.gld import sourcedocs as gld_sourcedocs_module
+from bro_exchange.broxml.gld.timeseries import GldTimeseries
+
+GML = gld_requests_module.ns_regreq_map_gld3["gml"]
+
+RESULTS = [
+    {
+        "time": "2019-01-07T08:14:38+01:00",
+        "value": -4.345,
+        "metadata": {
+            "StatusQualityControl": "goedgekeurd",
+            "interpolationType": "Discontinuous",
+        },
+    },
+    {
+        "time": "2019-01-21T10:01:52+01:00",
+        "value": "None",
+        "metadata": {
+            "StatusQualityControl": "afgekeurd",
+            "interpolationType": "Discontinuous",
+            "censoringLimitvalue": 0,
+            "censoredReason": "BelowDetectionRange",
+        },
+    },
+    {
+        "time": "2019-01-28T16:58:07+01:00",
+        "value": -4.788,
+        "metadata": {
+            "StatusQualityControl": "goedgekeurd",
+            "interpolationType": "Discontinuous",
+        },
+    },
+]
+
+
+def _addition_srcdocdata(result):
+    return {
+        "metadata": {
+            "status": "voorlopig",
+            "parameters": {
+                "principalInvestigator": "27376655",
+                "observationType": "reguliereMeting",
+            },
+            "dateStamp": "2019-01-28",
+        },
+        "procedure": {
+            "parameters": {
+                "evaluationProcedure": "oordeelDeskundige",
+                "measurementInstrumentType": "akoestischeSensor",
+            }
+        },
+        "resultTime": "2019-01-28T16:58:07+01:00",
+        "result": result,
+    }
+
+
+def _patch_uuid(monkeypatch):
+    counter = itertools.count()
+
+    def _uuid4():
+        return uuid.UUID(int=next(counter))
+
+    monkeypatch.setattr(gld_constructables_module.uuid_gen, "uuid4", _uuid4)
+    monkeypatch.setattr(gld_sourcedocs_module.uuid_gen, "uuid4", _uuid4)
+
+
+def _addition_request(result):
+    return gld_requests_module.gld_registration_request(
+        "GLD_Addition",
+        requestReference="gld-add-001",
+        qualityRegime="IMBRO",
+        broId="GLD000000000001",
+        srcdocdata=_addition_srcdocdata(result),
+    )
+
+
+def _generate_addition(monkeypatch, result):
+    _patch_uuid(monkeypatch)
+    request = _addition_request(result)
+    request.generate()
+    return request.request
+
+
+def test_columnar_result_matches_records_result(monkeypatch):
+    records_xml = _generate_addition(monkeypatch, RESULTS)
+
+    timeseries = GldTimeseries.from_columns(
+        time=[record["time"] for record in RESULTS],
+        value=[-4.345, None, -4.788],
+        status_quality_control=["goedgekeurd", "afgekeurd", "goedgekeurd"],
+        interpolation_type="Discontinuous",
+        censored_reason=[None, "BelowDetectionRange", None],
+        censoring_limitvalue=[None, 0, None],
+    )
+    columnar_xml = _generate_addition(monkeypatch, timeseries)
+
+    assert columnar_xml == records_xml
+    assert b'<wml2:value xsi:nil="true"/>' in records_xml
+
+
+def test_result_accepts_an_iterator_of_records(monkeypatch):
+    expected = _generate_addition(monkeypatch, RESULTS)
+
+    assert _generate_addition(monkeypatch, iter(RESULTS)) == expected
+    assert _generate_addition(monkeypatch, tuple(RESULTS)) == expected
+
+
+def test_result_accepts_a_table_of_records(monkeypatch):
+    pandas = pytest.importorskip("pandas")
+    expected = _generate_addition(monkeypatch, RESULTS)
+
+    table = pandas.DataFrame(
+        {
+            "time": [record["time"] for record in RESULTS],
+            "value": [-4.345, None, -4.788],
+            "metadata": [record["metadata"] for record in RESULTS],
+        }
+    )
+
+    assert _generate_addition(monkeypatch, table) == expected
+
+
+FLAT_COLUMNS = {
+    "time": [record["time"] for record in RESULTS],
+    "value": [-4.345, None, -4.788],
+    "status_quality_control": ["goedgekeurd", "afgekeurd", "goedgekeurd"],
+    "censored_reason": [None, "BelowDetectionRange", None],
+    "censoring_limit": [None, 0.0, None],
+}
+
+
+class _ArrowLikeTable:
+    """Minimal stand-in for a pyarrow.Table."""
+
+    def __init__(self, columns):
+        self.column_names = list(columns)
+        self._columns = columns
+
+    def __getitem__(self, name):
+        return _ArrowLikeColumn(self._columns[name])
+
+
+class _ArrowLikeColumn:
+    def __init__(self, values):
+        self._values = values
+
+    def to_pylist(self):
+        return list(self._values)
+
+
+def _flat_columns_xml(monkeypatch):
+    return _generate_addition(
+        monkeypatch,
+        GldTimeseries.from_columns(
+            FLAT_COLUMNS["time"],
+            FLAT_COLUMNS["value"],
+            FLAT_COLUMNS["status_quality_control"],
+            censored_reason=FLAT_COLUMNS["censored_reason"],
+            censoring_limitvalue=FLAT_COLUMNS["censoring_limit"],
+        ),
+    )
+
+
+def test_result_accepts_a_flat_dataframe(monkeypatch):
+    pandas = pytest.importorskip("pandas")
+    expected = _flat_columns_xml(monkeypatch)
+
+    xml = _generate_addition(monkeypatch, pandas.DataFrame(FLAT_COLUMNS))
+
+    assert xml == expected
+    assert b'<wml2:value xsi:nil="true"/>' in xml
+
+
+def test_result_accepts_an_arrow_table(monkeypatch):
+    expected = _flat_columns_xml(monkeypatch)
+
+    table = _ArrowLikeTable(
+        dict(FLAT_COLUMNS, interpolation_type=["Discontinuous"] * 3)
+    )
+
+    assert _generate_addition(monkeypatch, table) == expected
+
+
+def test_result_accepts_a_pyarrow_table(monkeypatch):
+    pyarrow = pytest.importorskip("pyarrow")
+    expected = _flat_columns_xml(monkeypatch)
+
+    assert _generate_addition(monkeypatch, pyarrow.table(FLAT_COLUMNS)) == expected
+
+
+def test_result_table_rejects_unknown_columns():
+    with pytest.raises(Exception, match="unknown: \\['quality'\\]"):
+        GldTimeseries.from_table(_ArrowLikeTable(dict(FLAT_COLUMNS, quality=[1, 2, 3])))
+
+
+def test_columns_accept_datetimes():
+    tz = datetime.timezone(datetime.timedelta(hours=1))
+    timeseries = GldTimeseries.from_columns(
+        time=[datetime.datetime(2019, 1, 7, 8, 14, 38, tzinfo=tz)],
+        value=[-4.345],
+        status_quality_control="goedgekeurd",
+    )
+
+    assert timeseries.time == [RESULTS[0]["time"]]
+
+
+def test_naive_datetimes_are_rejected():
+    with pytest.raises(ValueError, match="has no timezone"):
+        GldTimeseries.from_columns(
+            time=[datetime.datetime(2019, 1, 7, 8, 14, 38)],
+            value=[-4.345],
+            status_quality_control="goedgekeurd",
+        )
+    with pytest.raises(ValueError, match="has no timezone"):
+        GldTimeseries.from_records(
+            [{"time": datetime.datetime(2019, 1, 7), "value": 1, "metadata": {}}]
+        )
+
+
+def test_addition_with_naive_datetimes_raises(monkeypatch):
+    result = [dict(RESULTS[0], time=datetime.datetime(2019, 1, 7, 8, 14, 38))]
+
+    with pytest.raises(ValueError, match="has no timezone"):
+        _generate_addition(monkeypatch, result)
+
+
+def test_result_rejects_a_mapping():
+    with pytest.raises(Exception, match="invalid input type for result"):
+        gld_constructables_module.coerce_timeseries({"time": []})
+
+
+def test_records_keep_float_rendering_of_integer_values():
+    records = [
+        {
+            "time": "2019-01-07T08:14:38+01:00",
+            "value": 1,
+            "metadata": RESULTS[0]["metadata"],
+        },
+        {
+            "time": "2019-01-08T08:14:38+01:00",
+            "value": 1.5,
+            "metadata": RESULTS[0]["metadata"],
+        },
+    ]
+
+    assert GldTimeseries.from_records(records).value == ["1.0", "1.5"]
+    assert GldTimeseries.from_records(records[:1]).value == ["1"]
+
+
+def test_columnar_result_requires_status_quality_control():
+    with pytest.raises(Exception, match="StatusQualityControl"):
+        GldTimeseries.from_columns(
+            time=["2019-01-07T08:14:38+01:00"],
+            value=[-4.345],
+            status_quality_control=None,
+        )
+
+
+def test_addition_parses_result_once(monkeypatch):
+    calls = []
+    from_records = GldTimeseries.from_records.__func__
+
+    def _counting_from_records(cls, records):
+        calls.append(len(records))
+        return from_records(cls, records)
+
+    monkeypatch.setattr(
+        GldTimeseries, "from_records", classmethod(_counting_from_records)
+    )
+
+    _generate_addition(monkeypatch, RESULTS)
+
+    assert calls == [len(RESULTS)]
+
+
+def test_addition_rejects_unknown_result_fields(monkeypatch):
+    records = [dict(RESULTS[0], quality="good")]
+
+    with pytest.raises(Exception, match="invalid input fields"):
+        _generate_addition(monkeypatch, records)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_generate_stream_matches_generate(monkeypatch, tmp_path, batch_size):
+    expected = _generate_addition(monkeypatch, RESULTS)
+
+    _patch_uuid(monkeypatch)
+    output = io.BytesIO()
+    _addition_request(RESULTS).generate_stream(output, batch_size=batch_size)
+    assert output.getvalue() == expected
+
+    _patch_uuid(monkeypatch)
+    path = tmp_path / "gld_addition.xml"
+    _addition_request(RESULTS).generate_stream(path, batch_size=batch_size)
+    assert path.read_bytes() == expected
+
+
+def test_point_metadata_is_built_once_per_qualifiers(monkeypatch):
+    calls = []
+    gen_tvp_metadata = gld_constructables_module.gen_tvp_metadata
+
+    def _counting(nsmap, *qualifiers):
+        calls.append(qualifiers)
+        return gen_tvp_metadata(nsmap, *qualifiers)
+
+    monkeypatch.setattr(gld_constructables_module, "gen_tvp_metadata", _counting)
+
+    xml = _generate_addition(monkeypatch, RESULTS * 4)
+
+    assert calls == [
+        ("goedgekeurd", "Discontinuous", None, None),
+        ("afgekeurd", "Discontinuous", "BelowDetectionRange", "0"),
+    ]
+    assert xml.count(b"<wml2:TVPMeasurementMetadata>") == 12
+
+
+def test_generate_stream_escapes_text(monkeypatch):
+    records = [
+        RESULTS[0],
+        dict(RESULTS[1], time="2019-01-21 <10:01> & \r"),
+        RESULTS[2],
+    ]
+    expected = _generate_addition(monkeypatch, records)
+
+    _patch_uuid(monkeypatch)
+    output = io.BytesIO()
+    _addition_request(records).generate_stream(output)
+
+    assert output.getvalue() == expected
+    assert b"2019-01-21 &lt;10:01&gt; &amp; &#13;" in expected
+
+
+def test_generate_stream_requires_addition():
+    request = gld_requests_module.gld_registration_request(
+        "GLD_StartRegistration",
+        requestReference="gld-reg-001",
+        qualityRegime="IMBRO",
+        srcdocdata={"objectIdAccountableParty": "GLD1", "monitoringPoints": []},
+    )
+    with pytest.raises(Exception, match="only supported for GLD_Addition"):
+        request.generate_stream(io.BytesIO())
+
+
+def _long_timeseries(length):
+    return GldTimeseries.from_columns(
+        [f"2019-01-{1 + i // 24:02d}T{i % 24:02d}:00:00+01:00" for i in range(length)],
+        [float(i) for i in range(length)],
+        "goedgekeurd",
+    )
+
+
+def _chunk_requests(timeseries, **kwargs):
+    return gld_requests_module.gen_gld_addition_requests(
+        _addition_srcdocdata(timeseries),
+        "gld-add",
+        qualityRegime="IMBRO",
+        broId="GLD000000000001",
+        **kwargs,
+    )
+
+
+def _positions(request):
+    root = request.requesttree.getroot()
+    return [
+        element.text
+        for tag in ("beginPosition", "endPosition")
+        for element in root.iter(f"{{{GML}}}{tag}")
+        if element.text
+    ]
+
+
+def test_gen_gld_addition_requests_chunks_by_points():
+    requests = list(_chunk_requests(_long_timeseries(50), max_points=20))
+
+    assert [request.requestreference for request in requests] == [
+        "gld-add_1",
+        "gld-add_2",
+        "gld-add_3",
+    ]
+    assert [request.request.count(b"<wml2:point>") for request in requests] == [
+        20,
+        20,
+        10,
+    ]
+    assert _positions(requests[1]) == ["2019-01-01", "2019-01-02"]
+    assert _positions(requests[2]) == ["2019-01-02", "2019-01-03"]
+
+    # The id_000N ids are document scoped, the uuid based ids are fresh per chunk
+    uuid_ids = [
+        gml_id
+        for request in requests
+        for gml_id in request.requesttree.getroot().xpath(
+            "//@gml:id", namespaces={"gml": GML}
+        )
+        if gml_id.startswith("_")
+    ]
+    assert len(uuid_ids) == len(set(uuid_ids)) == 3 * len(requests)
+
+
+def test_gen_gld_addition_requests_chunks_by_bytes():
+    timeseries = _long_timeseries(200)
+    max_bytes = 20_000
+
+    requests = list(_chunk_requests(timeseries, max_bytes=max_bytes))
+
+    assert len(requests) > 1
+    assert all(len(request.request) <= max_bytes for request in requests)
+    assert sum(request.request.count(b"<wml2:point>") for request in requests) == 200
+
+
+def test_gen_gld_addition_requests_is_lazy(monkeypatch):
+    requests = _chunk_requests(_long_timeseries(50), max_points=20)
+    generated = []
+    monkeypatch.setattr(
+        gld_requests_module.gld_registration_request,
+        "generate",
+        lambda self: generated.append(self.requestreference),
+    )
+
+    next(requests)
+
+    assert generated == ["gld-add_1"]
+
+
+def test_gen_gld_addition_requests_rejects_too_small_max_bytes():
+    with pytest.raises(Exception, match="single point exceeds max_bytes"):
+        list(_chunk_requests(_long_timeseries(5), max_bytes=100))
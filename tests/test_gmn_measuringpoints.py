@@ -0,0 +1,77 @@
+import pytest
+
+from bro_exchange.broxml.gmn import constructables as gmn_constructables_module
+from bro_exchange.broxml.gmn import requests as gmn_requests_module
+
+
+def _measuringpoints(count):
+    return [
+        {
+            "measuringPointCode": f"PP{number}",
+            "monitoringTube": {"broId": f"GMW{number:012d}", "tubeNumber": 1},
+        }
+        for number in range(count)
+    ]
+
+
+def _startregistration(measuringpoints):
+    request = _startregistration_request(measuringpoints)
+    request.generate()
+    return request.request
+
+
+def _startregistration_request(measuringpoints):
+    return gmn_requests_module.gmn_registration_request(
+        "GMN_StartRegistration",
+        requestReference="gmn-reg-001",
+        qualityRegime="IMBRO",
+        srcdocdata={
+            "objectIdAccountableParty": "GMN1",
+            "name": "network",
+            "deliveryContext": "waterwetStrategieOntwikkeling",
+            "monitoringPurpose": "strategischBeheerKwantiteitRegionaal",
+            "groundwaterAspect": "kwantiteit",
+            "startDateMonitoring": ["2020-01-01", "date"],
+            "measuringPoints": measuringpoints,
+        },
+    )
+
+
+def test_measuringpoints_are_coerced_once(monkeypatch):
+    calls = []
+    coerce_mapping_like = gmn_constructables_module.coerce_mapping_like
+
+    def _counting(value, context):
+        calls.append(context)
+        return coerce_mapping_like(value, context)
+
+    monkeypatch.setattr(gmn_constructables_module, "coerce_mapping_like", _counting)
+
+    xml = _startregistration(_measuringpoints(50))
+
+    # One coercion of each measuringpoint and of its monitoringTube
+    assert len(calls) == 100
+    assert xml.count(b"<measuringPoint>") == 50
+    assert b'gml:id="id_mpgwmt49"' in xml
+
+
+def test_measuringpoints_accept_an_iterator():
+    expected = _startregistration(_measuringpoints(5))
+
+    assert _startregistration(iter(_measuringpoints(5))) == expected
+
+
+def test_measuringpoints_iterator_is_read_once():
+    request = _startregistration_request(iter(_measuringpoints(5)))
+
+    request.generate()
+    first = request.request
+    request.generate()
+
+    assert request.request == first
+    assert first.count(b"<measuringPoint>") == 5
+
+
+def test_measuringpoints_are_required():
+    with pytest.raises(Exception, match="No measuringPoints provided"):
+        _startregistration(iter([]))
@@ -0,0 +1,125 @@
+import copy
+
+from lxml import etree
+
+from bro_exchange.broxml import request_helpers
+from bro_exchange.broxml.gmw.constructables import (
+    gen_monitoringtube,
+    normalize_gmw_srcdocdata,
+)
+from bro_exchange.broxml.gmw.sourcedocs import (
+    gen_gmw_construction,
+    gen_gmw_tubestatus,
+)
+from bro_exchange.broxml.mappings import codespace_map_gmw1, ns_regreq_map_gmw1
+
+CONSTRUCTION = {
+    "objectIdAccountableParty": "obj-001",
+    "deliveryContext": "aanlevering",
+    "constructionStandard": "NEN",
+    "initialFunction": "monitoring",
+    "numberOfMonitoringTubes": 1,
+    "groundLevelStable": "ja",
+    "owner": 12345678,
+    "wellHeadProtector": "geen",
+    "wellConstructionDate": "2024-01-01",
+    "deliveredLocation": {
+        "X": 120000.0,
+        "Y": 480000.0,
+        "horizontalPositioningMethod": "ingemeten",
+    },
+    "deliveredVerticalPosition": {
+        "localVerticalReferencePoint": "maaiveld",
+        "offset": 0.0,
+        "verticalDatum": "NAP",
+        "groundLevelPosition": 1.2,
+        "groundLevelPositioningMethod": "ingemeten",
+    },
+    "monitoringTubes": [
+        {
+            "tubeNumber": 1,
+            "tubeType": "peilbuis",
+            "artesianWellCapPresent": "nee",
+            "sedimentSumpPresent": "nee",
+            "numberOfGeoOhmCables": 0,
+            "tubeTopDiameter": 63,
+            "variableDiameter": "nee",
+            "tubeStatus": "inGebruik",
+            "tubeTopPosition": 0.5,
+            "tubeTopPositioningMethod": "ingemeten",
+            "materialUsed": {
+                "tubePackingMaterial": "zand",
+                "tubeMaterial": "pvc",
+                "glue": "geen",
+            },
+            "screen": {"screenLength": 2.0, "sockMaterial": "geen"},
+            "plainTubePart": {"plainTubePartLength": 1.0},
+        }
+    ],
+}
+
+
+def _construction(tubes):
+    data = copy.deepcopy(CONSTRUCTION)
+    tube = data["monitoringTubes"][0]
+    data["monitoringTubes"] = [
+        dict(copy.deepcopy(tube), tubeNumber=number + 1) for number in range(tubes)
+    ]
+    data["numberOfMonitoringTubes"] = tubes
+    return data
+
+
+def test_normalized_payload_is_not_copied_again():
+    data = normalize_gmw_srcdocdata(_construction(2))
+
+    assert normalize_gmw_srcdocdata(data) is data
+    assert all(type(tube) is dict for tube in data["monitoringTubes"])
+
+
+def test_monitoring_tubes_are_coerced_once_per_source_document(monkeypatch):
+    calls = []
+    coerce = request_helpers.coerce_list_of_mapping_like
+
+    def _counting(values, context):
+        calls.append(context)
+        return coerce(values, context)
+
+    monkeypatch.setattr(request_helpers, "coerce_list_of_mapping_like", _counting)
+
+    sourcedocument = gen_gmw_construction(
+        _construction(25), ns_regreq_map_gmw1, codespace_map_gmw1, "GMW_Construction"
+    )
+
+    assert calls == ["monitoringTubes"]
+    assert len(sourcedocument.findall(".//{*}monitoringTube")) == 25
+
+
+def test_input_payload_is_left_untouched():
+    data = _construction(2)
+    original = copy.deepcopy(data)
+
+    gen_gmw_construction(
+        data, ns_regreq_map_gmw1, codespace_map_gmw1, "GMW_Construction"
+    )
+
+    assert data == original
+
+
+def test_constructables_accept_raw_payloads():
+    tubestatus = {
+        "eventDate": "2024-01-01",
+        "numberOfTubesChanged": 1,
+        "monitoringTubes": [
+            request_helpers.SourceDocData({"tubeNumber": 1, "tubeStatus": "inGebruik"})
+        ],
+    }
+
+    tube = gen_monitoringtube(
+        tubestatus, 0, ns_regreq_map_gmw1, codespace_map_gmw1, "GMW_TubeStatus"
+    )
+    sourcedocument = gen_gmw_tubestatus(
+        tubestatus, ns_regreq_map_gmw1, codespace_map_gmw1, "GMW_TubeStatus"
+    )
+
+    assert etree.QName(tube).localname == "monitoringTube"
+    assert sourcedocument.find(".//{*}tubeStatus").text == "inGebruik"
@@ -0,0 +1,154 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import bro_exchange
+import bro_exchange.broxml
+from bro_exchange.bhp.client import BronhouderportaalClient
+from bro_exchange.broxml.gld.requests import gld_registration_request
+from bro_exchange.broxml.gmn.requests import gmn_registration_request
+
+
+def _loaded_modules(code, modules):
+    """Modules of `modules` that are loaded after running `code` in a fresh
+    interpreter."""
+    script = (
+        f"{code}\n"
+        "import json, sys\n"
+        f"print(json.dumps([m for m in {modules!r} if m in sys.modules]))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    return json.loads(output)
+
+
+def test_importing_gmn_does_not_load_heavy_modules():
+    loaded = _loaded_modules(
+        "import bro_exchange.broxml.gmn",
+        [
+            "bro_exchange.broxml.gmn.requests",
+            "pandas",
+            "pytz",
+            "requests",
+            "bro_exchange.bhp",
+            "bro_exchange.broxml.gld",
+            "bro_exchange.broxml.gmw",
+        ],
+    )
+
+    assert loaded == ["bro_exchange.broxml.gmn.requests"]
+
+
+def test_importing_the_package_loads_no_submodules():
+    loaded = _loaded_modules(
+        "import bro_exchange",
+        ["bro_exchange.bhp", "bro_exchange.broxml", "bro_exchange.checks"],
+    )
+
+    assert loaded == []
+
+
+def test_lazy_names_match_submodules():
+    assert bro_exchange.gld_registration_request is gld_registration_request
+    assert bro_exchange.broxml.gmn_registration_request is gmn_registration_request
+    assert bro_exchange.BronhouderportaalClient is BronhouderportaalClient
+    assert bro_exchange.broxml.gmn is sys.modules["bro_exchange.broxml.gmn"]
+
+
+def test_star_import_exports_all_submodules():
+    namespace = {}
+    exec("from bro_exchange import *", namespace)
+
+    assert namespace["gmn_registration_request"] is gmn_registration_request
+    assert namespace["BronhouderportaalClient"] is BronhouderportaalClient
+    assert "check_missing_args" in namespace
+    assert "_lazy_star_imports" not in namespace
+
+
+def test_bhp_exports_only_its_public_api():
+    import bro_exchange.bhp
+
+    loaded = _loaded_modules(
+        "import bro_exchange.bhp",
+        ["http.server", "sqlite3", "bro_exchange.bhp.fakeportal"],
+    )
+
+    assert loaded == []
+    assert "DeliveryJournal" in bro_exchange.bhp.__all__
+    for name in ("json", "threading", "sqlite3", "FakeBronhouderportaal"):
+        assert not hasattr(bro_exchange.bhp, name)
+
+
+def test_importing_batch_does_not_load_the_connector_or_families():
+    loaded = _loaded_modules(
+        "import bro_exchange.broxml.batch",
+        ["requests", "bro_exchange.bhp", "bro_exchange.broxml.gmw.requests"],
+    )
+
+    assert loaded == []
+
+
+def test_importing_mappings_does_not_load_lxml():
+    assert _loaded_modules("import bro_exchange.broxml.mappings", ["lxml"]) == []
+
+
+def test_looking_up_a_name_loads_only_its_family():
+    loaded = _loaded_modules(
+        "from bro_exchange.broxml import gld_registration_request",
+        [
+            "requests",
+            "bro_exchange.bhp",
+            "bro_exchange.broxml.gld.requests",
+            "bro_exchange.broxml.gmn",
+            "bro_exchange.broxml.gmw",
+            "bro_exchange.broxml.frd",
+            "bro_exchange.broxml.batch",
+        ],
+    )
+
+    assert loaded == ["bro_exchange.broxml.gld.requests"]
+
+
+def test_looking_up_a_connector_name_loads_no_families():
+    loaded = _loaded_modules(
+        "import bro_exchange; bro_exchange.validate_request",
+        [
+            "bro_exchange.bhp.connector",
+            "bro_exchange.broxml.gld",
+            "bro_exchange.broxml.gmn",
+            "bro_exchange.broxml.gmw",
+            "bro_exchange.broxml.frd",
+        ],
+    )
+
+    assert loaded == ["bro_exchange.bhp.connector"]
+
+
+def test_lazy_name_maps_match_the_star_imports():
+    import bro_exchange.bhp
+    from bro_exchange.lazy import _name_index
+
+    for package, submodules in [
+        (bro_exchange.broxml, ["gld", "gmn", "gmw", "frd", "mappings", "batch", "xsd"]),
+        (bro_exchange, ["bhp", "broxml", "checks"]),
+    ]:
+        star_imported = {}
+        for submodule in submodules:
+            module = importlib.import_module(f"{package.__name__}.{submodule}")
+            namespace = {}
+            exec(f"from {module.__name__} import *", namespace)
+            star_imported.update(namespace)
+        for name, module in _name_index(package._LAZY_NAMES).items():
+            value = getattr(importlib.import_module(module), name)
+            assert value is star_imported[name], (package.__name__, name)
+
+    assert set(bro_exchange._LAZY_NAMES["bro_exchange.bhp"]) == set(
+        bro_exchange.bhp.__all__
+    )
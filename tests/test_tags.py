@@ -0,0 +1,59 @@
+from lxml import etree
+
+from bro_exchange.broxml.gld.constructables import gen_point
+from bro_exchange.broxml.mappings import codespace_map_gld1, ns_regreq_map_gld3
+from bro_exchange.broxml.tags import (
+    QualifiedNames,
+    _qualified_names,
+    qualified_names,
+)
+
+
+def test_qualified_names_are_cached_per_namespace_map():
+    names = qualified_names(ns_regreq_map_gld3)
+
+    assert names["wml2", "point"] == "{http://www.opengis.net/waterml/2.0}point"
+    assert names["wml2", "point"] is names["wml2", "point"]
+    assert qualified_names(dict(ns_regreq_map_gld3)) is names
+    assert qualified_names({**ns_regreq_map_gld3, "x": "urn:x"}) is not names
+
+
+def test_qualified_names_cache_is_bounded():
+    for number in range(1000):
+        qualified_names({"ns": f"urn:{number}"})
+
+    assert _qualified_names.cache_info().currsize <= 64
+
+
+def test_only_the_fragment_root_declares_the_namespaces():
+    names = QualifiedNames({"a": "urn:a", "b": "urn:b"})
+
+    root = names.element("a", "root")
+    names.subelement(root, "b", "child", {"key": "value"}).text = "text"
+
+    assert root.nsmap == {"a": "urn:a", "b": "urn:b"}
+    assert etree.tostring(root) == (
+        b'<a:root xmlns:a="urn:a" xmlns:b="urn:b">'
+        b'<b:child key="value">text</b:child></a:root>'
+    )
+
+
+def test_point_declares_namespaces_once():
+    record = {
+        "time": "2019-01-01T00:00:00+01:00",
+        "value": -4.5,
+        "metadata": {
+            "StatusQualityControl": "goedgekeurd",
+            "interpolationType": "Discontinuous",
+        },
+    }
+
+    point, _ = gen_point({}, record, ns_regreq_map_gld3, codespace_map_gld1, 0)
+    xml = etree.tostring(point)
+
+    assert xml.count(b"xmlns:wml2=") == 1
+    assert (
+        point.find(".//{*}interpolationType")
+        .get(qualified_names(ns_regreq_map_gld3)["xlink", "href"])
+        .endswith("/Discontinuous")
+    )
@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import pytest
+from lxml import etree
+
+from bro_exchange.broxml import xsd as xsd_module
+from bro_exchange.broxml.frd.requests import FRDClosureTool
+from bro_exchange.broxml.gld import requests as gld_requests_module
+
+MESSAGES_XSD = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    xmlns:brocom="http://www.broservices.nl/xsd/brocommon/3.0"
+    targetNamespace="http://www.broservices.nl/xsd/isgld/1.0"
+    elementFormDefault="qualified">
+  <xs:import namespace="http://www.broservices.nl/xsd/brocommon/3.0"
+      schemaLocation="https://schema.broservices.nl/xsd/brocommon/3.0/brocommon.xsd"/>
+  <xs:element name="registrationRequest">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element ref="brocom:requestReference"/>
+        <xs:any processContents="skip" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+BROCOMMON_XSD = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    targetNamespace="http://www.broservices.nl/xsd/brocommon/3.0">
+  <xs:element name="requestReference" type="xs:string"/>
+</xs:schema>
+"""
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "isgld" / "1.0").mkdir(parents=True)
+    (tmp_path / "isgld" / "1.0" / "isgld-messages.xsd").write_text(MESSAGES_XSD)
+    (tmp_path / "isfrd" / "1.0").mkdir(parents=True)
+    (tmp_path / "isfrd" / "1.0" / "isfrd-messages.xsd").write_text(
+        MESSAGES_XSD.replace("isgld", "isfrd")
+    )
+    (tmp_path / "brocommon" / "3.0").mkdir(parents=True)
+    (tmp_path / "brocommon" / "3.0" / "brocommon.xsd").write_text(BROCOMMON_XSD)
+    return tmp_path
+
+
+def _stub_source_document(*_args, **_kwargs):
+    source_document = etree.Element("sourceDocument")
+    etree.SubElement(source_document, "GLD_StartRegistration")
+    return source_document
+
+
+@pytest.fixture
+def request_object(monkeypatch):
+    monkeypatch.setattr(
+        gld_requests_module, "gen_gld_startregistration", _stub_source_document
+    )
+    request = gld_requests_module.gld_registration_request(
+        "GLD_StartRegistration",
+        requestReference="gld-1",
+        qualityRegime="IMBRO",
+        srcdocdata={},
+    )
+    request.generate()
+    return request
+
+
+def test_schema_url_follows_request_namespace():
+    assert (
+        xsd_module.schema_url("http://www.broservices.nl/xsd/isgmw/1.1")
+        == "https://schema.broservices.nl/xsd/isgmw/1.1/isgmw-messages.xsd"
+    )
+
+
+def test_generated_request_is_validated_offline(schema_dir, request_object):
+    validator = xsd_module.XsdValidator(schema_dir)
+
+    assert validator.validate(request_object) == {"status": "VALIDE", "errors": []}
+
+
+def test_generated_frd_request_is_validated_offline(schema_dir):
+    frd = FRDClosureTool(
+        metadata={"request_reference": "frd-1"},
+        srcdocdata={},
+        request_type="registration",
+    )
+    validator = xsd_module.XsdValidator(schema_dir)
+
+    with pytest.raises(Exception, match="isn't generated yet"):
+        validator.validate(frd)
+    frd.generate_xml_file()
+
+    assert validator.validate(frd) == {"status": "VALIDE", "errors": []}
+    # Objects that only keep their tree in `xml_tree`
+    tree_only = SimpleNamespace(xml_tree=frd.xml_tree)
+    assert validator.validate(tree_only) == {"status": "VALIDE", "errors": []}
+
+
+def test_invalid_request_reports_errors(schema_dir):
+    validator = xsd_module.XsdValidator(schema_dir)
+    request = b'<registrationRequest xmlns="http://www.broservices.nl/xsd/isgld/1.0"/>'
+
+    info = validator.validate(request)
+
+    assert info["status"] == "NIET_VALIDE"
+    assert "requestReference" in info["errors"][0]
+
+
+def test_schema_is_compiled_once_per_request_type(
+    monkeypatch, schema_dir, request_object
+):
+    compiled = []
+    schema_class = etree.XMLSchema
+
+    def _compile(document):
+        compiled.append(document)
+        return schema_class(document)
+
+    monkeypatch.setattr(xsd_module.etree, "XMLSchema", _compile)
+    monkeypatch.setattr(xsd_module, "_validators", {})
+
+    for _ in range(3):
+        xsd_module.validate_xsd(request_object, schema_dir)
+
+    assert len(compiled) == 1
+
+
+def test_missing_schema_is_reported(tmp_path, request_object):
+    with pytest.raises(Exception, match="isgld-messages.xsd not found"):
+        xsd_module.XsdValidator(tmp_path).validate(request_object)
+
+
+def test_schema_dir_is_required(monkeypatch):
+    monkeypatch.delenv(xsd_module.XSD_DIR_ENV, raising=False)
+
+    with pytest.raises(Exception, match="BRO_EXCHANGE_XSD_DIR"):
+        xsd_module.XsdValidator()